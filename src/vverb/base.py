@@ -1,21 +1,122 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from vverb._log import logger as _root_logger
+from vverb.cache import MISS, QueryCache
+from vverb.guard import PoolGuard
+from vverb.instrument import Instrumentation, current_span
+
+if TYPE_CHECKING:
+    import numpy
 
 log = _root_logger.getChild("adapters.base")
 
+# verbs that change a collection and therefore invalidate cached results
+_WRITE_VERBS = ("upsert", "delete", "delete_where", "import_collection")
+
+# instance verbs timed when an Instrumentation is attached (connect is
+# handled separately because it is a classmethod)
+_INSTRUMENTED_VERBS = (
+    "create_collection",
+    "upsert",
+    "query",
+    "query_many",
+    "delete",
+    "delete_where",
+    "hybrid_query",
+    "export_collection",
+    "import_collection",
+)
+
+# set while a cached query runs, so super().query() chains look up only once
+_IN_CACHED_QUERY: ContextVar[bool] = ContextVar("vverb_in_cached_query", default=False)
+
 
 class BaseAdapter(ABC):
-    """All concrete adapters subclass this. Five verbs only."""
+    """
+    All concrete adapters subclass this. Five verbs only.
+
+    Vectors may be passed as lists or as float ``ndarray``s (any object
+    exposing the buffer protocol); adapters must not require callers to
+    convert arrays to Python lists.
+
+    Result caching is layered on top of every subclass: when
+    ``query_cache`` holds a :class:`~vverb.cache.QueryCache`, ``query`` is
+    answered from it where possible and ``upsert``/``delete`` (and
+    ``delete_where`` where implemented) invalidate the collection they
+    write to. Adapter-specific write paths call
+    ``_invalidate_cache(name)`` themselves.
+
+    Instrumentation is layered the same way: pass
+    ``instrumentation=Instrumentation()`` to ``connect`` (or assign the
+    attribute later) and every verb is timed; ``stats()`` returns the
+    summary. See :mod:`vverb.instrument`.
+
+    Overload protection sits innermost: with ``guard`` set to a
+    :class:`~vverb.guard.PoolGuard`, verbs that reach the backend are
+    admitted by its concurrency limit and circuit breaker and retried on
+    transient errors. See :mod:`vverb.guard`.
+    """
+
+    query_cache: QueryCache | None = None
+    instrumentation: Instrumentation | None = None
+    guard: PoolGuard | None = None
+
+    def __init_subclass__(cls, **kw: Any):
+        super().__init_subclass__(**kw)
+        own = vars(cls)  # live view: later lookups see earlier wrapping
+        for verb in _INSTRUMENTED_VERBS:
+            if verb in own:
+                setattr(cls, verb, _guarded(verb, own[verb]))
+        if "query" in own:
+            cls.query = _cached_query(own["query"])  # type: ignore[method-assign]
+        for verb in _WRITE_VERBS:
+            if verb in own:
+                setattr(cls, verb, _invalidating(own[verb]))
+        for verb in _INSTRUMENTED_VERBS:
+            if verb in own:
+                setattr(cls, verb, _instrumented(verb, own[verb]))
+        if "connect" in own:
+            cls.connect = _instrumented_connect(own["connect"])  # type: ignore[method-assign]
+
+    def stats(self) -> dict[str, Any]:
+        """Verb statistics (when instrumented) and result-cache counters."""
+        out: dict[str, Any] = {
+            "verbs": self.instrumentation.snapshot() if self.instrumentation else {}
+        }
+        if self.query_cache is not None:
+            out["cache"] = self.query_cache.stats()
+        if self.guard is not None:
+            out["guard"] = self.guard.stats()
+        return out
+
+    def _invalidate_cache(self, name: str) -> None:
+        """Drop cached results of *name* after writing to it."""
+        if self.query_cache is not None:
+            self.query_cache.invalidate(name)
 
     # ───────── connection ─────────
     @classmethod
     @abstractmethod
     async def connect(cls, **cfg: Any) -> "BaseAdapter": ...
 
+    @classmethod
+    async def from_url(cls, url: str, **cfg: Any) -> "BaseAdapter":
+        """
+        Connect from a ``<scheme>://…`` URL (see :func:`vverb.connect`).
+
+        The default passes it on as ``connect(url=url, **cfg)``; adapters
+        translate it into their own connection settings.
+        """
+        return await cls.connect(url=url, **cfg)
+
     async def __aenter__(self):
         return self
 
@@ -35,7 +136,7 @@ class BaseAdapter(ABC):
         self,
         name: str,
         ids: list[str],
-        vectors: list[list[float]],
+        vectors: Sequence[Sequence[float]] | numpy.ndarray,
         metadata: list[dict[str, Any]] | None = None,
         *,
         if_exists: str = "update",
@@ -45,17 +146,204 @@ class BaseAdapter(ABC):
     async def query(
         self,
         name: str,
-        vector: list[float],
+        vector: Sequence[float] | numpy.ndarray,
         k: int,
         filter: dict[str, Any] | None = None,
         *,
         search_params: dict[str, Any] | None = None,
         compat: str = "strict",
-    ) -> list[dict[str, Any]]: ...
+        as_numpy: bool = False,
+    ) -> Any:
+        """Hits as ``list[dict]``, or column-wise ndarrays when ``as_numpy``."""
+
+    async def query_many(
+        self,
+        name: str,
+        vectors: Sequence[Sequence[float]] | numpy.ndarray,
+        k: int,
+        filter: dict[str, Any] | None = None,
+        *,
+        search_params: dict[str, Any] | None = None,
+        as_numpy: bool = False,
+    ) -> list[Any]:
+        """
+        One ``query`` per vector, results in input order.
+
+        This fallback issues the searches one by one; adapters whose engine
+        can batch them into a single round trip should override it.
+        """
+        return [
+            await self.query(
+                name, vector, k, filter, search_params=search_params, as_numpy=as_numpy
+            )
+            for vector in vectors
+        ]
 
     @abstractmethod
     async def delete(self, name: str, ids: list[str]): ...
 
+    # ───────── dumps ─────────────
+    async def export_collection(self, name: str, path: str | os.PathLike[str]) -> dict[str, Any]:
+        """Write collection *name* to the dump directory *path* (see :mod:`vverb.transfer`)."""
+        raise NotImplementedError(f"{type(self).__name__} cannot export collections")
+
+    async def import_collection(
+        self,
+        name: str,
+        path: str | os.PathLike[str],
+        *,
+        batch_size: int | None = None,
+        if_exists: str = "update",
+    ) -> dict[str, Any]:
+        """
+        Load the dump in *path* into collection *name*, created from the
+        dump's schema when missing, one ``upsert`` per *batch_size* rows
+        (default ``capabilities()["max_batch"]``).
+
+        Returns ``{"rows", "batches", "elapsed", "rows_per_sec"}``.
+        """
+        from .transfer import read_batches, read_manifest
+
+        schema, _ = read_manifest(path)
+        await self.create_collection(schema=dataclasses.replace(schema, table=name))
+        step = int(batch_size or self.capabilities().get("max_batch") or 10_000)
+        started = time.perf_counter()
+        stats: dict[str, Any] = {"rows": 0, "batches": 0}
+        for ids, vectors, metadata in read_batches(path, step):
+            await self.upsert(name, ids, vectors, metadata, if_exists=if_exists)
+            stats["rows"] += len(ids)
+            stats["batches"] += 1
+        stats["elapsed"] = time.perf_counter() - started
+        stats["rows_per_sec"] = stats["rows"] / stats["elapsed"] if stats["elapsed"] else 0.0
+        return stats
+
     # ───────── capability probe ──
     @abstractmethod
     def capabilities(self) -> dict[str, Any]: ...
+
+
+# ---------------------------------------------------------------------------
+# verb wrappers installed by BaseAdapter.__init_subclass__
+# ---------------------------------------------------------------------------
+def _cached_query(fn: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    async def query(self, name, vector, k, filter=None, **kw):
+        cache = self.query_cache
+        if cache is None or _IN_CACHED_QUERY.get():
+            return await fn(self, name, vector, k, filter, **kw)
+
+        # lazy results fill their hits in place on load(): every caller gets
+        # its own copy, and the cached one stays as it was measured
+        lazy = kw.get("lazy", False)
+        key = cache.key(name, vector, k, filter, kw)
+        hit = cache.get(key)
+        if hit is not MISS:
+            return hit.copy() if lazy else hit
+        generation = cache.generation(name)
+        token = _IN_CACHED_QUERY.set(True)
+        try:
+            result = await fn(self, name, vector, k, filter, **kw)
+        finally:
+            _IN_CACHED_QUERY.reset(token)
+        cache.put(key, result.copy() if lazy else result, generation=generation)
+        return result
+
+    return query
+
+
+def _guarded(verb: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    async def wrapper(self, *args: Any, **kw: Any) -> Any:
+        guard = self.guard
+        if guard is None:
+            return await fn(self, *args, **kw)
+        return await guard.run(verb, lambda: fn(self, *args, **kw))
+
+    return wrapper
+
+
+def _invalidating(fn: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    async def verb(self, name, *args, **kw):
+        # before: in-flight queries must not cache what they read mid-write;
+        # after: drop whatever was cached while the write ran
+        self._invalidate_cache(name)
+        try:
+            return await fn(self, name, *args, **kw)
+        finally:
+            self._invalidate_cache(name)
+
+    return verb
+
+
+def _instrumented(verb: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    async def wrapper(self, *args: Any, **kw: Any) -> Any:
+        inst = self.instrumentation
+        if inst is None or current_span() is not None:  # off, or nested verb
+            return await fn(self, *args, **kw)
+
+        span, token = inst.start(verb, _collection_name(args, kw))
+        started = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            result = await fn(self, *args, **kw)
+            if span.rows is None:
+                span.rows = _row_count(verb, args, kw, result)
+            return result
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            inst.finish(span, token, time.perf_counter() - started, error)
+
+    return wrapper
+
+
+def _instrumented_connect(method: Any) -> Any:
+    fn = method.__func__
+
+    @functools.wraps(fn)
+    async def connect(
+        cls, *args: Any, instrumentation: Instrumentation | None = None, **kw: Any
+    ) -> Any:
+        if instrumentation is None:
+            return await fn(cls, *args, **kw)
+
+        span, token = instrumentation.start("connect")
+        started = time.perf_counter()
+        error: BaseException | None = None
+        try:
+            adapter = await fn(cls, *args, **kw)
+            adapter.instrumentation = instrumentation
+            return adapter
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            instrumentation.finish(span, token, time.perf_counter() - started, error)
+
+    return classmethod(connect)
+
+
+def _collection_name(args: tuple, kw: dict[str, Any]) -> str | None:
+    target = args[0] if args else kw.get("name", kw.get("schema"))
+    if isinstance(target, str):
+        return target
+    return getattr(target, "table", None)
+
+
+def _row_count(verb: str, args: tuple, kw: dict[str, Any], result: Any) -> int:
+    """Best-effort rows per call when the adapter did not report them."""
+    if verb in ("delete", "delete_where") and isinstance(result, int):
+        return result
+    if verb in ("upsert", "delete"):
+        ids = args[1] if len(args) > 1 else kw.get("ids")
+        return len(ids) if ids is not None else 0
+    if verb in ("export_collection", "import_collection") and isinstance(result, dict):
+        return int(result.get("rows", 0))
+    if verb == "query" and isinstance(result, list):
+        return len(result)
+    if verb == "query_many" and isinstance(result, list):
+        return sum(len(r) for r in result if isinstance(r, list))
+    return 0
@@ -0,0 +1,30 @@
+"""
+vverb.bench – recall-vs-throughput benchmarks for any adapter.
+
+Drives a ``BaseAdapter`` through the same workloads on a seeded synthetic
+dataset with exact (brute-force) ground truth:
+
+* bulk ingest (rows/s), then the index build where the adapter defers it;
+* single kNN calls at several ``k`` / ``search_params`` settings;
+* batched kNN through ``query_many``;
+* filtered kNN (one of ``categories`` values, ground truth filtered too);
+* mixed read/write load.
+
+Each reports QPS, p50/p95/p99 latency and recall@k as JSON. Against the
+docker pgvector setup in ``docker/test``:
+
+    docker compose -f docker/test/docker-compose.pgvector-test.yaml up -d
+    python -m vverb.bench --n 20000 --dim 128 --k 10 100 --ef-search 40 100 200
+
+From code:
+
+    from vverb.bench import BenchConfig, run_benchmark
+    report = await run_benchmark(db, BenchConfig(n=5_000, dim=64))
+
+Requires NumPy (``pip install vverb[numpy]``).
+"""
+
+from .data import Dataset, exact_knn, make_dataset
+from .suite import BenchConfig, run_benchmark
+
+__all__: list[str] = ["BenchConfig", "Dataset", "exact_knn", "make_dataset", "run_benchmark"]
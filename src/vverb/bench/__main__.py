@@ -0,0 +1,126 @@
+"""
+Command-line entry point: ``python -m vverb.bench [options]``.
+
+Connects to pgvector (by default the docker setup in ``docker/test``,
+overridable with ``--dsn`` or the ``PGV_*`` variables the test-suite
+uses), runs the suite and prints the JSON report. ``--url`` benchmarks
+any registered adapter instead, e.g. ``--url memory://``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Any
+
+from ..base import BaseAdapter
+from ..mapping import connect
+from ..util.schema import IndexSpec, IndexType, Metric
+from .suite import BenchConfig, run_benchmark
+
+
+def _default_dsn() -> str:
+    user = os.getenv("PGV_USER", "pgvector")
+    password = os.getenv("PGV_PASS", "pgvector")
+    host = os.getenv("PGV_HOST", "localhost")
+    port = os.getenv("PGV_PORT", "6263")
+    db = os.getenv("PGV_DB", "vverb")
+    return f"postgresql://{user}:{password}@{host}:{port}/{db}"
+
+
+def _parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m vverb.bench", description=__doc__)
+    target = p.add_mutually_exclusive_group()
+    target.add_argument("--dsn", default=_default_dsn(), help="pgvector DSN")
+    target.add_argument("--url", help="adapter URL for vverb.connect (e.g. memory://)")
+    p.add_argument("--n", type=int, default=10_000, help="base vectors")
+    p.add_argument("--dim", type=int, default=128)
+    p.add_argument("--queries", type=int, default=200)
+    p.add_argument("--metric", choices=["cosine", "l2", "ip"], default="cosine")
+    p.add_argument("--k", type=int, nargs="+", default=[10, 100])
+    p.add_argument("--index", choices=[t.value for t in IndexType], default="hnsw")
+    p.add_argument("--m", type=int, help="HNSW links per node")
+    p.add_argument("--ef-construction", type=int)
+    p.add_argument("--lists", type=int, help="IVFFlat lists")
+    p.add_argument("--ef-search", type=int, nargs="+", help="HNSW ef_search values to sweep")
+    p.add_argument("--probes", type=int, nargs="+", help="IVFFlat probes values to sweep")
+    p.add_argument("--concurrency", type=int, default=8)
+    p.add_argument("--batch-size", type=int, default=32, help="vectors per query_many call")
+    p.add_argument("--write-ratio", type=float, default=0.2)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--table", help="collection name (default derived from n/dim/metric)")
+    p.add_argument("--keep", action="store_true", help="leave the collection in place")
+    p.add_argument("--output", "-o", help="write the JSON report here instead of stdout")
+    return p
+
+
+def _config(args: argparse.Namespace) -> BenchConfig:
+    sweep: list[dict[str, Any]] = [{}]
+    if args.ef_search:
+        sweep = [{"ef_search": v} for v in args.ef_search]
+    elif args.probes:
+        sweep = [{"probes": v} for v in args.probes]
+    return BenchConfig(
+        n=args.n,
+        dim=args.dim,
+        queries=args.queries,
+        metric=Metric(args.metric),
+        ks=tuple(args.k),
+        search_params=sweep,
+        index=IndexSpec(
+            kind=IndexType(args.index),
+            m=args.m,
+            ef_construction=args.ef_construction,
+            lists=args.lists,
+        ),
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        write_ratio=args.write_ratio,
+        seed=args.seed,
+        table=args.table,
+    )
+
+
+async def _connect(args: argparse.Namespace, config: BenchConfig) -> BaseAdapter:
+    if args.url:
+        return await connect(args.url)
+    from ..pgvector import PgVectorAdapter
+
+    return await PgVectorAdapter.connect(
+        dsn=args.dsn, min_pool_size=1, max_pool_size=max(1, config.concurrency)
+    )
+
+
+async def _main(args: argparse.Namespace) -> dict[str, Any]:
+    config = _config(args)
+    db = await _connect(args, config)
+    try:
+        return await run_benchmark(db, config)
+    finally:
+        # also after a failed run: a half-loaded table would be reused next time
+        raw = getattr(db, "raw", None)  # no drop verb: only SQL adapters clean up
+        try:
+            if not args.keep and raw is not None:
+                async with raw() as con:
+                    await con.execute(f"DROP TABLE IF EXISTS {config.collection};")
+        finally:
+            await db.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    report = asyncio.run(_main(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
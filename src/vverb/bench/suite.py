@@ -0,0 +1,313 @@
+"""
+Adapter-agnostic workloads.
+
+Every workload only uses the ``BaseAdapter`` verbs, so the same run can be
+pointed at any engine and the JSON reports compared side by side.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+
+from vverb._log import logger as _root_logger
+
+from ..base import BaseAdapter
+from ..util.schema import FieldCol, FieldType, IndexSpec, Metric, TableSchema, VectorCol
+from .data import Dataset, exact_knn, make_dataset
+
+log = _root_logger.getChild("bench")
+
+__all__ = ["BenchConfig", "run_benchmark"]
+
+
+@dataclass(slots=True)
+class BenchConfig:
+    n: int = 10_000  # base vectors
+    dim: int = 128
+    queries: int = 200  # query vectors per workload
+    metric: Metric = Metric.COSINE
+    ks: tuple[int, ...] = (10, 100)
+    search_params: list[dict[str, Any]] = field(default_factory=lambda: [{}])
+    index: IndexSpec = field(default_factory=IndexSpec)
+    concurrency: int = 8  # in-flight calls for single/filtered/mixed workloads
+    batch_size: int = 32  # vectors per query_many call
+    ingest_batch: int = 5_000  # rows per upsert call
+    categories: int = 10  # distinct values of the filter column
+    write_ratio: float = 0.2  # share of upserts in the mixed workload
+    seed: int = 0
+    table: str | None = None  # default: vv_bench_<n>_<dim>_<metric>
+
+    @property
+    def collection(self) -> str:
+        """Name of the collection the run creates and loads."""
+        return self.table or f"vv_bench_{self.n}_{self.dim}_{self.metric.value}"
+
+
+async def run_benchmark(adapter: BaseAdapter, config: BenchConfig) -> dict[str, Any]:
+    """
+    Create a collection, load the dataset and run every workload.
+
+    Adapters with a ``build_index`` verb get the collection without its
+    index, bulk-loaded, then indexed (timed as ``index_build``), so the
+    index sees the whole dataset (IVFFlat trains its lists on it). Others
+    index while loading and report ``index_build`` as None.
+
+    Returns a JSON-serialisable report. The collection (``config.collection``)
+    is left in place; dropping it is up to the caller.
+    """
+    data = make_dataset(
+        config.n,
+        config.dim,
+        config.queries,
+        metric=config.metric,
+        n_categories=config.categories,
+        seed=config.seed,
+    )
+    name = config.collection
+    schema = TableSchema(
+        table=name,
+        vector=VectorCol("embedding", config.dim, config.metric, config.index),
+        fields=[FieldCol("category", FieldType.INT)],
+    )
+    build_index = getattr(adapter, "build_index", None)
+    if build_index is None:
+        await adapter.create_collection(schema=schema)
+    else:
+        create: Any = adapter.create_collection  # defer_index: not a BaseAdapter keyword
+        await create(schema=schema, defer_index=True)
+    ingest = await _ingest(adapter, name, data, config.ingest_batch)
+    index_build = None
+    if build_index is not None:
+        started = time.perf_counter()
+        await build_index(name)
+        index_build = {"seconds": time.perf_counter() - started}
+
+    report: dict[str, Any] = {
+        "adapter": type(adapter).__name__,
+        "config": {
+            "n": config.n,
+            "dim": config.dim,
+            "queries": config.queries,
+            "metric": config.metric.value,
+            "index": {k: getattr(config.index, k) for k in config.index.__slots__},
+            "concurrency": config.concurrency,
+            "batch_size": config.batch_size,
+            "seed": config.seed,
+            "table": name,
+        },
+        "ingest": ingest,
+        "index_build": index_build,
+        "knn": [],
+        "knn_batched": [],
+        "filtered": [],
+    }
+
+    truth = {k: exact_knn(data.vectors, data.queries, k, data.metric) for k in config.ks}
+    can_filter = bool(adapter.capabilities().get("filter"))
+    for k in config.ks:
+        for params in config.search_params:
+            report["knn"].append(await _knn(adapter, name, data, k, params, truth[k], config))
+            report["knn_batched"].append(
+                await _knn_batched(adapter, name, data, k, params, truth[k], config)
+            )
+            if can_filter:
+                report["filtered"].append(await _filtered(adapter, name, data, k, params, config))
+
+    k = config.ks[0]
+    report["mixed"] = await _mixed(
+        adapter, name, data, k, config.search_params[0], truth[k], config
+    )
+    return report
+
+
+# ---------------------------------------------------------------------------
+# workloads
+# ---------------------------------------------------------------------------
+async def _ingest(adapter: BaseAdapter, name: str, data: Dataset, batch: int) -> dict[str, Any]:
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for lo in range(0, len(data.ids), batch):
+        t0 = time.perf_counter()
+        await adapter.upsert(
+            name,
+            data.ids[lo : lo + batch],
+            data.vectors[lo : lo + batch],
+            _metadata(data, lo, lo + batch),
+        )
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+    return {
+        "rows": len(data.ids),
+        "seconds": elapsed,
+        "rows_per_sec": len(data.ids) / elapsed if elapsed else 0.0,
+        "batch_latency": _latency(latencies),
+    }
+
+
+async def _knn(adapter, name, data, k, params, truth, config) -> dict[str, Any]:
+    found: list[Any] = [None] * len(data.queries)
+
+    async def one(i: int) -> None:
+        found[i] = await adapter.query(name, data.queries[i], k, **_params(params))
+
+    latencies, elapsed = await _drive(one, len(data.queries), config.concurrency)
+    return _summary(k, params, latencies, elapsed, len(data.queries), _recall(found, truth))
+
+
+async def _knn_batched(adapter, name, data, k, params, truth, config) -> dict[str, Any]:
+    step = config.batch_size
+    found: list[Any] = []
+    latencies: list[float] = []
+    started = time.perf_counter()
+    for lo in range(0, len(data.queries), step):
+        t0 = time.perf_counter()
+        found.extend(
+            await adapter.query_many(name, data.queries[lo : lo + step], k, **_params(params))
+        )
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+    result = _summary(k, params, latencies, elapsed, len(data.queries), _recall(found, truth))
+    result["batch_size"] = step
+    return result
+
+
+async def _filtered(adapter, name, data, k, params, config) -> dict[str, Any]:
+    """Each query asks for one category; ground truth is the filtered exact kNN."""
+    cats = np.arange(len(data.queries)) % config.categories
+    truth: list[Any] = [None] * len(data.queries)
+    for c in range(config.categories):
+        rows = np.flatnonzero(cats == c)
+        if len(rows):
+            mask = data.categories == c
+            for i, t in zip(
+                rows,
+                exact_knn(data.vectors, data.queries[rows], k, data.metric, mask=mask),
+                strict=True,
+            ):
+                truth[i] = t
+    found: list[Any] = [None] * len(data.queries)
+
+    async def one(i: int) -> None:
+        found[i] = await adapter.query(
+            name, data.queries[i], k, {"category": int(cats[i])}, **_params(params)
+        )
+
+    latencies, elapsed = await _drive(one, len(data.queries), config.concurrency)
+    result = _summary(k, params, latencies, elapsed, len(data.queries), _recall(found, truth))
+    result["selectivity"] = 1 / config.categories
+    return result
+
+
+async def _mixed(adapter, name, data, k, params, truth, config) -> dict[str, Any]:
+    """
+    Queries interleaved with single-row upserts.
+
+    Writes re-upsert existing rows with their original vectors, so the
+    ground truth stays valid while the engine still pays for the write.
+    """
+    rng = np.random.default_rng(config.seed + 1)
+    total = len(data.queries)
+    is_write = rng.random(total) < config.write_ratio
+    rows = rng.integers(0, len(data.ids), size=total)
+    found: dict[int, Any] = {}
+    reads: list[float] = []
+    writes: list[float] = []
+
+    async def one(i: int) -> None:
+        t0 = time.perf_counter()
+        if is_write[i]:
+            r = int(rows[i])
+            await adapter.upsert(
+                name, [data.ids[r]], data.vectors[r : r + 1], _metadata(data, r, r + 1)
+            )
+            writes.append(time.perf_counter() - t0)
+        else:
+            found[i] = await adapter.query(name, data.queries[i], k, **_params(params))
+            reads.append(time.perf_counter() - t0)
+
+    _, elapsed = await _drive(one, total, config.concurrency)
+    order = sorted(found)
+    return {
+        "k": k,
+        "search_params": params,
+        "write_ratio": config.write_ratio,
+        "ops": total,
+        "seconds": elapsed,
+        "ops_per_sec": total / elapsed if elapsed else 0.0,
+        "read_latency": _latency(reads),
+        "write_latency": _latency(writes),
+        "recall": _recall([found[i] for i in order], [truth[i] for i in order]),
+    }
+
+
+# ---------------------------------------------------------------------------
+# helpers
+# ---------------------------------------------------------------------------
+async def _drive(
+    call: Callable[[int], Awaitable[None]], total: int, concurrency: int
+) -> tuple[list[float], float]:
+    """Run ``call(0..total-1)`` with *concurrency* workers; per-call latencies."""
+    latencies: list[float] = []
+    todo = iter(range(total))
+
+    async def worker() -> None:
+        for i in todo:
+            t0 = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - t0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return latencies, time.perf_counter() - started
+
+
+def _metadata(data: Dataset, lo: int, hi: int) -> list[dict[str, Any]]:
+    return [{"category": int(c)} for c in data.categories[lo:hi]]
+
+
+def _params(params: dict[str, Any]) -> dict[str, Any]:
+    """Only pass ``search_params`` when set, so minimal adapters work too."""
+    return {"search_params": params} if params else {}
+
+
+def _recall(found: list[Any], truth: Any) -> float:
+    """Mean recall@k of hit lists against ground-truth row indices."""
+    total = 0.0
+    for hits, expected in zip(found, truth, strict=True):
+        if not len(expected):
+            total += 1.0
+            continue
+        got = {int(h["id"][1:]) for h in hits}
+        total += len(got.intersection(int(e) for e in expected)) / len(expected)
+    return total / len(found) if found else 0.0
+
+
+def _latency(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    arr = np.asarray(samples)
+    p50, p95, p99 = np.percentile(arr, [50, 95, 99])
+    return {
+        "mean": float(arr.mean()),
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "max": float(arr.max()),
+    }
+
+
+def _summary(k, params, latencies, elapsed, queries, recall) -> dict[str, Any]:
+    return {
+        "k": k,
+        "search_params": params,
+        "queries": queries,
+        "seconds": elapsed,
+        "qps": queries / elapsed if elapsed else 0.0,
+        "latency": _latency(latencies),
+        "recall": recall,
+    }
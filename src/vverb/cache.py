@@ -0,0 +1,191 @@
+"""
+Client-side kNN result cache shared by every adapter.
+
+Attach one to an adapter and repeated searches (same collection, vector,
+k, filter and search_params) are answered from memory:
+
+    from vverb.cache import QueryCache
+    db.query_cache = QueryCache(max_bytes=64 << 20, ttl=30)
+
+* bounded by estimated result size (and optionally entry count), evicting
+  the least recently used entries first;
+* every entry expires *ttl* seconds after it was stored;
+* ``upsert``/``delete``/``delete_where`` through the same adapter drop all
+  entries of the collection they touch (other writers are only covered by the TTL);
+* ``stats()`` exposes hit/miss/eviction counters for sizing.
+
+Cached results are shared between callers – treat them as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import time
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable
+
+from vverb._log import logger as _root_logger
+
+log = _root_logger.getChild("cache")
+
+__all__ = ["MISS", "QueryCache"]
+
+MISS = object()  # returned by QueryCache.get() when nothing usable is cached
+
+
+@dataclass(slots=True)
+class _Entry:
+    name: str
+    value: Any
+    size: int
+    expires: float
+
+
+class QueryCache:
+    """LRU + TTL cache of query results, invalidated per collection."""
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 64 << 20,
+        max_entries: int | None = None,
+        ttl: float = 60.0,
+    ):
+        self.max_bytes = int(max_bytes)
+        self.max_entries = max_entries
+        self.ttl = float(ttl)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._keys_by_name: dict[str, set[Hashable]] = {}
+        self._generation: dict[str, int] = {}
+        self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # keys
+    # ------------------------------------------------------------------
+    @staticmethod
+    def key(
+        name: str,
+        vector: Any,
+        k: int,
+        filter: dict[str, Any] | None,
+        params: dict[str, Any] | None = None,
+    ) -> Hashable:
+        """Cache key: collection, vector digest, k, filter and call options."""
+        digest = hashlib.blake2b(_vector_bytes(vector), digest_size=16).digest()
+        return (name, digest, int(k), _canonical(filter), _canonical(params))
+
+    def generation(self, name: str) -> int:
+        """Write counter of *name*; a result computed across a bump is stale."""
+        return self._generation.get(name, 0)
+
+    # ------------------------------------------------------------------
+    # lookups
+    # ------------------------------------------------------------------
+    def get(self, key: Hashable) -> Any:
+        """Cached value for *key*, or ``MISS``."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISS
+        if entry.expires <= time.monotonic():
+            self._drop(key)
+            self.misses += 1
+            return MISS
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key: Hashable, value: Any, *, generation: int | None = None) -> None:
+        """
+        Store *value*; skipped when *generation* shows a write happened
+        since the lookup that produced it.
+        """
+        name = key[0]  # type: ignore[index]
+        if generation is not None and generation != self.generation(name):
+            return
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = _Entry(name, value, size, time.monotonic() + self.ttl)
+        self._keys_by_name.setdefault(name, set()).add(key)
+        self._bytes += size
+        while self._bytes > self.max_bytes or (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ):
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # invalidation
+    # ------------------------------------------------------------------
+    def invalidate(self, name: str) -> None:
+        """Forget every result of collection *name*."""
+        self._generation[name] = self.generation(name) + 1
+        for key in self._keys_by_name.pop(name, ()):
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+
+    def clear(self) -> None:
+        for name in list(self._keys_by_name):
+            self.invalidate(name)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        keys = self._keys_by_name.get(entry.name)
+        if keys is not None:
+            keys.discard(key)
+
+
+def _vector_bytes(vector: Any) -> bytes:
+    """float32 bytes of *vector* (buffer protocol first, then sequences)."""
+    try:
+        view = memoryview(vector)
+    except TypeError:
+        return array("f", vector).tobytes()
+    if view.format == "f" and view.c_contiguous:
+        return view.tobytes()
+    return array("f", view.tolist()).tobytes()
+
+
+def _canonical(value: Any) -> str | None:
+    if not value:
+        return None
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _sizeof(value: Any) -> int:
+    """Rough size of a query result (lists of dicts, or dicts of columns)."""
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_sizeof(v) for v in value)
+    return sys.getsizeof(value)
@@ -1,2 +1,28 @@
-class UnsupportedFeatureError:
-    pass
+from typing import Any
+
+
+class UnsupportedFeatureError(Exception):
+    """Raised when an adapter cannot honour a requested feature."""
+
+
+class VectorIndexNotUsedError(Exception):
+    """
+    Raised in strict index mode when a search's plan scans no vector index;
+    ``plan`` holds the plan summary (see ``PgVectorAdapter.explain_query``).
+    """
+
+    def __init__(self, message: str, plan: dict[str, Any]):
+        super().__init__(message)
+        self.plan = plan
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised without contacting the backend while the adapter's circuit
+    breaker is open (see :mod:`vverb.guard`); ``retry_after`` is the
+    number of seconds until a probe call is let through.
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
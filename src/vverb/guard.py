@@ -0,0 +1,296 @@
+"""
+Overload protection shared by every adapter: an adaptive concurrency
+limit, jittered retries of transient errors and a circuit breaker.
+
+    db = await PgVectorAdapter.connect(
+        dsn=..., concurrency_limit=32, retries=2, breaker_threshold=5
+    )
+    db.stats()["guard"]
+
+Attach a :class:`PoolGuard` (``connect`` builds one from those arguments,
+or assign ``adapter.guard``) and every verb call passes through it:
+
+* :class:`AdaptiveLimiter` admits at most ``limit`` calls at once; the
+  rest queue in arrival order instead of piling up on the connection
+  pool. The limit grows by about one per ``limit`` calls that complete
+  in normal time and is halved (at most once per round trip) when a call
+  takes more than *tolerance* × that verb's usual latency or fails with a
+  transient error (AIMD, as TCP congestion control).
+* Transient errors (the adapter's list: dropped connections, deadlocks,
+  serialization failures, too many connections) are retried up to
+  *retries* times after a random delay in ``[0, backoff · 2^attempt]``
+  ("full jitter"), capped at *max_backoff*. Writes are retried as well:
+  the verbs are idempotent except ``upsert(if_exists="error")``, which
+  may report a row written by the failed attempt.
+* :class:`CircuitBreaker` opens after *threshold* consecutive transient
+  failures. While open, calls fail at once with
+  :class:`~vverb.exceptions.CircuitOpenError`. After *reset_timeout*
+  seconds a single probe call is let through; its success closes the
+  circuit, its failure re-opens it.
+
+Nested verbs (an ``import_collection`` running ``upsert``) pass through
+the guard once, at the outermost call. Cache hits never reach it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, TypeVar
+
+from vverb._log import logger as _root_logger
+
+from .exceptions import CircuitOpenError
+
+log = _root_logger.getChild("guard")
+
+__all__ = ["AdaptiveLimiter", "CircuitBreaker", "PoolGuard"]
+
+T = TypeVar("T")
+
+# weight of a new sample in a verb's latency baseline (exponential moving average)
+_BASELINE_ALPHA = 0.05
+
+# set while a guarded verb runs, so nested verbs are not limited twice
+_IN_GUARDED_VERB: ContextVar[bool] = ContextVar("vverb_in_guarded_verb", default=False)
+
+
+class AdaptiveLimiter:
+    """AIMD limit on concurrent calls, between *min_limit* and *max_limit*."""
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        min_limit: int = 1,
+        initial: int | None = None,
+        tolerance: float = 2.0,
+        backoff: float = 0.5,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("concurrency limits need 1 <= min_limit <= max_limit")
+        if tolerance <= 1.0 or not 0.0 < backoff < 1.0:
+            raise ValueError("tolerance must be > 1 and backoff within (0, 1)")
+        self.min_limit = int(min_limit)
+        self.max_limit = int(max_limit)
+        self.limit = float(min(max(initial or max_limit, min_limit), max_limit))
+        self.tolerance = float(tolerance)
+        self.backoff = float(backoff)
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._baseline: dict[str, float] = {}  # verb → usual latency (EWMA)
+        self._last_decrease = 0.0
+        self._stats = {"decreases": 0, "queued": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            await waiter  # the releasing call hands its slot over
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():  # handed over, then cancelled
+                self.in_flight -= 1
+                self._wake()
+            raise
+        waited = time.perf_counter() - started
+        self._stats["queued"] += 1
+        self._stats["wait_total"] += waited
+        self._stats["wait_max"] = max(self._stats["wait_max"], waited)
+
+    def release(self, verb: str, latency: float, overloaded: bool = False) -> None:
+        """Free a slot and adapt the limit to the call's *latency*."""
+        self.in_flight -= 1
+        base = self._baseline.get(verb)
+        if base is None:
+            self._baseline[verb] = latency
+        else:
+            self._baseline[verb] = base + _BASELINE_ALPHA * (latency - base)
+            if overloaded or latency > self.tolerance * base:
+                self._decrease(latency)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": sum(not w.done() for w in self._waiters),
+            **self._stats,
+        }
+
+    def _decrease(self, latency: float) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < latency:  # calls of the same round trip
+            return
+        self._last_decrease = now
+        limit = max(float(self.min_limit), self.limit * self.backoff)
+        if int(limit) < int(self.limit):
+            log.info("concurrency limit %d → %d", int(self.limit), int(limit))
+        self.limit = limit
+        self._stats["decreases"] += 1
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():  # skip callers that gave up
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class CircuitBreaker:
+    """Fails calls fast after *threshold* consecutive failures, for *reset_timeout* seconds."""
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 5.0):
+        if threshold < 1 or reset_timeout <= 0:
+            raise ValueError("breaker threshold must be >= 1 and reset_timeout > 0")
+        self.threshold = int(threshold)
+        self.reset_timeout = float(reset_timeout)
+        self.state = "closed"  # "closed" → "open" → "half_open" → "closed" | "open"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._stats = {"opened": 0, "rejected": 0}
+
+    def before(self) -> bool:
+        """Admit a call or raise CircuitOpenError; True when the call is the probe."""
+        if self.state == "closed":
+            return False
+        if self.state == "open":
+            remaining = self._opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0:
+                self._reject(remaining)
+            self.state = "half_open"
+        if self._probing:
+            self._reject(0.0)
+        self._probing = True
+        return True
+
+    def success(self, probe: bool) -> None:
+        if probe:
+            log.info("circuit closed: the backend answered again")
+            self.state = "closed"
+            self._probing = False
+        self.failures = 0
+
+    def failure(self, probe: bool) -> None:
+        self.failures += 1
+        if probe or (self.state == "closed" and self.failures >= self.threshold):
+            if self.state == "closed":
+                log.warning("circuit opened after %d consecutive failures", self.failures)
+            self.state = "open"
+            self._opened_at = time.monotonic()
+            self._probing = False
+            self._stats["opened"] += 1
+
+    def abandon(self, probe: bool) -> None:
+        """The call ended without telling anything about the backend (cancelled)."""
+        if probe:
+            self._probing = False
+
+    def stats(self) -> dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, **self._stats}
+
+    def _reject(self, retry_after: float) -> None:
+        self._stats["rejected"] += 1
+        raise CircuitOpenError(
+            f"Backend unavailable (circuit {self.state.replace('_', '-')}); "
+            f"retry in {retry_after:.1f}s",
+            retry_after,
+        )
+
+
+class PoolGuard:
+    """Runs verb calls through an optional limiter, retry policy and breaker."""
+
+    def __init__(
+        self,
+        *,
+        transient: tuple[type[BaseException], ...],
+        limiter: AdaptiveLimiter | None = None,
+        retries: int = 0,
+        backoff: float = 0.05,
+        max_backoff: float = 2.0,
+        breaker: CircuitBreaker | None = None,
+    ):
+        if retries < 0 or backoff < 0:
+            raise ValueError("retries and retry backoff must be >= 0")
+        self.transient = transient
+        self.limiter = limiter
+        self.retries = int(retries)
+        self.backoff = float(backoff)
+        self.max_backoff = float(max_backoff)
+        self.breaker = breaker
+        self._stats = {"retries": 0, "gave_up": 0}
+
+    async def run(self, verb: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Await ``call()``, retrying it on transient errors."""
+        if _IN_GUARDED_VERB.get():
+            return await call()
+        token = _IN_GUARDED_VERB.set(True)
+        try:
+            attempt = 0
+            while True:
+                try:
+                    return await self._attempt(verb, call)
+                except self.transient as exc:
+                    if attempt >= self.retries or (
+                        self.breaker is not None and self.breaker.state == "open"
+                    ):
+                        self._stats["gave_up"] += 1
+                        raise
+                    delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+                    attempt += 1
+                    self._stats["retries"] += 1
+                    log.warning("%s: retry %d in %.3fs after %r", verb, attempt, delay, exc)
+                    await asyncio.sleep(delay)
+        finally:
+            _IN_GUARDED_VERB.reset(token)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "limiter": self.limiter.stats() if self.limiter is not None else {},
+            "breaker": self.breaker.stats() if self.breaker is not None else {},
+        }
+
+    async def _attempt(self, verb: str, call: Callable[[], Awaitable[T]]) -> T:
+        probe = self.breaker.before() if self.breaker is not None else False
+        if self.limiter is not None:
+            try:
+                await self.limiter.acquire()
+            except BaseException:
+                if self.breaker is not None:
+                    self.breaker.abandon(probe)
+                raise
+        started = time.perf_counter()
+        overloaded = False
+        try:
+            result = await call()
+        except self.transient:
+            overloaded = True
+            if self.breaker is not None:
+                self.breaker.failure(probe)
+            raise
+        except Exception:  # the backend answered: bad input, constraint violation, …
+            if self.breaker is not None:
+                self.breaker.success(probe)
+            raise
+        except BaseException:
+            if self.breaker is not None:
+                self.breaker.abandon(probe)
+            raise
+        finally:
+            if self.limiter is not None:
+                self.limiter.release(verb, time.perf_counter() - started, overloaded)
+        if self.breaker is not None:
+            self.breaker.success(probe)
+        return result
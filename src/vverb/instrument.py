@@ -0,0 +1,184 @@
+"""
+Per-verb instrumentation shared by every adapter.
+
+Attach an :class:`Instrumentation` and each verb call is timed and
+summarised; detached (the default) the verbs run unwrapped apart from a
+single attribute check:
+
+    from vverb.instrument import Instrumentation
+    db = await PgVectorAdapter.connect(dsn=..., instrumentation=Instrumentation())
+    db.instrumentation.add_hook(lambda event: statsd.timing(event["verb"], event["seconds"]))
+    db.stats()
+
+Recorded per verb (``connect`` and every verb in
+``vverb.base._INSTRUMENTED_VERBS``: create_collection, upsert, query,
+query_many, delete, delete_where, hybrid_query, export_collection,
+import_collection): a latency histogram, calls, errors, rows and bytes.
+Adapters add detail to the running call through :func:`current_span` –
+time spent waiting for a pooled connection, time awaiting the database
+driver (``db``) and time spent encoding inputs / shaping results
+client-side (``codec``), each with its own histogram.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from vverb._log import logger as _root_logger
+
+log = _root_logger.getChild("instrument")
+
+__all__ = ["Histogram", "Instrumentation", "Span", "current_span"]
+
+# bucket upper bounds in seconds: 10µs · 2^i, up to ~3 minutes
+_BOUNDS: tuple[float, ...] = tuple(1e-5 * 2**i for i in range(25))
+
+Hook = Callable[[dict[str, Any]], None]
+
+
+class Histogram:
+    """Fixed log2-bucket latency histogram (seconds)."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BOUNDS) + 1)  # last bucket: overflow
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the *q*-th percentile (0–100)."""
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return min(_BOUNDS[i] if i < len(_BOUNDS) else self.max, self.max)
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+@dataclass(slots=True)
+class Span:
+    """Details of the verb call in progress, filled in by the adapter."""
+
+    verb: str
+    name: str | None = None
+    rows: int | None = None
+    nbytes: int = 0
+    db: float = 0.0
+    codec: float = 0.0
+    pool_wait: float = 0.0
+
+
+@dataclass(slots=True)
+class _VerbStats:
+    latency: Histogram = field(default_factory=Histogram)
+    db: Histogram = field(default_factory=Histogram)
+    codec: Histogram = field(default_factory=Histogram)
+    pool_wait: Histogram = field(default_factory=Histogram)
+    errors: int = 0
+    rows: int = 0
+    nbytes: int = 0
+
+
+_SPAN: ContextVar[Span | None] = ContextVar("vverb_span", default=None)
+
+
+def current_span() -> Span | None:
+    """The span of the instrumented verb running in this task, if any."""
+    return _SPAN.get()
+
+
+class Instrumentation:
+    """Collects verb statistics and forwards one event per call to hooks."""
+
+    def __init__(self, hooks: list[Hook] | None = None):
+        self.hooks: list[Hook] = list(hooks or [])
+        self.verbs: dict[str, _VerbStats] = {}
+
+    def add_hook(self, hook: Hook) -> None:
+        """Call *hook(event)* after every verb; *event* is a plain dict."""
+        self.hooks.append(hook)
+
+    def start(self, verb: str, name: str | None = None) -> tuple[Span, Any]:
+        span = Span(verb, name)
+        return span, _SPAN.set(span)
+
+    def finish(self, span: Span, token: Any, seconds: float, error: BaseException | None) -> None:
+        _SPAN.reset(token)
+        stats = self.verbs.get(span.verb)
+        if stats is None:
+            stats = self.verbs[span.verb] = _VerbStats()
+        stats.latency.observe(seconds)
+        stats.db.observe(span.db)
+        stats.codec.observe(span.codec)
+        stats.pool_wait.observe(span.pool_wait)
+        stats.rows += span.rows or 0
+        stats.nbytes += span.nbytes
+        if error is not None:
+            stats.errors += 1
+
+        if self.hooks:
+            event = {
+                "verb": span.verb,
+                "name": span.name,
+                "seconds": seconds,
+                "rows": span.rows or 0,
+                "bytes": span.nbytes,
+                "db": span.db,
+                "codec": span.codec,
+                "pool_wait": span.pool_wait,
+                "error": error,
+            }
+            for hook in self.hooks:
+                try:
+                    hook(event)
+                except Exception:  # a broken exporter must not break the verb
+                    log.exception("instrumentation hook %r failed", hook)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            verb: {
+                "calls": s.latency.count,
+                "errors": s.errors,
+                "rows": s.rows,
+                "bytes": s.nbytes,
+                "latency": s.latency.snapshot(),
+                "db": s.db.snapshot(),
+                "codec": s.codec.snapshot(),
+                "pool_wait": s.pool_wait.snapshot(),
+            }
+            for verb, s in self.verbs.items()
+        }
+
+    def reset(self) -> None:
+        self.verbs.clear()
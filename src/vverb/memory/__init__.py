@@ -0,0 +1,19 @@
+"""
+vverb.memory – public API surface for the in-process NumPy adapter.
+
+Exact brute-force search with no server to run; handy for unit tests,
+prototyping and as ground truth when measuring another engine's recall:
+
+    from vverb.memory import connect
+    db = await connect()
+
+Requires NumPy (``pip install vverb[numpy]``).
+"""
+
+from .core import MemoryAdapter
+
+# Convenience entry-point so callers can simply:
+#     from vverb.memory import connect
+connect = MemoryAdapter.connect
+
+__all__: list[str] = ["connect", "MemoryAdapter"]
@@ -0,0 +1,421 @@
+"""
+In-process NumPy adapter for vverb.
+
+Implements the five core verbs:
+    • connect  • create_collection  • upsert  • query  • delete
+plus ``delete_where``, collection dumps and capability negotiation,
+without any server: every collection is a contiguous float32 matrix
+searched by exact brute force. Results match
+what an exact scan on a real engine returns, which makes the adapter a
+zero-latency stand-in for tests and the ground truth for recall checks.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+
+from vverb._log import logger as _root_logger
+
+from ..base import BaseAdapter
+from ..cache import QueryCache
+from ..instrument import current_span
+from ..util.schema import FieldCol, FieldType, IndexType, Metric, Precision, TableSchema
+from .distance import distances, rescore, top_k
+from .filters import compile_filter
+
+if TYPE_CHECKING:
+    import numpy
+
+log = _root_logger.getChild("memory")
+
+__all__ = ["MemoryAdapter"]
+
+_IF_EXISTS = ("update", "skip", "error")
+_NORM_METRICS = (Metric.COSINE, Metric.L2, Metric.EUCLIDEAN)
+
+
+class _Collection:
+    """Rows of one collection; live rows occupy ``vectors[:size]``."""
+
+    def __init__(self, schema: TableSchema, capacity: int = 1024):
+        self.schema = schema
+        self.vectors = np.empty((capacity, schema.vector.dim), dtype=np.float32)
+        self.norms = np.empty(capacity, dtype=np.float32)  # ‖row‖, for L2 / cosine
+        self.size = 0
+        self.row_of: dict[str, int] = {}  # id → row
+        # column name → per-row values (the id column included, for filters)
+        self.columns: dict[str, list[Any]] = {schema.id_field: []}
+        for f in schema.fields:
+            self.columns[f.name] = []
+
+    @property
+    def ids(self) -> list[Any]:
+        return self.columns[self.schema.id_field]
+
+    def reserve(self, extra: int) -> None:
+        """Grow the matrix geometrically so appends stay amortised O(1)."""
+        need = self.size + extra
+        capacity = len(self.vectors)
+        if need <= capacity:
+            return
+        while capacity < need:
+            capacity *= 2
+        vectors = np.empty((capacity, self.vectors.shape[1]), dtype=np.float32)
+        vectors[: self.size] = self.vectors[: self.size]
+        norms = np.empty(capacity, dtype=np.float32)
+        norms[: self.size] = self.norms[: self.size]
+        self.vectors, self.norms = vectors, norms
+
+    def write(
+        self, row: int, vector: np.ndarray, meta: dict[str, Any] | None, fields: list[FieldCol]
+    ) -> None:
+        self.vectors[row] = vector
+        self.norms[row] = np.linalg.norm(vector)
+        if meta is None:
+            return
+        for f in fields:
+            self.columns[f.name][row] = _stored(f.ftype, meta.get(f.name))
+
+    def append(
+        self, id_: str, vector: np.ndarray, meta: dict[str, Any] | None, fields: list[FieldCol]
+    ) -> None:
+        row = self.size
+        self.size += 1
+        self.row_of[id_] = row
+        self.ids.append(id_)
+        for f in self.schema.fields:
+            self.columns[f.name].append(None)
+        self.write(row, vector, meta, fields)
+
+    def remove(self, id_: str) -> bool:
+        """Delete *id_* by moving the last row into its slot."""
+        row = self.row_of.pop(id_, None)
+        if row is None:
+            return False
+        last = self.size - 1
+        if row != last:
+            self.vectors[row] = self.vectors[last]
+            self.norms[row] = self.norms[last]
+            for values in self.columns.values():
+                values[row] = values[last]
+            self.row_of[self.ids[row]] = row
+        for values in self.columns.values():
+            values.pop()
+        self.size = last
+        return True
+
+
+class MemoryAdapter(BaseAdapter):
+    """
+    Concrete adapter keeping collections in process memory.
+
+    Parameters accepted by `connect`
+    --------------------------------
+    query_cache : QueryCache | None
+                               Client-side result cache (see vverb.cache)
+
+    Scores follow pgvector: distances where lower is closer (``ip`` is the
+    negative inner product). Every :class:`~vverb.util.schema.Metric` is
+    supported; binary metrics treat components > 0 as set bits. Vectors
+    are rounded to the column's ``precision`` on the way in (float16 for
+    HALF, 0/1 for BINARY) so scores match a server storing that type;
+    index settings, quantization included, are ignored.
+    JSON fields are kept as Python objects (text input is parsed) and
+    returned that way.
+    """
+
+    def __init__(self, **cfg: Any):
+        self.cfg = cfg
+        self._collections: dict[str, _Collection] = {}
+
+    @classmethod
+    async def connect(cls, *, query_cache: QueryCache | None = None, **cfg: Any) -> MemoryAdapter:
+        """Return a fresh, empty adapter (there is nothing to connect to)."""
+        adapter = cls(**cfg)
+        adapter.query_cache = query_cache
+        return adapter
+
+    @classmethod
+    async def from_url(cls, url: str, **cfg: Any) -> MemoryAdapter:
+        """``memory://`` – the rest of the URL is ignored."""
+        return await cls.connect(**cfg)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Drop every collection."""
+        self._collections.clear()
+
+    # ------------------------------------------------------------------
+    # create_collection
+    # ------------------------------------------------------------------
+    async def create_collection(
+        self, schema: TableSchema, *, skip_if_exists: bool = True, **kwargs: Any
+    ) -> None:
+        """
+        Register *schema*; index settings are accepted and ignored, and so
+        are ``schema.partition`` (ids stay unique per collection),
+        ``full_text`` (there is no hybrid search) and ``content_hash``
+        (rewriting a row in memory costs nothing worth skipping).
+        """
+        if schema.vector.metric not in set(Metric):
+            raise ValueError(f"Metric '{schema.vector.metric}' not supported")
+        if schema.table in self._collections:
+            if skip_if_exists:
+                return
+            raise ValueError(f"Collection '{schema.table}' already exists")
+        self._collections[schema.table] = _Collection(schema)
+
+    # ------------------------------------------------------------------
+    # upsert
+    # ------------------------------------------------------------------
+    async def upsert(
+        self,
+        name: str,
+        ids: list[str],
+        vectors: Sequence[Sequence[float]] | numpy.ndarray,
+        metadata: list[dict[str, Any]] | None = None,
+        *,
+        if_exists: str = "update",
+    ) -> dict[str, Any]:
+        """
+        Insert or overwrite rows of *name*.
+
+        ``if_exists`` behaves as in the pgvector adapter ("update", "skip",
+        or "error", which raises ValueError naming the duplicate ids and
+        writes nothing). Metadata keys must be fields of the collection; a
+        key missing from some rows is written as None for those rows, and
+        fields no row mentions keep their stored values.
+
+        Returns ``{"rows", "written", "batches", "elapsed", "rows_per_sec"}``.
+        """
+        if if_exists not in _IF_EXISTS:
+            raise ValueError(f"if_exists must be one of {sorted(_IF_EXISTS)}")
+        if len(vectors) != len(ids) or (metadata is not None and len(metadata) != len(ids)):
+            raise ValueError("ids, vectors and metadata must have the same length")
+
+        started = time.perf_counter()
+        coll = self._collection(name)
+        matrix = _matrix(vectors, coll.schema.vector.dim, coll.schema.vector.precision)
+        fields = _metadata_fields(coll.schema, metadata)
+        if if_exists == "error":
+            counts: dict[str, int] = {}
+            for id_ in ids:
+                counts[id_] = counts.get(id_, 0) + 1
+            dupes = sorted(i for i, n in counts.items() if n > 1 or i in coll.row_of)
+            if dupes:
+                raise ValueError(f"Duplicate ids in '{name}': {dupes[:10]}")
+
+        coll.reserve(len(ids))
+        written = 0
+        for i, id_ in enumerate(ids):
+            meta = None if metadata is None else metadata[i] or {}
+            row = coll.row_of.get(id_)
+            if row is None:
+                coll.append(id_, matrix[i], meta, fields)
+            elif if_exists == "update":
+                coll.write(row, matrix[i], meta, fields)
+            else:
+                continue
+            written += 1
+
+        span = current_span()
+        if span is not None:
+            span.nbytes += matrix.nbytes
+        elapsed = time.perf_counter() - started
+        return {
+            "rows": len(ids),
+            "written": written,
+            "batches": 1 if ids else 0,
+            "elapsed": elapsed,
+            "rows_per_sec": len(ids) / elapsed if elapsed else 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # query
+    # ------------------------------------------------------------------
+    async def query(
+        self,
+        name: str,
+        vector: Sequence[float] | numpy.ndarray,
+        k: int,
+        filter: dict[str, Any] | None = None,
+        *,
+        search_params: dict[str, Any] | None = None,
+        compat: str = "strict",
+        as_numpy: bool = False,
+    ) -> Any:
+        """
+        Exact k-nearest-neighbour search on *name*.
+
+        Returns one dict per hit holding every column plus ``score``, or the
+        column-wise form of the pgvector adapter with ``as_numpy=True``.
+        *filter* uses the pgvector dict language (see
+        :mod:`vverb.memory.filters`) and never shortens the result below
+        *k* matching rows. *search_params* are accepted for compatibility
+        and ignored: an exact scan has nothing to tune.
+        """
+        batch = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        return (await self.query_many(name, batch, k, filter, as_numpy=as_numpy))[0]
+
+    async def query_many(
+        self,
+        name: str,
+        vectors: Sequence[Sequence[float]] | numpy.ndarray,
+        k: int,
+        filter: dict[str, Any] | None = None,
+        *,
+        search_params: dict[str, Any] | None = None,
+        as_numpy: bool = False,
+    ) -> list[Any]:
+        """Exact search for every vector with one matrix product; input order."""
+        coll = self._collection(name)
+        if not len(vectors):
+            return []
+        queries = _matrix(vectors, coll.schema.vector.dim, coll.schema.vector.precision)
+        mask = compile_filter(coll.schema, filter)
+
+        started = time.perf_counter()
+        metric = coll.schema.vector.metric
+        rows = np.arange(coll.size)
+        base, norms = coll.vectors[: coll.size], coll.norms[: coll.size]  # views, no copy
+        if mask is not None:
+            rows = rows[mask(coll.columns, coll.size)]
+            base, norms = base[rows], norms[rows]
+        dist = distances(base, queries, metric, norms=norms if metric in _NORM_METRICS else None)
+        best = top_k(dist, k)
+        results = []
+        for q in range(len(queries)):
+            hit_rows, scores = rescore(base, queries[q], best[q], dist[q, best[q]], metric)
+            results.append(_hits(coll, rows[hit_rows], scores, as_numpy))
+
+        span = current_span()
+        if span is not None:
+            span.db += time.perf_counter() - started
+            span.rows = sum(len(b) for b in best)
+            span.nbytes += span.rows * coll.schema.vector.dim * 4
+        return results
+
+    # ------------------------------------------------------------------
+    # delete
+    # ------------------------------------------------------------------
+    async def delete(self, name: str, ids: list[str]) -> int:
+        """Remove *ids* from *name*; unknown ids are ignored. Returns rows removed."""
+        coll = self._collection(name)
+        return sum(coll.remove(id_) for id_ in ids)
+
+    async def delete_where(self, name: str, filter: dict[str, Any]) -> int:
+        """Remove every row of *name* matching *filter*. Returns rows removed."""
+        if not filter:
+            raise ValueError("delete_where needs a non-empty filter")
+        coll = self._collection(name)
+        mask = compile_filter(coll.schema, filter)
+        assert mask is not None
+        hit = np.flatnonzero(mask(coll.columns, coll.size))
+        doomed = [coll.ids[row] for row in hit]
+        return sum(coll.remove(id_) for id_ in doomed)
+
+    # ------------------------------------------------------------------
+    # dumps
+    # ------------------------------------------------------------------
+    async def export_collection(self, name: str, path: str | os.PathLike[str]) -> dict[str, Any]:
+        """Write *name* to the dump directory *path* (see :mod:`vverb.transfer`)."""
+        from ..transfer import DumpWriter
+
+        coll = self._collection(name)
+        started = time.perf_counter()
+        fields = [f.name for f in coll.schema.fields]
+        step = int(self.capabilities()["max_batch"])
+        with DumpWriter(path, coll.schema, coll.size) as dump:
+            for lo in range(0, coll.size, step):
+                hi = min(lo + step, coll.size)
+                metadata = [{f: coll.columns[f][row] for f in fields} for row in range(lo, hi)]
+                dump.write(coll.ids[lo:hi], coll.vectors[lo:hi], metadata)
+        elapsed = time.perf_counter() - started
+        rate = coll.size / elapsed if elapsed else 0.0
+        return {"rows": coll.size, "elapsed": elapsed, "rows_per_sec": rate}
+
+    # ------------------------------------------------------------------
+    # capability probe
+    # ------------------------------------------------------------------
+    def capabilities(self) -> dict[str, Any]:
+        return {
+            "filter": True,
+            "max_batch": 100_000,
+            "metrics": [m.value for m in Metric],
+            "index_types": [IndexType.NONE.value],
+            "precisions": [p.value for p in Precision],
+            "search_params": [],
+        }
+
+    # ------------------------------------------------------------------
+    # helper utilities
+    # ------------------------------------------------------------------
+    def _collection(self, name: str) -> _Collection:
+        try:
+            return self._collections[name]
+        except KeyError:
+            raise ValueError(f"Unknown collection '{name}'") from None
+
+
+def _matrix(vectors: Any, dim: int, precision: Precision = Precision.FULL) -> np.ndarray:
+    """(N, dim) float32 view/copy of *vectors* at *precision*; rejects other dimensions."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1 and matrix.size == 0:
+        matrix = matrix.reshape(0, dim)
+    if matrix.ndim != 2 or matrix.shape[1] != dim:
+        raise ValueError(f"Expected vectors of dimension {dim}, got shape {matrix.shape}")
+    if precision is Precision.HALF:
+        return matrix.astype(np.float16).astype(np.float32)
+    if precision is Precision.BINARY:
+        return (matrix > 0).astype(np.float32)
+    return matrix
+
+
+def _metadata_fields(schema: TableSchema, metadata: list[dict[str, Any]] | None) -> list[FieldCol]:
+    """Schema fields referenced by any metadata row, in schema order."""
+    if not metadata:
+        return []
+    keys: set[str] = set()
+    for row in metadata:
+        keys.update(row or ())
+    unknown = keys - {f.name for f in schema.fields}
+    if unknown:
+        raise ValueError(f"Unknown metadata columns for '{schema.table}': {sorted(unknown)}")
+    return [f for f in schema.fields if f.name in keys]
+
+
+def _stored(ftype: FieldType, value: Any) -> Any:
+    """JSON fields given as text are kept as the document they encode."""
+    if ftype is FieldType.JSON and isinstance(value, str):
+        return json.loads(value)
+    return value
+
+
+def _hits(coll: _Collection, rows: np.ndarray, scores: np.ndarray, as_numpy: bool) -> Any:
+    """Shape hit rows as a list of dicts, or column-wise when *as_numpy*."""
+    schema = coll.schema
+    vectors = coll.vectors[rows]  # fancy indexing copies: results own their data
+    if as_numpy:
+        out: dict[str, Any] = {
+            name: [values[r] for r in rows] for name, values in coll.columns.items()
+        }
+        out[schema.vector.name] = vectors
+        out["score"] = scores.astype(np.float64)
+        return out
+    hits = []
+    for i, r in enumerate(rows):
+        hit = {name: values[r] for name, values in coll.columns.items()}
+        hit[schema.vector.name] = vectors[i]
+        hit["score"] = float(scores[i])
+        hits.append(hit)
+    return hits
@@ -0,0 +1,94 @@
+"""
+Brute-force distances for every :class:`~vverb.util.schema.Metric`.
+
+Lower is always closer, with the same definitions pgvector uses:
+
+    cosine                  1 − cos(a, b)
+    l2 / euclidean          ‖a − b‖
+    ip / dot / dotproduct   −a·b
+    hamming                 number of differing bits
+    jaccard / tanimoto      1 − |a ∧ b| / |a ∨ b|
+
+Binary metrics treat every component > 0 as a set bit (pgvector's
+``binary_quantize``).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ..util.schema import Metric
+
+__all__ = ["distances", "rescore", "top_k"]
+
+_L2 = (Metric.L2, Metric.EUCLIDEAN)
+_IP = (Metric.INNER_PRODUCT, Metric.DOT, Metric.DOT_PRODUCT)
+_SET = (Metric.JACCARD, Metric.TANIMOTO)
+
+
+def distances(
+    base: np.ndarray,
+    queries: np.ndarray,
+    metric: Metric,
+    *,
+    norms: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    ``(len(queries), len(base))`` distance matrix.
+
+    *norms* may carry precomputed ``‖base‖`` (L2 and cosine) so a static
+    collection does not recompute them on every call.
+    """
+    metric = Metric(metric)
+    if metric in _IP:
+        return -(queries @ base.T)
+    if metric in _L2 or metric is Metric.COSINE:
+        if norms is None:
+            norms = np.linalg.norm(base, axis=1)
+        dots = queries @ base.T
+        q_norms = np.linalg.norm(queries, axis=1)
+        if metric is Metric.COSINE:
+            denom = np.maximum(q_norms[:, None] * norms[None, :], np.finfo(np.float32).tiny)
+            return 1.0 - dots / denom
+        sq = q_norms[:, None] ** 2 - 2.0 * dots + norms[None, :] ** 2
+        return np.sqrt(np.maximum(sq, 0.0))
+    if metric is Metric.HAMMING or metric in _SET:
+        a = (queries > 0).astype(np.float32)
+        b = (base > 0).astype(np.float32)
+        both = a @ b.T
+        either = a.sum(axis=1)[:, None] + b.sum(axis=1)[None, :] - both
+        if metric is Metric.HAMMING:
+            return either - both
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(either > 0, 1.0 - both / either, 0.0)
+    raise ValueError(f"Unsupported metric '{metric}'")
+
+
+def top_k(dist: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the *k* smallest entries of every row, ascending."""
+    k = min(int(k), dist.shape[1])
+    if k <= 0:
+        return np.empty((dist.shape[0], 0), dtype=np.intp)
+    if k < dist.shape[1]:
+        part = np.argpartition(dist, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(k), dist.shape).copy()
+    order = np.take_along_axis(dist, part, axis=1).argsort(axis=1, kind="stable")
+    return np.take_along_axis(part, order, axis=1)
+
+
+def rescore(
+    base: np.ndarray, query: np.ndarray, hits: np.ndarray, scores: np.ndarray, metric: Metric
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Exact scores for the selected *hits*, re-sorted.
+
+    :func:`distances` computes L2 through ``‖q‖² − 2q·b + ‖b‖²``, which
+    loses float32 precision for near neighbours; the few returned rows
+    are recomputed directly so scores match an exact engine.
+    """
+    if Metric(metric) not in _L2 or not len(hits):
+        return hits, scores
+    exact = np.linalg.norm(base[hits] - query, axis=1)
+    order = exact.argsort(kind="stable")
+    return hits[order], exact[order]
@@ -0,0 +1,108 @@
+"""
+Filter evaluation for the in-memory adapter.
+
+Accepts the dict language of :mod:`vverb.pgvector.filters` with the same
+meaning, including SQL's NULL rules: a missing or ``None`` value only
+matches ``None`` (``IS NULL``) and fails every comparison, ``$ne`` and
+``$nin`` included.
+
+    {"lang": "en"}                          equality (None → IS NULL)
+    {"year": {"$gte": 2020, "$lt": 2024}}   $eq $ne $gt $gte $lt $lte
+    {"tag": {"$in": ["a", "b"]}}            $in / $nin
+    {"meta": {"$contains": {"k": "v"}}}     JSONB-style containment (FieldType.JSON only)
+"""
+
+from __future__ import annotations
+
+import json
+import operator
+from typing import Any, Callable, Mapping, Sequence
+
+import numpy as np
+
+from ..util.schema import FieldType, TableSchema
+
+__all__ = ["compile_filter"]
+
+Predicate = Callable[[Any], bool]
+
+_COMPARE: dict[str, Callable[[Any, Any], bool]] = {
+    "$eq": operator.eq,
+    "$ne": operator.ne,
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+}
+_OPERATORS = {*_COMPARE, "$in", "$nin", "$contains"}
+
+
+def compile_filter(
+    schema: TableSchema, filter: dict[str, Any] | None
+) -> Callable[[Mapping[str, Sequence[Any]], int], np.ndarray] | None:
+    """
+    Validate *filter* and return ``mask(columns, n)``.
+
+    *columns* maps column name → per-row values; the result is a boolean
+    array over the first *n* rows. ``None`` when there is nothing to filter.
+    """
+    if not filter:
+        return None
+    types = {schema.id_field: FieldType.STRING, **{f.name: f.ftype for f in schema.fields}}
+    conditions: list[tuple[str, Predicate]] = []
+    for column in sorted(filter):
+        if column not in types:
+            raise ValueError(f"Cannot filter on unknown column '{column}' of '{schema.table}'")
+        ftype = types[column]
+        cond = filter[column]
+        if not (isinstance(cond, dict) and cond and all(str(k).startswith("$") for k in cond)):
+            cond = {"$eq": cond}
+        for op in sorted(cond):
+            if op not in _OPERATORS:
+                raise ValueError(f"Unknown filter operator '{op}'; use {sorted(_OPERATORS)}")
+            if op == "$contains" and ftype is not FieldType.JSON:
+                raise ValueError(f"'$contains' needs a JSON column, '{column}' is {ftype.value}")
+            conditions.append((column, _predicate(op, cond[op], ftype)))
+
+    def mask(columns: Mapping[str, Sequence[Any]], n: int) -> np.ndarray:
+        out = np.ones(n, dtype=bool)
+        for column, pred in conditions:
+            values = columns[column]
+            out &= np.fromiter((pred(values[i]) for i in range(n)), dtype=bool, count=n)
+        return out
+
+    return mask
+
+
+def _predicate(op: str, value: Any, ftype: FieldType) -> Predicate:
+    if value is None and op in ("$eq", "$ne"):
+        return (lambda v: v is None) if op == "$eq" else (lambda v: v is not None)
+    if ftype is FieldType.JSON:
+        value = _decode(value) if op != "$in" and op != "$nin" else [_decode(x) for x in value]
+    if op in _COMPARE:
+        compare = _COMPARE[op]
+        return lambda v: v is not None and bool(compare(v, value))
+    if op == "$in":
+        members = list(value)
+        return lambda v: v is not None and v in members
+    if op == "$nin":
+        members = list(value)
+        return lambda v: v is not None and v not in members
+    return lambda v: v is not None and _contains(v, value)  # $contains
+
+
+def _decode(value: Any) -> Any:
+    """JSON parameters given as text are compared as the document they encode."""
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _contains(doc: Any, sub: Any) -> bool:
+    """JSONB ``@>``: objects by key subset, arrays by element subset."""
+    if isinstance(sub, dict):
+        return isinstance(doc, dict) and all(
+            key in doc and _contains(doc[key], val) for key, val in sub.items()
+        )
+    if isinstance(doc, list):
+        items = sub if isinstance(sub, list) else [sub]
+        return all(any(_contains(d, s) for d in doc) for s in items)
+    return not isinstance(sub, list) and doc == sub
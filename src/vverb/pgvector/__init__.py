@@ -1,11 +1,27 @@
 """
 vverb.pgvector – public API surface for the PGVector adapter.
+
+The adapter and its driver (asyncpg) are imported on first attribute
+access, so ``import vverb.pgvector`` stays cheap.
 """
 
-from .core import PgVectorAdapter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import PgVectorAdapter
 
-# Convenience entry-point so callers can simply:
-#     from vverb.pgvector import connect
-connect = PgVectorAdapter.connect
+    # Convenience entry-point so callers can simply:
+    #     from vverb.pgvector import connect
+    connect = PgVectorAdapter.connect
 
 __all__: list[str] = ["connect", "PgVectorAdapter"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .core import PgVectorAdapter
+
+    return PgVectorAdapter.connect if name == "connect" else PgVectorAdapter
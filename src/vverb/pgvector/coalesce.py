@@ -0,0 +1,121 @@
+"""
+Coalescing of concurrent single-vector searches.
+
+``PgVectorAdapter.connect(coalesce_window=0.002)`` routes every ``query``
+through a :class:`QueryCoalescer`. Calls that agree on everything but the
+vector (collection, k, filter, search_params, result shape) and arrive
+within *window* seconds of the first one are sent as one multi-vector
+statement, the same one ``query_many`` uses. Each caller gets its own
+hits back. A batch is flushed early once it holds *max_batch* vectors.
+
+A lone call waits for the window and then runs as a plain ``query``, so
+the window bounds the added latency. Batching pays off once more
+searches arrive at once than the pool has connections.
+
+Batches run in a task with an empty context: the verb span of whichever
+caller opened the batch must not absorb the whole batch's codec and
+database time (see :mod:`vverb.instrument`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable
+
+from vverb._log import logger as _root_logger
+
+log = _root_logger.getChild("pgvector.coalesce")
+
+__all__ = ["QueryCoalescer"]
+
+# runs one batch: (arguments shared by the batch, its vectors) → one result per vector
+Runner = Callable[[dict[str, Any], list[Any]], Awaitable[list[Any]]]
+
+
+@dataclass(slots=True)
+class _Batch:
+    args: dict[str, Any]
+    vectors: list[Any] = field(default_factory=list)
+    waiters: list[asyncio.Future[Any]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class QueryCoalescer:
+    """Groups concurrent searches by key and runs each group as one batch."""
+
+    def __init__(self, run: Runner, *, window: float = 0.002, max_batch: int = 64):
+        if window < 0 or max_batch < 1:
+            raise ValueError("coalesce window must be >= 0 and max_batch >= 1")
+        self.window = float(window)
+        self.max_batch = int(max_batch)
+        self._run = run
+        self._pending: dict[Hashable, _Batch] = {}
+        self._running: set[asyncio.Task[None]] = set()
+        self._stats = {"queries": 0, "batches": 0, "largest": 0}
+
+    async def submit(self, key: Hashable, args: dict[str, Any], vector: Any) -> Any:
+        """Queue *vector* with the other searches of *key*; its result once run."""
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _Batch(args)
+            batch.timer = loop.call_later(
+                self.window, self._flush, key, context=contextvars.Context()
+            )
+        waiter = loop.create_future()
+        batch.vectors.append(vector)
+        batch.waiters.append(waiter)
+        if len(batch.vectors) >= self.max_batch:
+            self._flush(key)
+        return await waiter
+
+    async def drain(self) -> None:
+        """Run every pending batch now and wait for all batches in flight."""
+        for key in list(self._pending):
+            self._flush(key)
+        while self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        out: dict[str, Any] = dict(self._stats)
+        out["avg_batch"] = out["queries"] / out["batches"] if out["batches"] else 0.0
+        out["pending"] = sum(len(b.vectors) for b in self._pending.values())
+        return out
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+    def _flush(self, key: Hashable) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        loop = asyncio.get_running_loop()
+        task = contextvars.Context().run(loop.create_task, self._execute(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _execute(self, batch: _Batch) -> None:
+        live = [(v, w) for v, w in zip(batch.vectors, batch.waiters, strict=True) if not w.done()]
+        if not live:  # every caller gave up (cancelled)
+            return
+        self._stats["queries"] += len(live)
+        self._stats["batches"] += 1
+        self._stats["largest"] = max(self._stats["largest"], len(live))
+        try:
+            results = await self._run(batch.args, [v for v, _ in live])
+        except Exception as exc:
+            for _, waiter in live:
+                if not waiter.done():
+                    waiter.set_exception(exc)
+            return
+        except BaseException:  # cancelled (adapter closing): cancel the callers too
+            for _, waiter in live:
+                waiter.cancel()
+            raise
+        for (_, waiter), result in zip(live, results, strict=True):
+            if not waiter.done():
+                waiter.set_result(result)
@@ -0,0 +1,230 @@
+"""
+Binary wire codecs for pgvector's ``vector`` and ``halfvec`` types.
+
+Registered on every pooled connection so vectors travel as raw float
+payloads instead of text or Python float lists:
+
+    encode : list / tuple / array.array / numpy.ndarray / any float buffer
+    decode : numpy.ndarray (float32) when numpy is installed, else list[float]
+
+Wire format (pgvector ``vector_send`` / ``halfvec_send``): uint16 dim,
+uint16 unused, then *dim* big-endian float4 (vector) or float2 (halfvec)
+values. ``bit`` columns use asyncpg's built-in ``BitString`` codec.
+
+:class:`BinaryCopyReader` splits the output of ``COPY … TO STDOUT
+(FORMAT binary)`` into rows of raw field payloads as the chunks arrive.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import Any
+
+import asyncpg
+
+try:  # numpy is optional; without it vectors decode to plain lists
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+__all__ = [
+    "BinaryCopyReader",
+    "as_vectors",
+    "decode_halfvec",
+    "decode_vector",
+    "encode_halfvec",
+    "encode_vector",
+    "register_vector_codec",
+    "vector_array",
+    "vector_matrix",
+]
+
+_HEADER = struct.Struct("!HH")  # dim, unused
+_BIG_F4 = ">f4"
+_BIG_F2 = ">f2"
+_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_COPY_HEADER = struct.Struct("!11sii")  # signature, flags, header extension length
+_INT16 = struct.Struct("!h")
+_INT32 = struct.Struct("!i")
+
+
+def encode_vector(value: Any) -> bytes:
+    """Encode one vector into pgvector's binary representation."""
+    if np is not None:
+        # no-op for rows of a batch that as_vectors() already made big-endian
+        arr = np.asarray(value, dtype=_BIG_F4)
+        if arr.ndim != 1:
+            raise ValueError(f"expected a 1-d vector, got shape {arr.shape}")
+        return _HEADER.pack(arr.shape[0], 0) + arr.tobytes()
+
+    values = _float_array(value)
+    if sys.byteorder == "little":
+        values.byteswap()
+    return _HEADER.pack(len(values), 0) + values.tobytes()
+
+
+def decode_vector(data: bytes) -> Any:
+    """Decode pgvector's binary representation into a float32 vector."""
+    dim, _ = _HEADER.unpack_from(data)
+    if np is not None:
+        return np.frombuffer(data, dtype=_BIG_F4, count=dim, offset=_HEADER.size).astype(np.float32)
+    return list(struct.unpack_from(f"!{dim}f", data, _HEADER.size))
+
+
+def encode_halfvec(value: Any) -> bytes:
+    """Encode one vector into pgvector's binary ``halfvec`` representation."""
+    if np is not None:
+        arr = np.asarray(value, dtype=_BIG_F2)
+        if arr.ndim != 1:
+            raise ValueError(f"expected a 1-d vector, got shape {arr.shape}")
+        return _HEADER.pack(arr.shape[0], 0) + arr.tobytes()
+    values = _float_array(value)
+    return _HEADER.pack(len(values), 0) + struct.pack(f"!{len(values)}e", *values)
+
+
+def decode_halfvec(data: bytes) -> Any:
+    """Decode pgvector's binary ``halfvec`` representation into float32 values."""
+    dim, _ = _HEADER.unpack_from(data)
+    if np is not None:
+        return np.frombuffer(data, dtype=_BIG_F2, count=dim, offset=_HEADER.size).astype(np.float32)
+    return list(struct.unpack_from(f"!{dim}e", data, _HEADER.size))
+
+
+def as_vectors(vectors: Any) -> Any:
+    """
+    Prepare a batch of vectors for encoding.
+
+    With numpy the whole batch becomes one big-endian float32 matrix in a
+    single vectorised pass (``ndarray``s and other buffer-protocol objects
+    are never turned into Python lists); each row then encodes with one
+    ``tobytes`` call. Without numpy the batch is returned unchanged.
+    """
+    if np is None:
+        return vectors
+    arr = np.asarray(vectors, dtype=_BIG_F4)
+    if arr.ndim != 2:
+        raise ValueError(f"expected a 2-d batch of vectors, got shape {arr.shape}")
+    return arr
+
+
+def vector_array(vectors: Any) -> list[memoryview]:
+    """
+    Elements for a ``vector[]`` query parameter.
+
+    asyncpg recurses into lists and ndarrays when encoding arrays, so each
+    vector is handed over as a ``memoryview`` (treated as a scalar element)
+    over its float32 buffer.
+    """
+    if np is not None:
+        return [memoryview(row) for row in as_vectors(vectors)]
+    return [memoryview(_float_array(row)) for row in vectors]
+
+
+class BinaryCopyReader:
+    """
+    Incremental parser of binary COPY output.
+
+    :meth:`feed` takes the chunks in arrival order (they may split a row
+    anywhere) and returns the rows they complete, each a list of field
+    payloads in the server's binary send format (None for NULL).
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._started = False
+        self.done = False  # the trailer was seen
+
+    def feed(self, chunk: bytes) -> list[list[bytes | None]]:
+        buf = self._buf
+        buf += chunk
+        pos = 0
+        if not self._started:
+            if len(buf) < _COPY_HEADER.size:
+                return []
+            signature, _, extension = _COPY_HEADER.unpack_from(buf)
+            if signature != _COPY_SIGNATURE:
+                raise ValueError("not a binary COPY stream")
+            pos = _COPY_HEADER.size + extension
+            if len(buf) < pos:
+                return []
+            self._started = True
+        rows = []
+        while not self.done and len(buf) - pos >= 2:
+            (count,) = _INT16.unpack_from(buf, pos)
+            if count == -1:
+                self.done = True
+                pos += 2
+                break
+            row = self._row(buf, pos + 2, count)
+            if row is None:  # incomplete: wait for the next chunk
+                break
+            pos, fields = row
+            rows.append(fields)
+        del buf[:pos]
+        return rows
+
+    @staticmethod
+    def _row(buf: bytearray, pos: int, count: int) -> tuple[int, list[bytes | None]] | None:
+        fields: list[bytes | None] = []
+        for _ in range(count):
+            if len(buf) - pos < 4:
+                return None
+            (size,) = _INT32.unpack_from(buf, pos)
+            pos += 4
+            if size < 0:
+                fields.append(None)
+                continue
+            if len(buf) - pos < size:
+                return None
+            fields.append(bytes(buf[pos : pos + size]))
+            pos += size
+        return pos, fields
+
+
+def vector_matrix(payloads: list[bytes | None], dim: int) -> Any:
+    """(n, dim) float32 matrix from *n* binary ``vector`` payloads (needs numpy)."""
+    if np is None:
+        raise ImportError("vector_matrix needs numpy")
+    if None in payloads:
+        raise ValueError("NULL vector")
+    body = b"".join(p[_HEADER.size :] for p in payloads if p is not None)
+    return np.frombuffer(body, dtype=_BIG_F4).reshape(len(payloads), dim)
+
+
+async def register_vector_codec(conn: asyncpg.Connection, schema: str = "public") -> None:
+    """
+    Install the binary ``vector`` codec on *conn*, plus ``halfvec`` when
+    the server's pgvector has it (0.7+).
+    """
+    await conn.set_type_codec(
+        "vector",
+        schema=schema,
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format="binary",
+    )
+    try:
+        await conn.set_type_codec(
+            "halfvec",
+            schema=schema,
+            encoder=encode_halfvec,
+            decoder=decode_halfvec,
+            format="binary",
+        )
+    except ValueError:  # pgvector < 0.7: no halfvec type
+        pass
+
+
+def _float_array(value: Any) -> array:
+    """float32 array.array from a sequence or a float buffer (numpy-free path)."""
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return array("f", value)
+    if view.format != "f":
+        return array("f", view.tolist())
+    out = array("f")
+    out.frombytes(view.cast("B"))
+    return out
@@ -0,0 +1,113 @@
+"""
+Filter compiler for the pgvector adapter.
+
+Filters are plain dicts keyed by column name (the id field or any field
+declared in ``TableSchema.fields``); conditions are AND-ed:
+
+    {"lang": "en"}                          equality (None → IS NULL)
+    {"year": {"$gte": 2020, "$lt": 2024}}   $eq $ne $gt $gte $lt $lte
+    {"tag": {"$in": ["a", "b"]}}            $in / $nin, bound as one array parameter
+    {"meta": {"$contains": {"k": "v"}}}     JSONB containment (FieldType.JSON only)
+
+Every value becomes a bind parameter. The SQL text depends only on the
+filter's *shape* (columns and operators, never values), is compiled once
+per shape and cached; identical text lets asyncpg's per-connection
+statement cache reuse the prepared statement and skip parse/plan.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Any
+
+from ..util.schema import FieldType, TableSchema
+
+__all__ = ["compile_filter", "filter_shape"]
+
+Shape = tuple[tuple[str, str], ...]  # ((column, operator), …) in column order
+
+_COMPARE = {"$eq": "=", "$ne": "<>", "$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+_MEMBERSHIP = {"$in": "= ANY({p})", "$nin": "<> ALL({p})"}
+_OPERATORS = {*_COMPARE, *_MEMBERSHIP, "$contains"}
+
+
+def compile_filter(
+    schema: TableSchema, filter: dict[str, Any] | None, start: int = 1
+) -> tuple[str, list[Any]]:
+    """
+    Compile *filter* against *schema*.
+
+    Returns ``(sql, params)`` where *sql* is a boolean expression whose
+    placeholders are numbered from ``$start``; ``("TRUE", [])`` when there
+    is nothing to filter on.
+    """
+    if not filter:
+        return "TRUE", []
+    shape, params = _split(schema, filter)
+    return _template(shape, start), params
+
+
+def filter_shape(schema: TableSchema, filter: dict[str, Any] | None) -> Shape:
+    """The value-free shape of *filter* (what compiled SQL is cached by)."""
+    return _split(schema, filter)[0] if filter else ()
+
+
+def _split(schema: TableSchema, filter: dict[str, Any]) -> tuple[Shape, list[Any]]:
+    """Validate *filter* and separate its shape from its values."""
+    types = {schema.id_field: FieldType.STRING, **{f.name: f.ftype for f in schema.fields}}
+    shape: list[tuple[str, str]] = []
+    params: list[Any] = []
+    for column in sorted(filter):
+        if column not in types:
+            raise ValueError(f"Cannot filter on unknown column '{column}' of '{schema.table}'")
+        ftype = types[column]
+        cond = filter[column]
+        if not (isinstance(cond, dict) and cond and all(str(k).startswith("$") for k in cond)):
+            cond = {"$eq": cond}
+
+        for op in sorted(cond):
+            value = cond[op]
+            if op not in _OPERATORS:
+                raise ValueError(f"Unknown filter operator '{op}'; use {sorted(_OPERATORS)}")
+            if op == "$contains" and ftype is not FieldType.JSON:
+                raise ValueError(f"'$contains' needs a JSON column, '{column}' is {ftype.value}")
+            if value is None and op in ("$eq", "$ne"):
+                shape.append((column, "$null" if op == "$eq" else "$notnull"))
+                continue
+            if op in _MEMBERSHIP:
+                value = [_encode(ftype, v) for v in value]
+            else:
+                value = _encode(ftype, value)
+            shape.append((column, op))
+            params.append(value)
+    return tuple(shape), params
+
+
+def _encode(ftype: FieldType, value: Any) -> Any:
+    """JSONB parameters travel as text."""
+    if ftype is FieldType.JSON and not isinstance(value, str):
+        return json.dumps(value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _template(shape: Shape, start: int) -> str:
+    parts: list[str] = []
+    n = start
+    for column, op in shape:
+        if op == "$null":
+            parts.append(f"{column} IS NULL")
+            continue
+        if op == "$notnull":
+            parts.append(f"{column} IS NOT NULL")
+            continue
+        p = f"${n}"
+        n += 1
+        if op in _COMPARE:
+            parts.append(f"{column} {_COMPARE[op]} {p}")
+        elif op in _MEMBERSHIP:
+            parts.append(f"{column} {_MEMBERSHIP[op].format(p=p)}")
+        else:  # $contains
+            parts.append(f"{column} @> {p}")
+    return " AND ".join(parts)
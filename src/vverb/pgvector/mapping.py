@@ -1,6 +1,6 @@
 from typing import Mapping
 
-from ..util.schema import FieldType, Metric
+from ..util.schema import FieldType, IndexType, Metric, Precision
 
 TYPE_MAP: Mapping[FieldType, str] = {
     FieldType.STRING: "TEXT",
@@ -14,6 +14,13 @@ TYPE_MAP: Mapping[FieldType, str] = {
     FieldType.UUID: "UUID",
 }
 
+# Precision → pgvector column type
+VECTOR_TYPE: Mapping[Precision, str] = {
+    Precision.FULL: "vector",
+    Precision.HALF: "halfvec",
+    Precision.BINARY: "bit",
+}
+
 METRIC_OPCLASS: Mapping[Metric, str] = {
     Metric.COSINE: "vector_cosine_ops",
     Metric.L2: "vector_l2_ops",
@@ -21,4 +28,66 @@ METRIC_OPCLASS: Mapping[Metric, str] = {
     Metric.INNER_PRODUCT: "vector_ip_ops",
     Metric.DOT: "vector_ip_ops",
     Metric.DOT_PRODUCT: "vector_ip_ops",
+    Metric.HAMMING: "bit_hamming_ops",
+    Metric.JACCARD: "bit_jaccard_ops",
+    Metric.TANIMOTO: "bit_jaccard_ops",  # Tanimoto == Jaccard on bit vectors
+}
+
+# operator class per (indexed precision, metric); a metric missing from a
+# precision's map cannot be used with that column / index type
+OPCLASS: Mapping[Precision, Mapping[Metric, str]] = {
+    Precision.FULL: {m: op for m, op in METRIC_OPCLASS.items() if op.startswith("vector_")},
+    Precision.HALF: {
+        m: op.replace("vector_", "halfvec_", 1)
+        for m, op in METRIC_OPCLASS.items()
+        if op.startswith("vector_")
+    },
+    Precision.BINARY: {m: op for m, op in METRIC_OPCLASS.items() if op.startswith("bit_")},
+}
+
+# Reverse lookups used when describing tables that were not created through
+# this adapter instance (format_type() spelling → FieldType / opclass → Metric).
+FIELD_TYPE_OF: Mapping[str, FieldType] = {v.lower(): k for k, v in TYPE_MAP.items()}
+
+METRIC_OF_OPCLASS: Mapping[str, Metric] = {
+    "vector_cosine_ops": Metric.COSINE,
+    "vector_l2_ops": Metric.L2,
+    "vector_ip_ops": Metric.INNER_PRODUCT,
+    "halfvec_cosine_ops": Metric.COSINE,
+    "halfvec_l2_ops": Metric.L2,
+    "halfvec_ip_ops": Metric.INNER_PRODUCT,
+    "bit_hamming_ops": Metric.HAMMING,
+    "bit_jaccard_ops": Metric.JACCARD,
+}
+
+PRECISION_OF_TYPE: Mapping[str, Precision] = {v: k for k, v in VECTOR_TYPE.items()}
+
+# distance operator per metric (pgvector returns *negative* inner product)
+METRIC_OPERATOR: Mapping[Metric, str] = {
+    Metric.COSINE: "<=>",
+    Metric.L2: "<->",
+    Metric.EUCLIDEAN: "<->",
+    Metric.INNER_PRODUCT: "<#>",
+    Metric.DOT: "<#>",
+    Metric.DOT_PRODUCT: "<#>",
+    Metric.HAMMING: "<~>",
+    Metric.JACCARD: "<%>",
+    Metric.TANIMOTO: "<%>",
+}
+
+# query(search_params=…) key → server setting applied with SET LOCAL;
+# "iterative_scan" is resolved against the collection's index type
+SEARCH_PARAM_GUC: Mapping[str, str] = {
+    "ef_search": "hnsw.ef_search",
+    "max_scan_tuples": "hnsw.max_scan_tuples",
+    "probes": "ivfflat.probes",
+    "max_probes": "ivfflat.max_probes",
+    "iterative_scan": "{index}.iterative_scan",
+}
+
+# IndexSpec field → index storage parameter, per index type
+INDEX_OPTIONS: Mapping[IndexType, tuple[str, ...]] = {
+    IndexType.HNSW: ("m", "ef_construction"),
+    IndexType.IVFFLAT: ("lists",),
+    IndexType.NONE: (),
 }
@@ -0,0 +1,206 @@
+"""
+Read replicas for the pgvector adapter.
+
+``PgVectorAdapter.connect(replicas=[...])`` opens one pool per replica
+DSN. kNN reads are spread over them, while writes, DDL and catalog
+lookups stay on the primary. A background monitor probes every replica
+each *check_interval* seconds for its replication lag and replayed WAL
+position:
+
+* a replica that lags more than *max_lag* seconds, or fails a probe or a
+  read, gets no reads until a later probe passes;
+* ``balance="least_loaded"`` sends a read to the replica with the fewest
+  reads in flight; ``balance="latency"`` picks at random, weighted by the
+  inverse of each replica's moving-average read latency;
+* a read with ``read_your_writes=True`` only goes to a replica that had
+  replayed the adapter's last write at its latest probe.
+
+Reads fall back to the primary when no replica qualifies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Sequence
+from urllib.parse import urlsplit
+
+import asyncpg
+
+from vverb._log import logger as _root_logger
+
+log = _root_logger.getChild("pgvector.replicas")
+
+__all__ = ["Replica", "ReplicaSet"]
+
+BALANCE_MODES = ("least_loaded", "latency")
+_EWMA_WEIGHT = 0.2  # weight of the newest sample in the latency average
+_MIN_LATENCY = 1e-4  # floor for latency weights: unmeasured replicas get a fair share
+
+# lag in seconds (0 when everything received is replayed: an idle primary
+# must not look like lag) and the replayed WAL position
+_PROBE_SQL = """
+SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0.0
+            WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0.0
+            ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0.0)
+       END::float8 AS lag,
+       CASE WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn()
+            ELSE pg_current_wal_lsn()
+       END AS lsn;
+"""
+
+# what makes a replica unusable until the next probe passes
+_PROBE_ERRORS: tuple[type[BaseException], ...] = (
+    asyncpg.PostgresError,
+    asyncpg.InterfaceError,
+    OSError,
+    asyncio.TimeoutError,
+)
+
+
+@dataclass(slots=True)
+class Replica:
+    name: str  # host:port of the DSN, for stats and logs
+    pool: asyncpg.Pool
+    healthy: bool = False  # last probe (and every read since) succeeded
+    lag: float | None = None  # seconds behind the primary, None until probed
+    lsn: int = 0  # WAL position replayed at the last probe
+    inflight: int = 0
+    latency: float = 0.0  # moving average of read seconds
+    reads: int = 0
+
+    @contextmanager
+    def reading(self) -> Iterator[None]:
+        """Count a read in flight and fold its duration into ``latency``."""
+        self.inflight += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.inflight -= 1
+            self.reads += 1
+            seconds = time.perf_counter() - started
+            if self.latency:
+                self.latency += _EWMA_WEIGHT * (seconds - self.latency)
+            else:
+                self.latency = seconds
+
+
+class ReplicaSet:
+    """Replica pools plus the probe loop and the read balancer."""
+
+    def __init__(
+        self,
+        replicas: Sequence[Replica],
+        *,
+        max_lag: float = 10.0,
+        balance: str = "least_loaded",
+        check_interval: float = 5.0,
+    ):
+        if balance not in BALANCE_MODES:
+            raise ValueError(f"balance must be one of {BALANCE_MODES}, got {balance!r}")
+        if max_lag < 0 or check_interval <= 0:
+            raise ValueError("max_lag must be >= 0 and check_interval > 0")
+        self.replicas = list(replicas)
+        self.max_lag = float(max_lag)
+        self.balance = balance
+        self.check_interval = float(check_interval)
+        self._monitor: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Probe every replica once, then keep probing in the background."""
+        await self.probe()
+        self._monitor = asyncio.create_task(self._probe_forever())
+
+    async def close(self) -> None:
+        if self._monitor is not None:
+            self._monitor.cancel()
+            try:
+                await self._monitor
+            except asyncio.CancelledError:
+                pass
+        await asyncio.gather(*(r.pool.close() for r in self.replicas))
+
+    async def probe(self) -> None:
+        """Refresh lag, replayed position and health of every replica."""
+        await asyncio.gather(*(self._probe(r) for r in self.replicas))
+
+    def pick(self, min_lsn: int | None = None) -> Replica | None:
+        """
+        Replica for the next read, None to read from the primary.
+
+        *min_lsn* limits the choice to replicas that had replayed that WAL
+        position at their last probe (read-your-writes).
+        """
+        eligible = [
+            r
+            for r in self.replicas
+            if r.healthy
+            and r.lag is not None
+            and r.lag <= self.max_lag
+            and (min_lsn is None or r.lsn >= min_lsn)
+        ]
+        if not eligible:
+            return None
+        if self.balance == "latency":
+            weights = [1.0 / max(r.latency, _MIN_LATENCY) for r in eligible]
+            return random.choices(eligible, weights)[0]
+        return min(eligible, key=lambda r: (r.inflight, random.random()))
+
+    def failed(self, replica: Replica) -> None:
+        """Take *replica* out of rotation after a failed read."""
+        if replica.healthy:
+            log.warning("replica %s failed a read; skipped until it answers a probe", replica.name)
+        replica.healthy = False
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "name": r.name,
+                "healthy": r.healthy,
+                "lag": r.lag,
+                "inflight": r.inflight,
+                "reads": r.reads,
+                "latency": r.latency,
+                "size": r.pool.get_size(),
+                "idle": r.pool.get_idle_size(),
+            }
+            for r in self.replicas
+        ]
+
+    # ------------------------------------------------------------------
+    # internals
+    # ------------------------------------------------------------------
+    async def _probe_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                await self.probe()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # keep probing: a dead loop would freeze replica health
+                log.exception("replica probe failed; retrying in %.1fs", self.check_interval)
+
+    async def _probe(self, replica: Replica) -> None:
+        try:
+            async with replica.pool.acquire(timeout=self.check_interval) as conn:
+                row = await conn.fetchrow(_PROBE_SQL, timeout=self.check_interval)
+        except _PROBE_ERRORS as exc:
+            if replica.healthy:
+                log.warning("replica %s failed its probe: %s", replica.name, exc)
+            replica.healthy = False
+            return
+        replica.lag = row["lag"]
+        replica.lsn = row["lsn"] or 0
+        if not replica.healthy:
+            log.info("replica %s is up (lag %.1fs)", replica.name, replica.lag)
+        replica.healthy = True
+
+
+def replica_name(dsn: str) -> str:
+    """host:port of *dsn*, without credentials."""
+    parts = urlsplit(dsn)
+    return f"{parts.hostname or 'localhost'}:{parts.port or 5432}"
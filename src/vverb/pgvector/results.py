@@ -0,0 +1,69 @@
+"""
+Search results whose columns arrive in two steps.
+
+``query(..., lazy=True)`` returns :class:`LazyHits`: the hits carry their
+key columns, ``score`` and whatever ``include=`` named, straight from the
+search statement. The columns left out (large JSONB metadata, the vector
+itself) are read for every hit at once, with one follow-up statement by
+primary key, the first time :meth:`LazyHits.load` is awaited:
+
+    hits = await db.query("docs", vec, k=100, lazy=True)
+    best = [h["id"] for h in hits if h["score"] < 0.3]
+    await hits.load()                    # now every hit holds every column
+
+Searches whose callers only look at ids and scores never pay for the
+payload.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Sequence
+
+__all__ = ["LazyHits"]
+
+# reads *columns* for the given hits: one dict of those columns per hit, in order
+Loader = Callable[[list[dict[str, Any]], list[str]], Awaitable[list[dict[str, Any]]]]
+
+
+class LazyHits(list):
+    """
+    ``list[dict]`` of hits; the columns in :attr:`missing` are filled in
+    by :meth:`load`.
+
+    Loading updates the hit dicts in place and happens once, however many
+    callers await it.
+    """
+
+    def __init__(self, hits: Sequence[dict[str, Any]], missing: Sequence[str], loader: Loader):
+        super().__init__(hits)
+        self.missing = list(missing)
+        self._loader = loader
+        self._loading: asyncio.Future[None] | None = None
+
+    @property
+    def loaded(self) -> bool:
+        """True once every hit holds every column."""
+        return not self.missing
+
+    def copy(self) -> LazyHits:
+        """Copy with its own hit dicts, loaded independently of this one."""
+        return LazyHits([dict(hit) for hit in self], self.missing, self._loader)
+
+    async def load(self) -> LazyHits:
+        """Fetch the missing columns of all hits in one statement; returns self."""
+        if self.missing:
+            if self._loading is None:
+                self._loading = asyncio.ensure_future(self._fill())
+            try:
+                await asyncio.shield(self._loading)
+            except Exception:
+                self._loading = None  # the next load() tries again
+                raise
+        return self
+
+    async def _fill(self) -> None:
+        if self:
+            for hit, values in zip(self, await self._loader(list(self), self.missing), strict=True):
+                hit.update(values)
+        self.missing = []
@@ -0,0 +1,178 @@
+"""
+On-disk collection dumps, for moving a collection between databases or
+adapters.
+
+    await pg.export_collection("docs", "/data/docs.vv")
+    await mem.import_collection("docs", "/data/docs.vv")
+
+A dump is a directory of three files:
+
+    manifest.json   format version, row count and the collection's TableSchema
+    vectors.npy     (rows, dim) float32 matrix, a plain NumPy ``.npy`` file
+    rows.jsonl      one ``[id, {metadata}]`` JSON array per line, in matrix order
+
+The matrix is written and read through ``numpy.memmap`` and the rows file
+line by line, so neither side holds more than one batch in memory
+whatever the collection size. Metadata values JSON cannot represent
+(dates, UUIDs) are written as strings.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import dataclasses
+import itertools
+import json
+import os
+import types
+import typing
+from enum import Enum
+from pathlib import Path
+from typing import IO, Any, Iterator, Sequence
+
+import numpy as np
+
+from vverb._log import logger as _root_logger
+
+from .util.schema import TableSchema
+
+log = _root_logger.getChild("transfer")
+
+__all__ = ["DumpWriter", "read_batches", "read_manifest"]
+
+FORMAT_VERSION = 1
+MANIFEST = "manifest.json"
+VECTORS = "vectors.npy"
+ROWS = "rows.jsonl"
+
+
+class DumpWriter:
+    """
+    Writes a dump of *count* rows of *schema* into directory *path*.
+
+    Call :meth:`write` with consecutive batches, then :meth:`close`; the
+    manifest is written last, so a dump without one is incomplete.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], schema: TableSchema, count: int):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / MANIFEST).unlink(missing_ok=True)
+        self.schema = schema
+        self.count = count
+        self.rows = 0
+        self._vectors = np.lib.format.open_memmap(
+            self.path / VECTORS, mode="w+", dtype=np.float32, shape=(count, schema.vector.dim)
+        )
+        self._lines: IO[str] = open(self.path / ROWS, "w", encoding="utf-8")
+
+    def write(
+        self, ids: Sequence[Any], vectors: Any, metadata: Sequence[str | dict[str, Any]]
+    ) -> None:
+        """
+        Append one batch; *vectors* is any (n, dim) float array, *metadata*
+        holds dicts or their JSON text.
+        """
+        n = len(ids)
+        if self.rows + n > self.count:
+            raise ValueError(f"dump of {self.count} rows got more rows than announced")
+        self._vectors[self.rows : self.rows + n] = vectors
+        for id_, meta in zip(ids, metadata, strict=True):
+            text = meta if isinstance(meta, str) else json.dumps(meta, default=str)
+            self._lines.write(f"[{json.dumps(id_, default=str)},{text}]\n")
+        self.rows += n
+
+    def close(self) -> None:
+        """Flush the files and write the manifest."""
+        self._lines.close()
+        self._vectors.flush()
+        del self._vectors
+        if self.rows != self.count:
+            raise ValueError(f"dump announced {self.count} rows but got {self.rows}")
+        manifest = {"version": FORMAT_VERSION, "rows": self.rows, "schema": _encode(self.schema)}
+        (self.path / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        log.info("wrote %d rows of %s to %s", self.rows, self.schema.table, self.path)
+
+    def __enter__(self) -> DumpWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._lines.close()
+
+
+def read_manifest(path: str | os.PathLike[str]) -> tuple[TableSchema, int]:
+    """Schema and row count of the dump in *path*."""
+    try:
+        manifest = json.loads((Path(path) / MANIFEST).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        raise ValueError(f"{path} is not a complete vverb dump (no {MANIFEST})") from None
+    if manifest.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported dump version {manifest.get('version')!r} in {path}")
+    return _decode(manifest["schema"]), int(manifest["rows"])
+
+
+def read_batches(
+    path: str | os.PathLike[str], batch_size: int
+) -> Iterator[tuple[list[Any], np.ndarray, list[dict[str, Any]]]]:
+    """
+    ``(ids, vectors, metadata)`` batches of the dump in *path*; vectors are
+    read-only views of the memory-mapped matrix.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    _, count = read_manifest(path)
+    vectors = np.load(Path(path) / VECTORS, mmap_mode="r")
+    if len(vectors) != count:
+        raise ValueError(f"{path}: {VECTORS} holds {len(vectors)} rows, manifest says {count}")
+    with open(Path(path) / ROWS, encoding="utf-8") as lines:
+        for lo in range(0, count, batch_size):
+            rows = [json.loads(line) for line in itertools.islice(lines, batch_size)]
+            if len(rows) != min(batch_size, count - lo):
+                raise ValueError(f"{path}: {ROWS} ends before row {lo + len(rows)}")
+            yield [r[0] for r in rows], vectors[lo : lo + len(rows)], [r[1] for r in rows]
+
+
+# ---------------------------------------------------------------------------
+# TableSchema <-> JSON
+# ---------------------------------------------------------------------------
+def _encode(schema: TableSchema) -> dict[str, Any]:
+    return dataclasses.asdict(
+        schema, dict_factory=lambda kv: {k: v.value if isinstance(v, Enum) else v for k, v in kv}
+    )
+
+
+def _decode(data: dict[str, Any]) -> TableSchema:
+    return _build(TableSchema, data)
+
+
+def _build(cls: Any, data: dict[str, Any]) -> Any:
+    """
+    Instance of the schema dataclass *cls* from its ``_encode`` form; keys
+    missing from older dumps keep the field's default.
+    """
+    hints = typing.get_type_hints(cls)
+    return cls(
+        **{
+            f.name: _value(hints[f.name], data[f.name])
+            for f in dataclasses.fields(cls)
+            if f.name in data
+        }
+    )
+
+
+def _value(hint: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    origin, args = typing.get_origin(hint), typing.get_args(hint)
+    if origin in (typing.Union, types.UnionType):  # X | None
+        return _value(next(a for a in args if a is not type(None)), value)
+    if origin in (list, collections.abc.Sequence):
+        return [_value(args[0], v) for v in value]
+    if dataclasses.is_dataclass(hint):
+        return _build(hint, value)
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint(value)
+    return value
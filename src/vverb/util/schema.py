@@ -6,6 +6,12 @@ Cross-engine schema primitives.
 * FieldType – common scalar types you can safely map across DBs; each adapter
               converts to its native name (e.g., 'float' → FLOAT / DOUBLE /
               float8).
+* IndexType – approximate-nearest-neighbour index families; IndexSpec carries
+              their build parameters.
+* Precision – how vector components are stored or indexed (float32, float16
+              or one bit per dimension).
+* PartitionKind – how a partitioned collection spreads rows over partitions;
+                  PartitionSpec names the key field.
 
 You can always extend these enums later without breaking callers:
     >>> Metric.HAMMING  # added in the future
@@ -57,16 +63,64 @@ class FieldType(str, Enum):
     # extend with "binary", "int8", "int16", etc. when an adapter needs it
 
 
+# ---------------------------------------------------------------------------
+# Vector index families  ────────────────────────────────────────────────────
+# ---------------------------------------------------------------------------
+
+
+class IndexType(str, Enum):
+    HNSW = "hnsw"  # pgvector / Qdrant / Milvus / Weaviate
+    IVFFLAT = "ivfflat"  # pgvector / Milvus (IVF_FLAT)
+    NONE = "none"  # exact scan only
+
+
+# ---------------------------------------------------------------------------
+# Vector precision  ─────────────────────────────────────────────────────────
+# ---------------------------------------------------------------------------
+
+
+class Precision(str, Enum):
+    FULL = "full"  # float32 – pgvector vector / Qdrant float32
+    HALF = "half"  # float16 – pgvector halfvec / Qdrant float16
+    BINARY = "binary"  # 1 bit per dimension (component > 0) – pgvector bit
+
+
+# ---------------------------------------------------------------------------
+# Partitioning  ─────────────────────────────────────────────────────────────
+# ---------------------------------------------------------------------------
+
+
+class PartitionKind(str, Enum):
+    LIST = "list"  # one partition per key value, created on first write
+    HASH = "hash"  # fixed number of partitions, key hashed
+
+
 # ---------------------------------------------------------------------------
 # Dataclasses for high-level schema description
 # ---------------------------------------------------------------------------
 
 
+@dataclass(slots=True)
+class IndexSpec:
+    kind: IndexType = IndexType.HNSW
+    m: int | None = None  # HNSW: links per node
+    ef_construction: int | None = None  # HNSW: build-time candidate list
+    lists: int | None = None  # IVFFlat: number of inverted lists
+    # index a compressed copy of the vectors; queries fetch k × oversample
+    # candidates from it and rerank them exactly on the stored column
+    quantization: Precision = Precision.FULL
+    # build-time server settings (Postgres GUCs); None keeps the server default
+    maintenance_work_mem: str | None = None  # e.g. "2GB"
+    max_parallel_maintenance_workers: int | None = None
+
+
 @dataclass(slots=True)
 class VectorCol:
     name: str
     dim: int
     metric: Metric = Metric.COSINE
+    index: IndexSpec = field(default_factory=IndexSpec)
+    precision: Precision = Precision.FULL  # storage; BINARY needs HAMMING / JACCARD
 
 
 @dataclass(slots=True)
@@ -76,6 +130,16 @@ class FieldCol:
     not_null: bool = False
     default: str | None = None
     extras: Dict[str, Any] = field(default_factory=dict)
+    # STRING only: text-search configuration (e.g. "english", "simple") to
+    # keep a full-text index on the field for hybrid search; None: no index
+    full_text: str | None = None
+
+
+@dataclass(slots=True)
+class PartitionSpec:
+    key: str  # name of a FieldCol; ids are unique per key value
+    kind: PartitionKind = PartitionKind.LIST
+    modulus: int = 16  # HASH: number of partitions
 
 
 @dataclass(slots=True)
@@ -84,3 +148,7 @@ class TableSchema:
     vector: VectorCol
     fields: Sequence[FieldCol] = field(default_factory=list)
     id_field: str = "id"
+    partition: PartitionSpec | None = None
+    # keep a hash of each row's vector and metadata so upserts skip rows
+    # whose content did not change (where the adapter supports it)
+    content_hash: bool = False
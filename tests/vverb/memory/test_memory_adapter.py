@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from vverb.cache import QueryCache
+from vverb.memory import connect
+from vverb.util.schema import (
+    FieldCol,
+    FieldType,
+    IndexSpec,
+    IndexType,
+    Metric,
+    TableSchema,
+    VectorCol,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def _schema(name: str = "docs", dim: int = 2, metric: Metric = Metric.L2) -> TableSchema:
+    return TableSchema(
+        table=name,
+        vector=VectorCol("embedding", dim=dim, metric=metric),
+        fields=[
+            FieldCol("year", FieldType.INT),
+            FieldCol("lang", FieldType.STRING),
+            FieldCol("meta", FieldType.JSON),
+        ],
+    )
+
+
+@pytest_asyncio.fixture
+async def db():
+    """Connected MemoryAdapter instance with a small 2-d collection."""
+    database = await connect()
+    await database.create_collection(_schema())
+    await database.upsert(
+        "docs",
+        [f"p{i}" for i in range(10)],
+        [[float(i), 0.0] for i in range(10)],
+        [
+            {"year": 2015 + i, "lang": "en" if i % 2 else None, "meta": {"tags": [i % 3]}}
+            for i in range(10)
+        ],
+    )
+    try:
+        yield database
+    finally:
+        await database.close()
+
+
+async def test_query_orders_by_distance(db):
+    hits = await db.query("docs", [4.2, 0.0], k=3)
+
+    assert [h["id"] for h in hits] == ["p4", "p5", "p3"]
+    assert hits[0]["score"] == pytest.approx(0.2, abs=1e-6)
+    assert hits[0]["year"] == 2019
+    assert np.allclose(hits[0]["embedding"], [4.0, 0.0])
+
+
+async def test_filters_follow_sql_semantics(db):
+    async def ids(filter):
+        return sorted(h["id"] for h in await db.query("docs", [0.0, 0.0], k=10, filter=filter))
+
+    assert await ids({"year": {"$gte": 2020, "$lt": 2022}}) == ["p5", "p6"]
+    assert await ids({"lang": None}) == ["p0", "p2", "p4", "p6", "p8"]
+    # NULL never satisfies a comparison, not even $ne / $nin
+    assert await ids({"lang": {"$ne": "fr"}}) == ["p1", "p3", "p5", "p7", "p9"]
+    assert await ids({"id": {"$in": ["p1", "p2", "zz"]}}) == ["p1", "p2"]
+    assert await ids({"meta": {"$contains": {"tags": [2]}}}) == ["p2", "p5", "p8"]
+
+    with pytest.raises(ValueError):
+        await db.query("docs", [0.0, 0.0], k=1, filter={"nope": 1})
+    with pytest.raises(ValueError):
+        await db.query("docs", [0.0, 0.0], k=1, filter={"lang": {"$contains": "e"}})
+
+
+async def test_upsert_modes_and_delete(db):
+    stats = await db.upsert("docs", ["p0", "new"], [[100.0, 0.0], [50.0, 0.0]], if_exists="skip")
+    assert stats["written"] == 1
+
+    with pytest.raises(ValueError):
+        await db.upsert("docs", ["p1"], [[0.0, 0.0]], if_exists="error")
+
+    await db.upsert("docs", ["p9"], [[-1.0, 0.0]], [{"year": 1}])
+    (hit,) = await db.query("docs", [-1.0, 0.0], k=1)
+    # like the pgvector merge: fields absent from every metadata row keep their value
+    assert (hit["id"], hit["year"], hit["lang"]) == ("p9", 1, "en")
+
+    assert await db.delete("docs", ["p9", "p3", "missing"]) == 2
+    hits = await db.query("docs", [0.0, 0.0], k=20)
+    assert len(hits) == 9
+    assert {"p3", "p9"}.isdisjoint(h["id"] for h in hits)
+
+
+async def test_delete_where(db):
+    assert await db.delete_where("docs", {"year": {"$lt": 2018}, "lang": None}) == 2
+    hits = await db.query("docs", [0.0, 0.0], k=20)
+    assert sorted(h["id"] for h in hits) == ["p1", "p3", "p4", "p5", "p6", "p7", "p8", "p9"]
+
+    with pytest.raises(ValueError, match="non-empty"):
+        await db.delete_where("docs", {})
+
+
+async def test_query_many_and_as_numpy(db):
+    batched = await db.query_many("docs", np.array([[9.1, 0.0], [0.2, 0.0]]), k=2)
+    assert [[h["id"] for h in hits] for hits in batched] == [["p9", "p8"], ["p0", "p1"]]
+
+    cols = await db.query("docs", [4.2, 0.0], k=2, as_numpy=True)
+    assert cols["id"] == ["p4", "p5"]
+    assert cols["embedding"].shape == (2, 2) and cols["embedding"].dtype == np.float32
+    assert cols["score"].dtype == np.float64
+
+
+@pytest.mark.parametrize("metric", list(Metric))
+async def test_every_metric_matches_brute_force(metric):
+    rng = np.random.default_rng(1)
+    base = rng.normal(size=(300, 6)).astype(np.float32)
+    if metric in (Metric.HAMMING, Metric.JACCARD, Metric.TANIMOTO):
+        base = (base > 0).astype(np.float32)
+    q = base[7] + 0.01
+
+    db = await connect()
+    await db.create_collection(_schema("m", 6, metric))
+    await db.upsert("m", [f"v{i}" for i in range(300)], base)
+    hits = await db.query("m", q, k=5)
+
+    a, b = (q > 0), (base > 0)
+    expected = {
+        "cosine": lambda: 1 - base @ q / np.linalg.norm(base, axis=1) / np.linalg.norm(q),
+        "l2": lambda: np.linalg.norm(base - q, axis=1),
+        "ip": lambda: -(base @ q),
+        "hamming": lambda: (a != b).sum(axis=1),
+        "jaccard": lambda: 1 - (a & b).sum(axis=1) / (a | b).sum(axis=1),
+    }
+    family = {
+        Metric.EUCLIDEAN: "l2",
+        Metric.DOT: "ip",
+        Metric.DOT_PRODUCT: "ip",
+        Metric.TANIMOTO: "jaccard",
+    }.get(metric, metric.value)
+    assert np.allclose([h["score"] for h in hits], np.sort(expected[family]())[:5], atol=1e-4)
+
+
+async def test_grows_past_initial_capacity_and_invalidates_cache():
+    db = await connect(query_cache=QueryCache())
+    schema = _schema("big", 4)
+    schema.vector.index = IndexSpec(kind=IndexType.NONE)
+    await db.create_collection(schema)
+    vectors = np.arange(5000 * 4, dtype=np.float32).reshape(5000, 4)
+    for lo in range(0, 5000, 700):
+        await db.upsert(
+            "big", [f"v{i}" for i in range(lo, min(lo + 700, 5000))], vectors[lo : lo + 700]
+        )
+
+    (first,) = await db.query("big", vectors[4321], k=1)
+    assert first["id"] == "v4321"
+
+    await db.delete("big", ["v4321"])
+    (after,) = await db.query("big", vectors[4321], k=1)
+    assert after["id"] != "v4321"
+    assert db.stats()["cache"]["hits"] == 0
+
+
+async def test_export_import_round_trip(db, tmp_path):
+    stats = await db.export_collection("docs", tmp_path / "docs")
+    assert stats["rows"] == 10
+
+    other = await connect()
+    loaded = await other.import_collection("copy", tmp_path / "docs", batch_size=4)
+    assert (loaded["rows"], loaded["batches"]) == (10, 3)
+    hits = await other.query("copy", [4.2, 0.0], k=2)
+    assert [(h["id"], h["year"], h["meta"]) for h in hits] == [
+        ("p4", 2019, {"tags": [1]}),
+        ("p5", 2020, {"tags": [2]}),
+    ]
+    assert other._collection("copy").schema.fields == db._collection("docs").schema.fields
@@ -0,0 +1,30 @@
+import json
+
+import pytest
+
+from vverb.bench import BenchConfig, run_benchmark
+from vverb.bench.__main__ import main
+from vverb.memory import connect
+
+
+@pytest.mark.asyncio
+async def test_bench_reports_exact_recall():
+    """The in-memory adapter is exact, so every workload scores recall 1."""
+    db = await connect()
+    report = await run_benchmark(db, BenchConfig(n=2_000, dim=16, queries=30, ks=(1, 10)))
+
+    for workload in ("knn", "knn_batched", "filtered"):
+        assert [r["recall"] for r in report[workload]] == pytest.approx([1.0, 1.0])
+    assert report["mixed"]["recall"] == pytest.approx(1.0)
+    assert report["index_build"] is None  # no build_index verb: indexed while loading
+
+
+def test_cli_connects_by_url(tmp_path):
+    out = tmp_path / "report.json"
+    argv = ["--url", "memory://", "--n", "500", "--dim", "8", "--queries", "10", "-o", str(out)]
+    assert main(argv) == 0
+    report = json.loads(out.read_text())
+    assert [r["recall"] for r in report["knn"]] == pytest.approx([1.0, 1.0])
+
+    with pytest.raises(SystemExit):  # one target only
+        main(["--url", "memory://", "--dsn", "postgresql://localhost/db"])
@@ -6,6 +6,7 @@ import os
 import pathlib
 import subprocess
 import time
+import uuid
 from typing import Any, Generator
 
 import asyncpg
@@ -13,6 +14,8 @@ import pytest
 import pytest_asyncio
 from pgvector.asyncpg import register_vector
 
+from vverb.pgvector import connect
+
 # ───────────────────────────────────────────────────────────────
 # ENV-BACKED CONSTANTS (with defaults)
 # ───────────────────────────────────────────────────────────────
@@ -126,7 +129,30 @@ async def conn(pgvector_config: tuple[str, int, int]):
 
 
 # ───────────────────────────────────────────────────────────────
-# 3. Single event loop for pytest-asyncio
+# 3. Connected adapter and a throwaway collection name
+# ───────────────────────────────────────────────────────────────
+@pytest_asyncio.fixture
+async def db(pgvector_config: tuple[str, int, int]):
+    """Connected PgVectorAdapter instance."""
+    dsn, min_pool_size, max_pool_size = pgvector_config
+    database = await connect(dsn=dsn, min_pool_size=min_pool_size, max_pool_size=max_pool_size)
+    try:
+        yield database
+    finally:
+        await database.close()
+
+
+@pytest_asyncio.fixture
+async def table_name(db):
+    """Unused collection name; the table (and its partitions) is dropped afterwards."""
+    name = "vv_" + uuid.uuid4().hex[:8]
+    yield name
+    async with db.raw() as con:
+        await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+# ───────────────────────────────────────────────────────────────
+# 4. Single event loop for pytest-asyncio
 # ───────────────────────────────────────────────────────────────
 @pytest.fixture(scope="session")
 def event_loop():
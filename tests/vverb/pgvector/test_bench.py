@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from vverb.bench import BenchConfig, run_benchmark
+from vverb.util.schema import IndexSpec, IndexType
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_exact_scan_has_perfect_recall(db):
+    """Without an ANN index every workload must hit the brute-force ground truth."""
+    name = "vv_" + uuid.uuid4().hex[:8]
+    config = BenchConfig(
+        n=400,
+        dim=8,
+        queries=20,
+        ks=(5,),
+        index=IndexSpec(kind=IndexType.NONE),
+        concurrency=4,
+        batch_size=8,
+        table=name,
+    )
+    try:
+        report = await run_benchmark(db, config)
+    finally:
+        async with db.raw() as con:
+            await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+    assert report["ingest"]["rows"] == 400
+    for workload in ("knn", "knn_batched", "filtered"):
+        (result,) = report[workload]
+        assert result["recall"] == pytest.approx(1.0)
+        assert result["qps"] > 0
+        assert set(result["latency"]) >= {"p50", "p95", "p99"}
+    assert report["mixed"]["recall"] == pytest.approx(1.0)
+
+
+async def test_index_is_built_after_ingest(db, table_name):
+    """IVFFlat lists are trained on the loaded rows, not on an empty table."""
+    config = BenchConfig(
+        n=400,
+        dim=8,
+        queries=20,
+        ks=(5,),
+        search_params=[{"probes": 4}],
+        index=IndexSpec(kind=IndexType.IVFFLAT, lists=4),
+        concurrency=4,
+        table=table_name,
+    )
+    report = await run_benchmark(db, config)
+    assert report["index_build"]["seconds"] > 0
+    (result,) = report["knn"]
+    assert result["recall"] == pytest.approx(1.0)
+    async with db.raw() as con:
+        indexes = await con.fetchval(
+            "SELECT count(*) FROM pg_indexes WHERE tablename = $1 AND indexdef LIKE '%ivfflat%';",
+            table_name,
+        )
+    assert indexes == 1
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from vverb.instrument import Instrumentation
+from vverb.pgvector import connect
+from vverb.util.schema import FieldCol, FieldType, Metric, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def db(pgvector_config: tuple[str, int, int]):
+    """Adapter coalescing concurrent queries over a 50 ms window."""
+    dsn, _, max_pool_size = pgvector_config
+    database = await connect(
+        dsn=dsn,
+        max_pool_size=max_pool_size,
+        coalesce_window=0.05,
+        coalesce_max_batch=8,
+        instrumentation=Instrumentation(),
+    )
+    try:
+        yield database
+    finally:
+        await database.close()
+
+
+@pytest_asyncio.fixture
+async def table_name(db):
+    name = "vv_" + uuid.uuid4().hex[:8]
+    await db.create_collection(
+        TableSchema(
+            name,
+            VectorCol("embedding", 2, metric=Metric.L2),
+            fields=[FieldCol("n", FieldType.INT)],
+        )
+    )
+    await db.upsert(
+        name,
+        [f"p{i}" for i in range(20)],
+        [[float(i), 0.0] for i in range(20)],
+        [{"n": i} for i in range(20)],
+    )
+    yield name
+    async with db.raw() as con:
+        await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+async def test_concurrent_queries_share_a_statement(db, table_name):
+    results = await asyncio.gather(*(db.query(table_name, [float(i), 0.0], k=2) for i in range(8)))
+    assert [[h["id"] for h in hits][0] for hits in results] == [f"p{i}" for i in range(8)]
+    assert results[3][0]["n"] == 3
+
+    stats = db.pool_stats()["coalescing"]
+    assert (stats["queries"], stats["batches"], stats["largest"]) == (8, 1, 8)
+    verbs = db.stats()["verbs"]
+    assert verbs["query"]["calls"] == 8 and "query_many" not in verbs
+
+
+async def test_batches_split_by_arguments_and_size(db, table_name):
+    calls = [db.query(table_name, [float(i), 0.0], k=1) for i in range(10)]
+    calls += [db.query(table_name, [1.2, 0.0], k=3)]
+    calls += [db.query(table_name, [1.0, 0.0], k=1, filter={"n": {"$gte": 5}})]
+    results = await asyncio.gather(*calls)
+
+    assert [hits[0]["id"] for hits in results[:10]] == [f"p{i}" for i in range(10)]
+    assert [h["id"] for h in results[10]] == ["p1", "p2", "p0"]
+    assert [h["id"] for h in results[11]] == ["p5"]
+    stats = db.pool_stats()["coalescing"]
+    # 10 k=1 calls: one full batch of 8 plus 2; k=3 and the filtered call alone
+    assert (stats["queries"], stats["batches"], stats["largest"]) == (12, 4, 8)
+
+
+async def test_errors_reach_every_caller(db, table_name):
+    results = await asyncio.gather(
+        *(db.query(table_name, [0.0, 0.0], k=1, filter={"nope": 1}) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+
+    hits = await db.query(table_name, [2.0, 0.0], k=1)  # the coalescer keeps working
+    assert hits[0]["id"] == "p2"
+
+
+async def test_cancelled_caller_leaves_batch_intact(db, table_name):
+    doomed = asyncio.ensure_future(db.query(table_name, [0.0, 0.0], k=1))
+    kept = asyncio.ensure_future(db.query(table_name, [4.0, 0.0], k=1))
+    await asyncio.sleep(0)
+    doomed.cancel()
+    assert (await kept)[0]["id"] == "p4"
+    assert db.pool_stats()["coalescing"]["queries"] == 1
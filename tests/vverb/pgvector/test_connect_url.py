@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import pytest
+
+import vverb
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_connect_by_url(pgvector_config: tuple[str, int, int]):
+    url = pgvector_config[0].replace("postgresql://", "pgvector://", 1)
+    db = await vverb.connect(url, max_pool_size=2)
+    try:
+        assert type(db).__name__ == "PgVectorAdapter"
+        assert db.pool_stats()["max_size"] == 2
+    finally:
+        await db.close()
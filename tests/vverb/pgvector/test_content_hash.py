@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from vverb.util.schema import (
+    FieldCol,
+    FieldType,
+    Metric,
+    PartitionSpec,
+    TableSchema,
+    VectorCol,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def _schema(name: str, **kw) -> TableSchema:
+    return TableSchema(
+        name,
+        VectorCol("embedding", 2, metric=Metric.L2),
+        fields=[FieldCol("tenant", FieldType.STRING), FieldCol("n", FieldType.INT)],
+        content_hash=True,
+        **kw,
+    )
+
+
+def _rows(n: int = 10, bump: tuple[int, ...] = ()) -> tuple[list, list, list]:
+    ids = [f"r{i}" for i in range(n)]
+    vectors = [[float(i), 1.0 if i in bump else 0.0] for i in range(n)]
+    metadata = [{"tenant": "acme", "n": i} for i in range(n)]
+    return ids, vectors, metadata
+
+
+async def _tuple_versions(db, name: str) -> dict[str, str]:
+    async with db.raw() as con:
+        rows = await con.fetch(f"SELECT id, xmin::text AS v FROM {name};")
+    return {r["id"]: r["v"] for r in rows}
+
+
+async def test_unchanged_rows_are_skipped(db, table_name):
+    await db.create_collection(_schema(table_name))
+    first = await db.upsert(table_name, *_rows())
+    assert (first["inserted"], first["updated"], first["unchanged"]) == (10, 0, 0)
+    before = await _tuple_versions(db, table_name)
+
+    ids, vectors, metadata = _rows(12, bump=(3,))
+    metadata[5]["n"] = 50
+    again = await db.upsert(table_name, ids, vectors, metadata)
+    assert (again["inserted"], again["updated"], again["unchanged"]) == (2, 2, 8)
+    assert again["written"] == 4
+
+    after = await _tuple_versions(db, table_name)
+    assert [i for i in before if before[i] != after[i]] == ["r3", "r5"]
+    hits = await db.query(table_name, [5.0, 0.0], k=1)
+    assert hits[0]["n"] == 50 and "vv_hash" not in hits[0]
+
+
+async def test_metadata_subset_counts_as_change(db, table_name):
+    await db.create_collection(_schema(table_name))
+    await db.upsert(table_name, *_rows(3))
+    ids, vectors, _ = _rows(3)
+    counts = await db.upsert(table_name, ids, vectors)  # vector only: a different write
+    assert counts["updated"] == 3
+    assert (await db.upsert(table_name, ids, vectors))["unchanged"] == 3
+
+
+async def test_skip_and_stream_modes(db, table_name):
+    await db.create_collection(_schema(table_name))
+    await db.upsert(table_name, *_rows(5))
+    skipped = await db.upsert(table_name, *_rows(6), if_exists="skip")
+    assert (skipped["inserted"], skipped["unchanged"]) == (1, 5)
+
+    async def source():
+        for row in zip(*_rows(8, bump=(0,)), strict=True):
+            yield row
+
+    streamed = await db.upsert_stream(table_name, source(), batch_size=3)
+    assert (streamed["inserted"], streamed["updated"], streamed["unchanged"]) == (2, 1, 5)
+
+
+async def test_partitioned_and_described(db, table_name):
+    await db.create_collection(_schema(table_name, partition=PartitionSpec("tenant")))
+    await db.upsert(table_name, *_rows(4))
+    assert (await db.upsert(table_name, *_rows(4)))["unchanged"] == 4
+
+    db._schemas.clear()
+    assert (await db._schema(table_name)).content_hash is True
+
+
+async def test_reserved_column(db, table_name):
+    schema = _schema(table_name)
+    schema.fields = [FieldCol("vv_hash", FieldType.STRING)]
+    with pytest.raises(ValueError, match="reserved"):
+        await db.create_collection(schema)
@@ -3,25 +3,12 @@ from __future__ import annotations
 import uuid
 
 import pytest
-import pytest_asyncio
 
-from vverb.pgvector import connect
 from vverb.util.schema import FieldCol, FieldType, Metric, TableSchema, VectorCol
 
 pytestmark = pytest.mark.asyncio
 
 
-@pytest_asyncio.fixture
-async def db(pgvector_config: tuple[str, int, int]):
-    dsn, min_pool_size, max_pool_size = pgvector_config
-    """Connected PgVectorAdapter instance."""
-    database = await connect(dsn=dsn, min_pool_size=min_pool_size, max_pool_size=max_pool_size)
-    try:
-        yield database
-    finally:
-        await database.close()
-
-
 async def test_create_table(db):
     """
     Ensure PgVectorAdapter.create_collection actually creates
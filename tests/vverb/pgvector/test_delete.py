@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+
+from vverb.cache import QueryCache
+from vverb.util.schema import (
+    FieldCol,
+    FieldType,
+    IndexSpec,
+    IndexType,
+    Metric,
+    PartitionSpec,
+    TableSchema,
+    VectorCol,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def _schema(name: str, **kw) -> TableSchema:
+    return TableSchema(
+        name,
+        VectorCol("embedding", 2, metric=Metric.L2, index=IndexSpec(IndexType.HNSW)),
+        fields=[FieldCol("tenant", FieldType.STRING), FieldCol("n", FieldType.INT)],
+        **kw,
+    )
+
+
+async def _fill(db, name: str, rows: int = 20) -> None:
+    await db.upsert(
+        name,
+        [f"r{i}" for i in range(rows)],
+        [[float(i), 0.0] for i in range(rows)],
+        [{"tenant": "acme" if i % 2 else "globex", "n": i} for i in range(rows)],
+    )
+
+
+async def _count(db, name: str) -> int:
+    async with db.raw() as con:
+        return await con.fetchval(f"SELECT count(*) FROM {name};")
+
+
+async def test_delete_chunked(db, table_name, monkeypatch):
+    await db.create_collection(_schema(table_name))
+    await _fill(db, table_name)
+    caps = db.capabilities()
+    monkeypatch.setattr(db, "capabilities", lambda: {**caps, "max_delete": 3})
+
+    ids = [f"r{i}" for i in range(10)] + ["missing"]
+    assert await db.delete(table_name, ids) == 10
+    assert await _count(db, table_name) == 10
+    assert await db.delete(table_name, []) == 0
+
+
+async def test_delete_invalidates_cache(db, table_name):
+    db.query_cache = QueryCache()
+    await db.create_collection(_schema(table_name))
+    await _fill(db, table_name, rows=3)
+    assert [h["id"] for h in await db.query(table_name, [0.0, 0.0], k=1)] == ["r0"]
+
+    await db.delete_where(table_name, {"n": 0})
+    assert [h["id"] for h in await db.query(table_name, [0.0, 0.0], k=1)] == ["r1"]
+
+
+async def test_delete_where(db, table_name):
+    await db.create_collection(_schema(table_name))
+    await _fill(db, table_name)
+
+    assert await db.delete_where(table_name, {"tenant": "acme", "n": {"$gte": 10}}) == 5
+    assert await db.delete_where(table_name, {"n": {"$in": [0, 2, 99]}}) == 2
+    assert await _count(db, table_name) == 13
+
+    with pytest.raises(ValueError, match="non-empty"):
+        await db.delete_where(table_name, {})
+
+
+async def test_delete_partitioned(db, table_name):
+    await db.create_collection(_schema(table_name, partition=PartitionSpec("tenant")))
+    await _fill(db, table_name)
+    await db.upsert(table_name, ["r0"], [[0.0, 0.0]], [{"tenant": "acme"}])
+
+    assert await db.delete_where(table_name, {"tenant": "acme", "id": "r0"}) == 1
+    assert await db.delete_where(table_name, {"tenant": "initech"}) == 0
+    assert await db.delete(table_name, ["r2", "r3"]) == 2
+    assert await _count(db, table_name) == 18  # r0 of globex stays
+
+
+async def test_maintain(db, table_name):
+    await db.create_collection(_schema(table_name))
+    await _fill(db, table_name, rows=200)
+    await db.delete(table_name, [f"r{i}" for i in range(150)])
+
+    report = await db.maintain(table_name, vacuum_ratio=0.0, reindex_ratio=0.0, dry_run=True)
+    assert {"live", "dead", "dead_ratio", "actions"} <= report.keys()
+
+    async with db.raw() as con:  # statistics are flushed asynchronously: ask directly
+        await con.execute(f"ANALYZE {table_name};")
+    stats = await db.dead_tuples(table_name)
+    assert stats["live"] == 50
+
+    with pytest.raises(ValueError):
+        await db.maintain(table_name, vacuum_ratio=0.5, reindex_ratio=0.1)
+
+
+async def test_maintain_reindexes_hnsw(db, table_name, monkeypatch):
+    await db.create_collection(_schema(table_name))
+    await _fill(db, table_name)
+
+    async def dead_tuples(name):
+        return {"live": 10, "dead": 10, "dead_ratio": 0.5, "last_vacuum": None}
+
+    monkeypatch.setattr(db, "dead_tuples", dead_tuples)
+    report = await db.maintain(table_name, vacuum_ratio=0.1, reindex_ratio=0.3)
+    assert report["actions"] == ["reindex", "vacuum"]
+    assert report["seconds"] >= 0
+    hits = await db.query(table_name, [3.0, 0.0], k=1)
+    assert [h["id"] for h in hits] == ["r3"]
+
+    report = await db.maintain(table_name, vacuum_ratio=0.1, reindex_ratio=0.6)
+    assert report["actions"] == ["vacuum"]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from vverb.exceptions import VectorIndexNotUsedError
+from vverb.pgvector import connect
+from vverb.util.schema import FieldCol, FieldType, IndexSpec, Metric, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def db(pgvector_config: tuple[str, int, int]):
+    """Adapter in strict index mode logging every search as slow."""
+    dsn, min_pool_size, max_pool_size = pgvector_config
+    database = await connect(
+        dsn=dsn,
+        min_pool_size=min_pool_size,
+        max_pool_size=max_pool_size,
+        slow_query_ms=0,
+        strict_index=True,
+    )
+    try:
+        yield database
+    finally:
+        await database.close()
+
+
+@pytest_asyncio.fixture
+async def table_name(db):
+    name = "vv_" + uuid.uuid4().hex[:8]
+    await db.create_collection(
+        TableSchema(
+            name,
+            VectorCol("embedding", 2, metric=Metric.L2, index=IndexSpec(m=8)),
+            fields=[FieldCol("n", FieldType.INT)],
+        )
+    )
+    await db.upsert(
+        name,
+        [f"p{i}" for i in range(2000)],
+        [[float(i), float(i % 13)] for i in range(2000)],
+        [{"n": i} for i in range(2000)],
+    )
+    async with db.raw() as con:
+        await con.execute(f"ANALYZE {name};")
+    yield name
+    async with db.raw() as con:
+        await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+async def test_explain_reports_index_use(db, table_name):
+    plan = await db.explain_query(table_name, [3.0, 3.0], k=5)
+    assert plan["index_used"] is True
+    assert plan["vector_indexes"] == [f"{table_name}_embedding_idx"]
+    assert plan["execution_ms"] is not None and plan["planning_ms"] is not None
+    assert plan["total_cost"] > 0 and plan["plan"]["Node Type"]
+
+    estimate = await db.explain_query(table_name, [3.0, 3.0], k=5, analyze=False)
+    assert estimate["index_used"] is True and estimate["execution_ms"] is None
+
+
+async def test_strict_mode_rejects_sequential_scans(db, table_name):
+    assert (await db.query(table_name, [3.0, 3.0], k=1))[0]["id"] == "p3"
+
+    async with db.raw() as con:
+        await con.execute(f"DROP INDEX {table_name}_embedding_idx;")
+    plan = await db.explain_query(table_name, [3.0, 3.0], k=1)
+    assert plan["index_used"] is False and plan["seq_scans"] == [table_name]
+
+    db._verified_plans.clear()
+    with pytest.raises(VectorIndexNotUsedError, match="no vector index") as err:
+        await db.query(table_name, [3.0, 3.0], k=1)
+    assert err.value.plan["seq_scans"] == [table_name]
+
+
+async def test_slow_queries_sample_plans(db, table_name):
+    await db.query(table_name, [3.0, 3.0], k=2, filter={"n": {"$lt": 100}})
+    while db._plan_tasks:
+        await asyncio.gather(*db._plan_tasks)
+    (entry,) = db.slow_queries
+    assert entry["collection"] == table_name and entry["elapsed_ms"] >= 0
+    assert entry["index_used"] is True and "ORDER BY" in entry["sql"]
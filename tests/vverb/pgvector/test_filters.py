@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from vverb.pgvector.filters import compile_filter
+from vverb.util.schema import FieldCol, FieldType, Metric, TableSchema, VectorCol
+
+SCHEMA = TableSchema(
+    table="docs",
+    vector=VectorCol("embedding", dim=2, metric=Metric.L2),
+    fields=[
+        FieldCol("lang", FieldType.STRING),
+        FieldCol("year", FieldType.INT),
+        FieldCol("meta", FieldType.JSON),
+    ],
+)
+
+
+@pytest_asyncio.fixture
+async def table(db):
+    name = "vv_" + uuid.uuid4().hex[:8]
+    await db.create_collection(TableSchema(name, SCHEMA.vector, SCHEMA.fields))
+    await db.upsert(
+        name,
+        ["a", "b", "c", "d"],
+        [[0, 0], [1, 0], [2, 0], [3, 0]],
+        [
+            {"lang": "en", "year": 2019, "meta": {"tags": ["x"]}},
+            {"lang": "de", "year": 2021, "meta": {"tags": ["x", "y"]}},
+            {"lang": "en", "year": 2022, "meta": {"tags": ["y"]}},
+            {"lang": None, "year": 2023, "meta": {}},
+        ],
+    )
+    yield name
+    async with db.raw() as con:
+        await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+async def _ids(db, table, filter):
+    return [h["id"] for h in await db.query(table, [0, 0], k=10, filter=filter)]
+
+
+@pytest.mark.asyncio
+async def test_filter_operators(db, table):
+    assert await _ids(db, table, {"lang": "en"}) == ["a", "c"]
+    assert await _ids(db, table, {"lang": None}) == ["d"]
+    assert await _ids(db, table, {"year": {"$gte": 2021, "$lt": 2023}}) == ["b", "c"]
+    assert await _ids(db, table, {"lang": {"$in": ["de", "fr"]}}) == ["b"]
+    assert await _ids(db, table, {"meta": {"$contains": {"tags": ["y"]}}}) == ["b", "c"]
+    assert await _ids(db, table, {"lang": "en", "year": {"$gt": 2020}}) == ["c"]
+
+
+@pytest.mark.asyncio
+async def test_query_many_with_filter(db, table):
+    hits = await db.query_many(table, [[0, 0], [3, 0]], k=1, filter={"lang": "en"})
+    assert [[h["id"] for h in group] for group in hits] == [["a"], ["c"]]
+
+
+def test_same_shape_same_sql():
+    sql_1, params_1 = compile_filter(SCHEMA, {"year": {"$gte": 1, "$lt": 2}, "lang": "en"})
+    sql_2, params_2 = compile_filter(SCHEMA, {"lang": "de", "year": {"$lt": 9, "$gte": 5}})
+    assert sql_1 == sql_2 == "lang = $1 AND year >= $2 AND year < $3"
+    assert (params_1, params_2) == (["en", 1, 2], ["de", 5, 9])
+
+
+def test_rejects_unknown_columns_and_operators():
+    with pytest.raises(ValueError):
+        compile_filter(SCHEMA, {"nope": 1})
+    with pytest.raises(ValueError):
+        compile_filter(SCHEMA, {"year": {"$like": 1}})
+    with pytest.raises(ValueError):
+        compile_filter(SCHEMA, {"lang": {"$contains": "x"}})
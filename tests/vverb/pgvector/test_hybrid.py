@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pytest
+
+from vverb.util.schema import (
+    FieldCol,
+    FieldType,
+    IndexSpec,
+    IndexType,
+    Metric,
+    PartitionSpec,
+    TableSchema,
+    VectorCol,
+)
+
+pytestmark = pytest.mark.asyncio
+
+DOCS = {
+    "cats": ([1.0, 0.0], "Cats purr and chase mice", "pets"),
+    "dogs": ([0.9, 0.1], "Dogs bark at the mailman", "pets"),
+    "tax": ([0.0, 1.0], "Filing your income tax return", "money"),
+    "pg": ([0.1, 0.9], "Postgres full text search with tsvector", "tech"),
+    "hnsw": ([0.5, 0.5], "HNSW graphs for approximate vector search", "tech"),
+}
+
+
+def _schema(name: str, **kw) -> TableSchema:
+    return TableSchema(
+        name,
+        VectorCol("embedding", 2, metric=Metric.L2, index=IndexSpec(IndexType.HNSW)),
+        fields=[
+            FieldCol("body", FieldType.STRING, full_text="english"),
+            FieldCol("topic", FieldType.STRING),
+        ],
+        **kw,
+    )
+
+
+async def _load(db, name: str, **kw) -> None:
+    await db.create_collection(_schema(name, **kw))
+    await db.upsert(
+        name,
+        list(DOCS),
+        [v for v, _, _ in DOCS.values()],
+        [{"body": body, "topic": topic} for _, body, topic in DOCS.values()],
+    )
+
+
+async def test_text_column_and_gin_index(db, table_name):
+    await _load(db, table_name)
+    async with db.raw() as con:
+        kinds = await con.fetch(
+            "SELECT am.amname FROM pg_index x JOIN pg_class c ON c.oid = x.indexrelid "
+            "JOIN pg_am am ON am.oid = c.relam WHERE x.indrelid = $1::regclass;",
+            table_name,
+        )
+    assert {"gin", "hnsw"} <= {r["amname"] for r in kinds}
+
+    hits = await db.query(table_name, [1.0, 0.0], k=1)
+    assert "body_tsv" not in hits[0]  # generated column stays internal
+
+    db._schemas.clear()
+    schema = await db._schema(table_name)
+    assert [(f.name, f.full_text) for f in schema.fields] == [("body", "english"), ("topic", None)]
+
+
+async def test_rrf_fuses_both_rankings(db, table_name):
+    await _load(db, table_name)
+
+    # "tax" is the farthest vector but the only text match: 1/65 + 1/61 beats 1/61
+    hits = await db.hybrid_query(table_name, [1.0, 0.0], "taxes", k=3)
+    assert len(hits) == 3
+    assert [h["id"] for h in hits] == ["tax", "cats", "dogs"]
+    tax = next(h for h in hits if h["id"] == "tax")
+    assert tax["text_score"] > 0 and tax["vector_score"] is not None
+    assert [h["score"] for h in hits] == sorted((h["score"] for h in hits), reverse=True)
+
+    # both rankings agree on "pg": it must win
+    hits = await db.hybrid_query(table_name, [0.1, 0.9], "postgres search", k=2)
+    assert hits[0]["id"] == "pg"
+    assert hits[0]["score"] == pytest.approx(2 / 61)
+
+    lazy = await db.hybrid_query(table_name, [0.1, 0.9], "postgres search", k=2, lazy=True)
+    assert sorted(lazy[0]) == ["id", "score", "text_score", "vector_score"]
+    await lazy.load()
+    assert lazy[0]["body"] == hits[0]["body"]
+
+
+async def test_linear_fusion_weights_and_filter(db, table_name):
+    await _load(db, table_name)
+
+    text_only = await db.hybrid_query(
+        table_name, [1.0, 0.0], "search", k=5, fusion="linear", weights=(0.0, 1.0)
+    )
+    assert {h["id"] for h in text_only[:2]} == {"hnsw", "pg"}
+    assert all(h["score"] == 0 for h in text_only[2:])
+
+    vector_only = await db.hybrid_query(
+        table_name, [1.0, 0.0], "vector search", k=2, fusion="linear", weights=(1.0, 0.0)
+    )
+    assert [h["id"] for h in vector_only] == ["cats", "dogs"]
+
+    tech = await db.hybrid_query(table_name, [1.0, 0.0], "search", k=5, filter={"topic": "tech"})
+    assert {h["id"] for h in tech} == {"hnsw", "pg"}
+
+    with pytest.raises(ValueError, match="fusion"):
+        await db.hybrid_query(table_name, [1.0, 0.0], "x", k=1, fusion="max")
+
+
+async def test_linear_fusion_min_max_scales_both_rankings(db, table_name):
+    """Best candidate of each ranking scores 1, worst 0, the rest in between."""
+    await _load(db, table_name)
+    query = "search or text or postgres"  # pg matches all three words, hnsw one
+    text = await db.hybrid_query(
+        table_name, [1.0, 0.0], query, k=5, fusion="linear", weights=(0.0, 1.0)
+    )
+    scores = {h["id"]: h["score"] for h in text if h["text_score"] is not None}
+    assert scores == {"pg": pytest.approx(1.0), "hnsw": pytest.approx(0.0)}
+
+    vector = await db.hybrid_query(
+        table_name, [1.0, 0.0], "search", k=5, fusion="linear", weights=(1.0, 0.0)
+    )
+    scores = {h["id"]: h["score"] for h in vector}
+    assert scores["cats"] == pytest.approx(1.0) and scores["tax"] == pytest.approx(0.0)
+    distance = {h["id"]: h["vector_score"] for h in vector}
+    span = distance["tax"] - distance["cats"]
+    assert scores["hnsw"] == pytest.approx(1 - (distance["hnsw"] - distance["cats"]) / span)
+
+
+async def test_hybrid_on_partitioned_collection(db, table_name):
+    await _load(db, table_name, partition=PartitionSpec("topic"))
+    hits = await db.hybrid_query(table_name, [0.0, 1.0], "income", k=5, filter={"topic": "money"})
+    assert [h["id"] for h in hits] == ["tax"]
+
+
+async def test_full_text_needs_a_string_field(db, table_name):
+    schema = TableSchema(
+        table_name,
+        VectorCol("embedding", 2),
+        fields=[FieldCol("n", FieldType.INT, full_text="english")],
+    )
+    with pytest.raises(ValueError, match="STRING"):
+        await db.create_collection(schema)
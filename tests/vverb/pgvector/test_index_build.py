@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from vverb.util.schema import (
+    FieldCol,
+    FieldType,
+    IndexSpec,
+    Metric,
+    PartitionSpec,
+    TableSchema,
+    VectorCol,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _indexes(db, table: str) -> dict[str, tuple[str, bool]]:
+    """index name → (definition, valid) for *table* and its partitions."""
+    async with db.raw() as con:
+        rows = await con.fetch(
+            "SELECT c.relname, pg_get_indexdef(x.indexrelid) AS def, x.indisvalid "
+            "FROM pg_index x JOIN pg_class c ON c.oid = x.indexrelid "
+            "WHERE (x.indrelid = $1::regclass OR x.indrelid IN "
+            "(SELECT inhrelid FROM pg_inherits WHERE inhparent = $1::regclass)) "
+            "AND NOT x.indisprimary;",
+            table,
+        )
+    return {r["relname"]: (r["def"], r["indisvalid"]) for r in rows}
+
+
+async def _collection(db, name: str, **kw) -> None:
+    schema = TableSchema(
+        name,
+        VectorCol("embedding", 2, metric=Metric.L2, index=IndexSpec(m=8)),
+        fields=[
+            FieldCol("tenant", FieldType.STRING),
+            FieldCol("body", FieldType.STRING, full_text="english"),
+        ],
+        **kw,
+    )
+    await db.create_collection(schema, defer_index=True)
+    await db.upsert(
+        name,
+        [str(i) for i in range(200)],
+        [[float(i), float(i % 7)] for i in range(200)],
+        [{"tenant": f"t{i % 3}", "body": f"row {i}"} for i in range(200)],
+    )
+
+
+async def test_concurrent_build(db, table_name):
+    await _collection(db, table_name)
+    assert await _indexes(db, table_name) == {}
+
+    await db.build_index(table_name, index=IndexSpec(m=12, maintenance_work_mem="32MB"))
+    built = await _indexes(db, table_name)
+    assert set(built) == {f"{table_name}_embedding_idx", f"{table_name}_body_tsv_idx"}
+    assert all(valid for _, valid in built.values())
+    assert "m='12'" in built[f"{table_name}_embedding_idx"][0]
+
+    async with db.raw() as con:  # session settings were reset after the build
+        assert await con.fetchval("SHOW maintenance_work_mem;") != "32MB"
+    hits = await db.query(table_name, [3.0, 3.0], k=1)
+    assert hits[0]["id"] == "3"
+
+
+async def test_invalid_leftover_is_rebuilt(db, table_name):
+    await _collection(db, table_name)
+    index = f"{table_name}_embedding_idx"
+    async with db.raw() as con:
+        await con.execute(
+            f"CREATE INDEX {index} ON {table_name} USING hnsw (embedding vector_l2_ops);"
+        )
+        await con.execute(
+            "UPDATE pg_index SET indisvalid = false WHERE indexrelid = $1::regclass;", index
+        )
+    await db.build_index(table_name)
+    assert (await _indexes(db, table_name))[index][1] is True
+
+
+async def test_rebuild_swaps_index(db, table_name):
+    await _collection(db, table_name)
+    await db.build_index(table_name)
+    index = f"{table_name}_embedding_idx"
+    assert "m='8'" in (await _indexes(db, table_name))[index][0]
+
+    await db.rebuild_index(table_name, index=IndexSpec(m=16, ef_construction=40))
+    built = await _indexes(db, table_name)
+    assert "m='16'" in built[index][0] and built[index][1]
+    assert f"{index}_new" not in built
+    assert (await db._schema(table_name)).vector.index.m == 16
+    assert (await db.query(table_name, [5.0, 5.0], k=1))[0]["id"] == "5"
+
+
+async def test_rebuild_replaces_valid_leftover(db, table_name):
+    """A valid _new index left by an interrupted rebuild is not swapped in."""
+    await _collection(db, table_name)
+    await db.build_index(table_name)
+    index = f"{table_name}_embedding_idx"
+    async with db.raw() as con:
+        await con.execute(
+            f"CREATE INDEX {index}_new ON {table_name} "
+            "USING hnsw (embedding vector_l2_ops) WITH (m='4');"
+        )
+    await db.rebuild_index(table_name, index=IndexSpec(m=16))
+    built = await _indexes(db, table_name)
+    assert "m='16'" in built[index][0] and f"{index}_new" not in built
+
+
+async def test_partitioned_build(db, table_name):
+    await _collection(db, table_name, partition=PartitionSpec("tenant"))
+    await db.build_index(table_name)
+    built = await _indexes(db, table_name)
+    vector = [name for name, (d, _) in built.items() if "hnsw" in d]
+    assert len(vector) == 4  # parent + three partitions
+    assert all(valid for _, valid in built.values())
+
+    async with db.raw() as con:  # built but never attached by an interrupted rebuild
+        part = await con.fetchval(
+            "SELECT min(inhrelid::regclass::text) FROM pg_inherits "
+            "WHERE inhparent = $1::regclass;",
+            table_name,
+        )
+        await con.execute(
+            f"CREATE INDEX {part}_embedding_idx_new ON {part} "
+            "USING hnsw (embedding vector_l2_ops) WITH (m='4');"
+        )
+    await db.rebuild_index(table_name, index=IndexSpec(m=6))
+    rebuilt = await _indexes(db, table_name)
+    assert sorted(rebuilt) == sorted(built)
+    assert all("m='6'" in d for d, _ in rebuilt.values() if "hnsw" in d)
+
+
+async def test_index_progress(db, table_name):
+    await _collection(db, table_name)
+    assert [p async for p in db.index_progress(table_name)] == []  # nothing running
+
+    task = asyncio.create_task(db.build_index(table_name))
+    reports = [p async for p in db.index_progress(table_name, interval=0.01, build=task)]
+    await task
+    assert task.done()
+    for report in reports:
+        assert report["table"] == table_name and report["phase"]
+        assert report["fraction"] is None or 0.0 <= report["fraction"] <= 1.0
+
+    with pytest.raises(ValueError, match="interval"):
+        [p async for p in db.index_progress(table_name, interval=0)]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from vverb.util.schema import IndexSpec, IndexType, Metric, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _indexdef(db, table: str) -> str | None:
+    async with db.raw() as con:
+        return await con.fetchval(
+            "SELECT indexdef FROM pg_indexes WHERE tablename = $1 AND indexname LIKE '%_idx';",
+            table,
+        )
+
+
+async def test_hnsw_build_options(db, table_name):
+    spec = IndexSpec(m=8, ef_construction=32, maintenance_work_mem="64MB")
+    await db.create_collection(
+        TableSchema(table_name, VectorCol("embedding", dim=3, metric=Metric.L2, index=spec))
+    )
+    indexdef = await _indexdef(db, table_name)
+    assert "USING hnsw" in indexdef and "vector_l2_ops" in indexdef
+    assert "m='8'" in indexdef and "ef_construction='32'" in indexdef
+
+
+async def test_deferred_ivfflat_index(db, table_name):
+    spec = IndexSpec(kind=IndexType.IVFFLAT, lists=2)
+    await db.create_collection(
+        TableSchema(table_name, VectorCol("embedding", dim=3, index=spec)), defer_index=True
+    )
+    assert await _indexdef(db, table_name) is None
+
+    await db.upsert(table_name, ["a", "b", "c"], [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    await db.build_index(table_name)
+
+    indexdef = await _indexdef(db, table_name)
+    assert "USING ivfflat" in indexdef and "lists='2'" in indexdef
+
+
+async def test_search_params_applied_per_query(db, table_name):
+    await db.create_collection(TableSchema(table_name, VectorCol("embedding", dim=3)))
+    await db.upsert(table_name, ["a", "b"], [[1, 0, 0], [0, 1, 0]])
+
+    hits = await db.query(table_name, [1, 0, 0], k=1, search_params={"ef_search": 100})
+    assert hits[0]["id"] == "a"
+
+    with pytest.raises(ValueError):
+        await db.query(table_name, [1, 0, 0], k=1, search_params={"bogus": 1})
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from vverb.instrument import Instrumentation
+from vverb.pgvector import connect
+from vverb.util.schema import TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_adapter_stats_split_db_and_client_time(pgvector_config: tuple[str, int, int]):
+    dsn, min_pool_size, max_pool_size = pgvector_config
+    db = await connect(
+        dsn=dsn,
+        min_pool_size=min_pool_size,
+        max_pool_size=max_pool_size,
+        instrumentation=Instrumentation(),
+    )
+    name = "vv_" + uuid.uuid4().hex[:8]
+    try:
+        await db.create_collection(TableSchema(name, VectorCol("embedding", dim=4)))
+        await db.upsert(name, ["a", "b"], [[1, 0, 0, 0], [0, 1, 0, 0]])
+        await db.query(name, [1, 0, 0, 0], k=2)
+
+        stats = db.stats()
+        verbs = stats["verbs"]
+        assert set(verbs) >= {"connect", "create_collection", "upsert", "query"}
+        assert verbs["upsert"]["rows"] == 2 and verbs["upsert"]["bytes"] == 32
+        assert verbs["query"]["rows"] == 2
+        assert verbs["query"]["db"]["sum"] > 0
+        assert verbs["query"]["latency"]["sum"] >= verbs["query"]["db"]["sum"]
+        assert stats["pool"]["acquires"] >= 3
+    finally:
+        async with db.raw() as con:
+            await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+        await db.close()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import uuid
+from array import array
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from vverb.util.schema import FieldCol, FieldType, Metric, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def table(db):
+    name = "vv_" + uuid.uuid4().hex[:8]
+    await db.create_collection(
+        TableSchema(
+            table=name,
+            vector=VectorCol("embedding", dim=4, metric=Metric.L2),
+            fields=[FieldCol("title", FieldType.STRING)],
+        )
+    )
+    yield name
+    async with db.raw() as con:
+        await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+async def test_ndarray_roundtrip(db, table):
+    """float32 matrices go in without list conversion and come back as arrays."""
+    vectors = np.arange(40, dtype=np.float32).reshape(10, 4)
+    ids = [f"r{i}" for i in range(10)]
+    await db.upsert(table, ids, vectors, [{"title": i} for i in ids])
+
+    hits = await db.query(table, vectors[3], k=3)
+    assert hits[0]["id"] == "r3" and {h["id"] for h in hits[1:]} == {"r2", "r4"}
+    np.testing.assert_array_equal(hits[0]["embedding"], vectors[3])
+    assert hits[0]["score"] == 0.0
+
+    cols = await db.query(table, vectors[3], k=3, as_numpy=True)
+    assert cols["id"][0] == "r3"
+    assert cols["embedding"].shape == (3, 4) and cols["embedding"].dtype == np.float32
+    np.testing.assert_allclose(cols["score"], [0.0, 8.0, 8.0])
+
+
+async def test_buffer_protocol_inputs(db, table):
+    """array.array / memoryview vectors are accepted as well as lists."""
+    await db.upsert(table, ["a", "b"], [array("f", [1, 0, 0, 0]), [0.0, 1.0, 0.0, 0.0]])
+    hits = await db.query(table, memoryview(array("f", [0, 1, 0, 0])), k=1)
+    assert hits[0]["id"] == "b"
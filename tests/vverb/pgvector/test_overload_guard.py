@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from vverb.pgvector import connect
+from vverb.util.schema import TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def db(pgvector_config: tuple[str, int, int]):
+    """Adapter with every part of the overload guard turned on."""
+    database = await connect(
+        dsn=pgvector_config[0],
+        max_pool_size=4,
+        concurrency_limit=2,
+        retries=2,
+        breaker_threshold=3,
+    )
+    try:
+        yield database
+    finally:
+        await database.close()
+
+
+async def test_overload_guard(db, table_name):
+    await db.create_collection(TableSchema(table_name, VectorCol("embedding", dim=3)))
+    await db.upsert(table_name, ["a", "b"], [[1, 0, 0], [0, 1, 0]])
+    results = await asyncio.gather(*(db.query(table_name, [1, 0, 0], k=1) for _ in range(10)))
+    assert all(hits[0]["id"] == "a" for hits in results)
+
+    guard = db.stats()["guard"]
+    assert guard["limiter"]["in_flight"] == 0 and 1 <= guard["limiter"]["limit"] <= 2
+    assert guard["limiter"]["queued"] >= 1  # ten queries, at most two at a time
+    assert guard["breaker"] == {"state": "closed", "failures": 0, "opened": 0, "rejected": 0}
+    assert guard["retries"] == 0
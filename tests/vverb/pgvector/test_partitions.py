@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from vverb.pgvector.core import _partition_name
+from vverb.util.schema import (
+    FieldCol,
+    FieldType,
+    Metric,
+    PartitionKind,
+    PartitionSpec,
+    TableSchema,
+    VectorCol,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def _schema(name: str, partition: PartitionSpec) -> TableSchema:
+    return TableSchema(
+        name,
+        VectorCol("embedding", 2, metric=Metric.L2),
+        fields=[FieldCol("tenant", FieldType.STRING), FieldCol("n", FieldType.INT)],
+        partition=partition,
+    )
+
+
+async def _partitions(db, name: str) -> list[str]:
+    async with db.raw() as con:
+        rows = await con.fetch(
+            "SELECT inhrelid::regclass::text AS part FROM pg_inherits "
+            "WHERE inhparent = $1::regclass ORDER BY 1;",
+            name,
+        )
+    return [r["part"] for r in rows]
+
+
+async def test_list_partitions_created_on_upsert(db, table_name):
+    await db.create_collection(_schema(table_name, PartitionSpec("tenant")))
+    assert await _partitions(db, table_name) == []
+
+    await db.upsert(
+        table_name,
+        ["a", "a", "b"],
+        [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]],
+        [{"tenant": "acme", "n": 1}, {"tenant": "Globex Corp.", "n": 2}, {"tenant": "acme"}],
+    )
+    parts = await _partitions(db, table_name)
+    assert len(parts) == 2
+    assert any("_p_acme_" in p for p in parts)
+    assert any("_p_globex_corp_" in p for p in parts)
+
+    async with db.raw() as con:
+        indexed = await con.fetchval(
+            "SELECT count(*) FROM pg_index x JOIN pg_inherits i ON i.inhrelid = x.indrelid "
+            "WHERE i.inhparent = $1::regclass AND NOT x.indisprimary;",
+            table_name,
+        )
+    assert indexed == 2  # one vector index per partition
+
+
+async def test_same_id_in_two_partitions(db, table_name):
+    await db.create_collection(_schema(table_name, PartitionSpec("tenant")))
+    await db.upsert(
+        table_name,
+        ["a", "a"],
+        [[0.0, 0.0], [1.0, 1.0]],
+        [{"tenant": "acme", "n": 1}, {"tenant": "globex", "n": 2}],
+    )
+    await db.upsert(table_name, ["a"], [[0.5, 0.5]], [{"tenant": "acme", "n": 3}])
+
+    hits = await db.query(table_name, [0.0, 0.0], k=10)
+    assert sorted((h["tenant"], h["n"]) for h in hits) == [("acme", 3), ("globex", 2)]
+
+
+async def test_routed_query(db, table_name):
+    await db.create_collection(_schema(table_name, PartitionSpec("tenant")))
+    await db.upsert(
+        table_name,
+        ["a", "b", "c"],
+        [[0.0, 0.0], [0.1, 0.1], [5.0, 5.0]],
+        [{"tenant": "acme"}, {"tenant": "globex"}, {"tenant": "acme"}],
+    )
+
+    for flt in ({"tenant": "acme"}, {"tenant": {"$eq": "acme"}}, {"tenant": {"$in": ["acme"]}}):
+        hits = await db.query(table_name, [0.0, 0.0], k=10, filter=flt)
+        assert [h["id"] for h in hits] == ["a", "c"]
+
+    both = await db.query(table_name, [0.0, 0.0], k=10, filter={"tenant": {"$ne": "acme"}})
+    assert [h["id"] for h in both] == ["b"]
+
+    many = await db.query_many(table_name, [[0.0, 0.0], [5.0, 5.0]], k=1, filter={"tenant": "acme"})
+    assert [[h["id"] for h in hits] for hits in many] == [["a"], ["c"]]
+
+    assert await db.query(table_name, [0.0, 0.0], k=10, filter={"tenant": "initech"}) == []
+
+
+async def test_partition_names_follow_the_key_type(db, table_name):
+    schema = TableSchema(
+        table_name,
+        VectorCol("embedding", 2),
+        fields=[FieldCol("n", FieldType.INT), FieldCol("flag", FieldType.BOOLEAN)],
+        partition=PartitionSpec("n"),
+    )
+    assert len({_partition_name(schema, v) for v in (1, 1.0, "1", " 1.0")}) == 1
+    with pytest.raises(ValueError, match="int value 1.5"):
+        _partition_name(schema, 1.5)
+
+    flagged = dataclasses.replace(schema, partition=PartitionSpec("flag"))
+    assert len({_partition_name(flagged, v) for v in (True, "true", "t", 1)}) == 1
+    assert _partition_name(flagged, False) != _partition_name(flagged, True)
+
+
+async def test_unknown_partition_falls_back_to_parent(db, table_name):
+    await db.create_collection(_schema(table_name, PartitionSpec("tenant")))
+    async with db.raw() as con:  # a partition vverb did not name
+        await con.execute(
+            f"CREATE TABLE {table_name}_legacy PARTITION OF {table_name} FOR VALUES IN ('acme');"
+        )
+    await db.upsert(table_name, ["a", "b"], [[0.0, 0.0], [1.0, 1.0]], [{"tenant": "acme"}] * 2)
+    assert await _partitions(db, table_name) == [f"{table_name}_legacy"]
+
+    hits = await db.query(table_name, [0.0, 0.0], k=10, filter={"tenant": "acme"})
+    assert [h["id"] for h in hits] == ["a", "b"]
+
+
+async def test_partition_key_required(db, table_name):
+    await db.create_collection(_schema(table_name, PartitionSpec("tenant")))
+    with pytest.raises(ValueError, match="partition key"):
+        await db.upsert(table_name, ["a"], [[0.0, 0.0]], [{"n": 1}])
+
+
+async def test_hash_partitions(db, table_name):
+    await db.create_collection(_schema(table_name, PartitionSpec("tenant", PartitionKind.HASH, 4)))
+    assert len(await _partitions(db, table_name)) == 4
+
+    tenants = [f"t{i}" for i in range(20)]
+    await db.upsert(
+        table_name,
+        ["x"] * 20,
+        [[float(i), 0.0] for i in range(20)],
+        [{"tenant": t} for t in tenants],
+    )
+    hits = await db.query(table_name, [3.0, 0.0], k=1, filter={"tenant": "t3"})
+    assert [(h["id"], h["tenant"]) for h in hits] == [("x", "t3")]
+
+
+async def test_describe_round_trip(db, table_name):
+    spec = PartitionSpec("tenant", PartitionKind.HASH, 3)
+    await db.create_collection(_schema(table_name, spec))
+    db._schemas.clear()
+
+    schema = await db._schema(table_name)
+    assert schema.id_field == "id"
+    assert schema.partition == spec
+
+
+async def test_bad_partition_key(db, table_name):
+    with pytest.raises(ValueError, match="not a field"):
+        await db.create_collection(_schema(table_name, PartitionSpec("region")))
@@ -1,33 +1,10 @@
 from __future__ import annotations
 
 import pytest
-import pytest_asyncio
-
-# modern import: adapter-specific entry-point
-from vverb.pgvector import connect
 
 pytestmark = pytest.mark.asyncio
 
 
-# ───────────────────────────────────────────────
-# Fixtures
-# ───────────────────────────────────────────────
-@pytest_asyncio.fixture
-async def db(pgvector_config: tuple[str, int, int]):
-    """Yield a connected PgVectorAdapter instance."""
-    dsn, min_pool_size, max_pool_size = pgvector_config
-
-    database = await connect(
-        dsn=dsn,
-        min_pool_size=min_pool_size,
-        max_pool_size=max_pool_size,
-    )
-    try:
-        yield database
-    finally:
-        await database.close()
-
-
 # ───────────────────────────────────────────────
 # Tests
 # ───────────────────────────────────────────────
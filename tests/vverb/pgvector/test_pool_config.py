@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from vverb.pgvector import connect
+from vverb.util.schema import TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_pool_warmup_and_wait_stats(pgvector_config: tuple[str, int, int]):
+    """New connections are opened up front with hot statements already prepared."""
+    dsn = pgvector_config[0]
+    name = "vv_" + uuid.uuid4().hex[:8]
+
+    setup = await connect(dsn=dsn)
+    await setup.create_collection(TableSchema(name, VectorCol("embedding", dim=3)))
+    await setup.close()
+
+    db = await connect(
+        dsn=dsn,
+        min_pool_size=2,
+        max_pool_size=4,
+        command_timeout=30,
+        statement_cache_size=50,
+        warm_collections=[name],
+    )
+    try:
+        stats = db.pool_stats()
+        assert stats["size"] == 2 and stats["max_size"] == 4
+
+        async with db.raw() as con:
+            prepared = await con.fetchval(
+                "SELECT count(*) FROM pg_prepared_statements WHERE statement LIKE $1;",
+                f"%FROM {name} %LIMIT $2%",
+            )
+        assert prepared >= 1
+        assert db.pool_stats()["acquires"] >= 1
+        assert db.pool_stats()["wait_total"] >= 0.0
+
+        hits = await db.query(name, [1, 0, 0], k=1)
+        assert hits == []
+    finally:
+        async with db.raw() as con:
+            await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+        await db.close()
+
+
+async def test_missing_warm_collection_is_skipped(pgvector_config: tuple[str, int, int], caplog):
+    """A warm_collections entry naming no table leaves the pool usable."""
+    missing = "vv_" + uuid.uuid4().hex[:8]
+    db = await connect(
+        dsn=pgvector_config[0], min_pool_size=2, max_pool_size=3, warm_collections=[missing]
+    )
+    try:
+        assert db.pool_stats()["size"] == 2
+        assert sum(f"not warming collection {missing}" in r.message for r in caplog.records) == 1
+        async with db.raw() as con:
+            assert await con.fetchval("SELECT 1;") == 1
+    finally:
+        await db.close()
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [
+        {"slow_query_sample": 1.5},
+        {"concurrency_limit": 0},
+        {"breaker_threshold": 0},
+        {"coalesce_window": -1.0},
+        {"replicas": ["postgresql://replica"], "replica_balance": "random"},
+    ],
+)
+async def test_bad_arguments_open_no_pool(monkeypatch, bad):
+    """Arguments are checked before any connection is made."""
+
+    async def create_pool(*args, **kw):
+        raise AssertionError("pool created before the argument check")
+
+    monkeypatch.setattr("vverb.pgvector.core.asyncpg.create_pool", create_pool)
+    with pytest.raises(ValueError):
+        await connect(dsn="postgresql://unused", **bad)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from vverb.pgvector.results import LazyHits
+from vverb.util.schema import (
+    FieldCol,
+    FieldType,
+    Metric,
+    PartitionSpec,
+    TableSchema,
+    VectorCol,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _collection(db, name: str, **kw) -> None:
+    await db.create_collection(
+        TableSchema(
+            name,
+            VectorCol("embedding", 2, metric=Metric.L2),
+            fields=[
+                FieldCol("tenant", FieldType.STRING),
+                FieldCol("n", FieldType.INT),
+                FieldCol("payload", FieldType.JSON),
+            ],
+            **kw,
+        )
+    )
+    await db.upsert(
+        name,
+        [f"p{i}" for i in range(10)],
+        [[float(i), 0.0] for i in range(10)],
+        [{"tenant": f"t{i % 2}", "n": i, "payload": {"text": "x" * i}} for i in range(10)],
+    )
+
+
+async def test_include_and_exclude(db, table_name):
+    await _collection(db, table_name)
+    hits = await db.query(table_name, [2.2, 0.0], k=2, include=())
+    assert [sorted(h) for h in hits] == [["id", "score"]] * 2
+    assert [h["id"] for h in hits] == ["p2", "p3"]
+
+    hits = await db.query(table_name, [2.0, 0.0], k=1, include=["n"])
+    assert hits == [{"id": "p2", "n": 2, "score": 0.0}]
+
+    hits = await db.query(table_name, [2.0, 0.0], k=1, exclude=["embedding", "payload"])
+    assert sorted(hits[0]) == ["id", "n", "score", "tenant"]
+
+    cols = await db.query(table_name, [2.0, 0.0], k=3, include=["n"], as_numpy=True)
+    assert sorted(cols) == ["id", "n", "score"] and isinstance(cols["score"], np.ndarray)
+
+    many = await db.query_many(table_name, [[1.0, 0.0], [8.0, 0.0]], k=1, include=())
+    assert [[sorted(h) for h in hits] for hits in many] == [[["id", "score"]]] * 2
+
+    with pytest.raises(ValueError, match="Unknown columns"):
+        await db.query(table_name, [2.0, 0.0], k=1, include=["nope"])
+    with pytest.raises(ValueError, match="not both"):
+        await db.query(table_name, [2.0, 0.0], k=1, include=["n"], exclude=["payload"])
+    with pytest.raises(ValueError, match="key columns"):
+        await db.query(table_name, [2.0, 0.0], k=1, exclude=["id"])
+
+
+async def test_lazy_hits_load_once(db, table_name):
+    await _collection(db, table_name)
+    hits = await db.query(table_name, [2.8, 0.0], k=3, lazy=True, include=["n"])
+    assert isinstance(hits, LazyHits) and not hits.loaded
+    assert hits.missing == ["embedding", "tenant", "payload"]
+    assert [(h["id"], h["n"]) for h in hits] == [("p3", 3), ("p2", 2), ("p4", 4)]
+    assert "payload" not in hits[0]
+
+    await db.delete(table_name, ["p4"])
+    loaded = await asyncio.gather(hits.load(), hits.load())
+    assert loaded[0] is hits and hits.loaded
+    assert hits[0]["tenant"] == "t1" and hits[0]["embedding"].tolist() == [3.0, 0.0]
+    assert hits[1]["payload"] is not None
+    assert hits[2]["payload"] is None  # deleted after the search
+
+    with pytest.raises(ValueError, match="as_numpy"):
+        await db.query(table_name, [3.0, 0.0], k=3, lazy=True, as_numpy=True)
+
+
+async def test_lazy_partitioned(db, table_name):
+    await _collection(db, table_name, partition=PartitionSpec("tenant"))
+    hits = await db.query(table_name, [4.8, 0.0], k=2, lazy=True)
+    assert [sorted(h) for h in hits] == [["id", "score", "tenant"]] * 2
+    await hits.load()
+    assert [h["n"] for h in hits] == [5, 4]
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from vverb.pgvector import connect
+from vverb.util.schema import IndexSpec, IndexType, Metric, Precision, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def halfvec(db):
+    """halfvec, bit operators and binary_quantize need pgvector 0.7+."""
+    async with db.raw() as con:
+        version = await con.fetchval("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+    if tuple(int(p) for p in version.split(".")[:2]) < (0, 7):
+        pytest.skip(f"pgvector {version} has no halfvec / bit support")
+
+
+async def test_binary_storage_needs_a_bit_metric(db, table_name):
+    with pytest.raises(ValueError, match="binary"):
+        await db.create_collection(
+            TableSchema(table_name, VectorCol("embedding", 8, precision=Precision.BINARY))
+        )
+
+
+async def test_halfvec_storage(db, table_name, halfvec):
+    schema = TableSchema(
+        table_name, VectorCol("embedding", 3, metric=Metric.L2, precision=Precision.HALF)
+    )
+    await db.create_collection(schema)
+    await db.upsert(table_name, ["a", "b"], np.array([[0.1, 0.0, 0.0], [5.0, 0.0, 0.0]]))
+
+    hits = await db.query(table_name, [0.0, 0.0, 0.0], k=2)
+    assert [h["id"] for h in hits] == ["a", "b"]
+    assert hits[0]["embedding"].dtype == np.float32
+    assert hits[0]["embedding"][0] == pytest.approx(0.1, abs=1e-3)
+
+    async with db.raw() as con:
+        column_type = await con.fetchval(
+            "SELECT format_type(atttypid, atttypmod) FROM pg_attribute "
+            "WHERE attrelid = $1::regclass AND attname = 'embedding';",
+            table_name,
+        )
+    assert column_type == "halfvec(3)"
+
+
+async def test_bit_storage_hamming(db, table_name, halfvec):
+    schema = TableSchema(
+        table_name,
+        VectorCol("embedding", 4, metric=Metric.HAMMING, precision=Precision.BINARY),
+    )
+    await db.create_collection(schema)
+    await db.upsert(
+        table_name, ["a", "b"], [[1.0, -1.0, 1.0, -1.0], [1.0, 1.0, 1.0, 1.0]]
+    )  # stored as 1010 / 1111
+
+    hits = await db.query(table_name, [0.5, -2.0, 0.5, -3.0], k=2)  # 1010
+    assert [(h["id"], h["score"]) for h in hits] == [("a", 0.0), ("b", 2.0)]
+
+    cols = await db.query(table_name, [1.0, -1.0, 1.0, -1.0], k=1, as_numpy=True)
+    assert cols["id"] == ["a"]
+    assert cols["embedding"].tolist() == [[1.0, 0.0, 1.0, 0.0]]
+
+
+async def test_binary_quantized_index_reranks_exactly(db, table_name, halfvec):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(300, 16)).astype(np.float32)
+    spec = IndexSpec(quantization=Precision.BINARY)
+    await db.create_collection(TableSchema(table_name, VectorCol("embedding", 16, index=spec)))
+    await db.upsert(table_name, [f"v{i}" for i in range(300)], vectors)
+
+    async with db.raw() as con:
+        indexdef = await con.fetchval(
+            "SELECT indexdef FROM pg_indexes WHERE tablename = $1 AND indexname LIKE '%_idx';",
+            table_name,
+        )
+    assert "binary_quantize" in indexdef and "bit_hamming_ops" in indexdef
+
+    # oversampling the whole table makes the rerank exhaustive, hence exact
+    query = vectors[42]
+    hits = await db.query(table_name, query, k=5, search_params={"oversample": 60})
+    cosine = 1 - vectors @ query / np.linalg.norm(vectors, axis=1) / np.linalg.norm(query)
+    assert [h["id"] for h in hits] == [f"v{i}" for i in np.argsort(cosine)[:5]]
+    assert [h["score"] for h in hits] == pytest.approx(np.sort(cosine)[:5], abs=1e-5)
+
+    many = await db.query_many(table_name, vectors[[42, 7]], k=5, search_params={"oversample": 60})
+    assert [h["id"] for h in many[0]] == [h["id"] for h in hits]
+    assert many[1][0]["id"] == "v7"
+
+    # a fresh adapter rediscovers precision, quantization and metric from the catalog
+    fresh = await connect(dsn=db.cfg["dsn"])
+    try:
+        vec = (await fresh._schema(table_name)).vector
+    finally:
+        await fresh.close()
+    assert (vec.precision, vec.index.quantization, vec.metric) == (
+        Precision.FULL,
+        Precision.BINARY,
+        Metric.COSINE,
+    )
+
+
+async def test_halfvec_quantized_index(db, table_name, halfvec):
+    spec = IndexSpec(kind=IndexType.HNSW, quantization=Precision.HALF)
+    await db.create_collection(
+        TableSchema(table_name, VectorCol("embedding", 3, metric=Metric.L2, index=spec))
+    )
+    await db.upsert(table_name, [f"p{i}" for i in range(10)], [[float(i), 0, 0] for i in range(10)])
+
+    hits = await db.query(table_name, [4.2, 0.0, 0.0], k=2)
+    assert [h["id"] for h in hits] == ["p4", "p5"]
+    assert hits[0]["score"] == pytest.approx(0.2, abs=1e-6)  # exact, not float16
+
+    ids_only = await db.query(table_name, [4.2, 0.0, 0.0], k=2, include=())
+    assert [sorted(h) for h in ids_only] == [["id", "score"]] * 2  # reranked without the vector
+    assert [h["score"] for h in ids_only] == [h["score"] for h in hits]
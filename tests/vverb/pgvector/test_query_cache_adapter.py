@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from vverb.cache import QueryCache
+from vverb.pgvector import connect
+from vverb.util.schema import FieldCol, FieldType, Metric, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def db(pgvector_config: tuple[str, int, int]):
+    """Connected PgVectorAdapter instance with a result cache."""
+    dsn, min_pool_size, max_pool_size = pgvector_config
+    database = await connect(
+        dsn=dsn,
+        min_pool_size=min_pool_size,
+        max_pool_size=max_pool_size,
+        query_cache=QueryCache(ttl=60),
+    )
+    try:
+        yield database
+    finally:
+        await database.close()
+
+
+async def test_cache_hits_and_write_invalidation(db):
+    name = "vv_" + uuid.uuid4().hex[:8]
+    await db.create_collection(TableSchema(name, VectorCol("embedding", dim=2, metric=Metric.L2)))
+    try:
+        await db.upsert(name, ["a"], [[0, 0]])
+        first = await db.query(name, [0, 0], k=5)
+        again = await db.query(name, [0, 0], k=5)
+        assert again is first
+        assert db.query_cache.stats()["hits"] == 1
+
+        await db.upsert(name, ["b"], [[0, 1]])
+        fresh = await db.query(name, [0, 0], k=5)
+        assert [h["id"] for h in fresh] == ["a", "b"]
+    finally:
+        async with db.raw() as con:
+            await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+async def test_lazy_hits_are_not_shared_through_the_cache(db, table_name):
+    """Two callers of one cache entry load their hits independently."""
+    await db.create_collection(
+        TableSchema(
+            table_name,
+            VectorCol("embedding", dim=2, metric=Metric.L2),
+            fields=[FieldCol("payload", FieldType.STRING)],
+        )
+    )
+    await db.upsert(table_name, ["a", "b"], [[0, 0], [0, 1]], [{"payload": "x"}, {"payload": "y"}])
+    first = await db.query(table_name, [0, 0], k=2, lazy=True, include=())
+    size = db.query_cache.stats()["bytes"]
+    await first.load()
+    assert [h["payload"] for h in first] == ["x", "y"]
+
+    second = await db.query(table_name, [0, 0], k=2, lazy=True, include=())
+    assert db.query_cache.stats()["hits"] == 1
+    assert second is not first and not second.loaded
+    assert "payload" not in second[0]
+    assert db.query_cache.stats()["bytes"] == size
+
+    await second.load()
+    assert [h["payload"] for h in second] == ["x", "y"]
+    third = await db.query(table_name, [0, 0], k=2, lazy=True, include=())
+    assert not third.loaded and "payload" not in third[0]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from vverb.util.schema import Metric, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def table(db):
+    name = "vv_" + uuid.uuid4().hex[:8]
+    await db.create_collection(
+        TableSchema(table=name, vector=VectorCol("embedding", dim=2, metric=Metric.L2))
+    )
+    await db.upsert(name, [f"p{i}" for i in range(10)], [[float(i), 0.0] for i in range(10)])
+    yield name
+    async with db.raw() as con:
+        await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+async def test_query_many_matches_query(db, table):
+    """Batched search returns the same hits as one query per vector, in order."""
+    vectors = [[9.1, 0.0], [0.2, 0.0], [4.6, 0.0]]
+
+    batched = await db.query_many(table, vectors, k=2)
+    single = [await db.query(table, v, k=2) for v in vectors]
+
+    assert [[h["id"] for h in hits] for hits in batched] == [
+        ["p9", "p8"],
+        ["p0", "p1"],
+        ["p5", "p4"],
+    ]
+    assert [[(h["id"], h["score"]) for h in hits] for hits in batched] == [
+        [(h["id"], h["score"]) for h in hits] for hits in single
+    ]
+
+
+async def test_query_many_empty_batch(db, table):
+    assert await db.query_many(table, [], k=3) == []
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import vverb.sync
+from vverb.util.schema import TableSchema, VectorCol
+
+
+def test_sync_facade_shares_one_pool(pgvector_config: tuple[str, int, int]):
+    """Threads calling the blocking facade are multiplexed onto one pool."""
+    name = "vv_" + uuid.uuid4().hex[:8]
+    url = pgvector_config[0].replace("postgresql://", "pgvector://", 1)
+
+    async def drop(adapter):
+        async with adapter.raw() as con:
+            await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+    with vverb.sync.connect(url, max_pool_size=3, max_in_flight=3) as db:
+        db.create_collection(TableSchema(name, VectorCol("embedding", dim=2)))
+        try:
+            db.upsert(name, ["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+            with ThreadPoolExecutor(16) as threads:
+                hits = list(threads.map(lambda _: db.query(name, [1.0, 0.0], k=1), range(64)))
+            assert all(h[0]["id"] == "a" for h in hits)
+            assert db.stats()["pool"]["size"] <= 3
+        finally:
+            db.run(drop)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import json
+import uuid
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from vverb.memory import connect as connect_memory
+from vverb.pgvector.codec import BinaryCopyReader
+from vverb.util.schema import (
+    FieldCol,
+    FieldType,
+    IndexSpec,
+    Metric,
+    PartitionSpec,
+    TableSchema,
+    VectorCol,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def tables(db):
+    names: list[str] = []
+    yield lambda: names.append("vv_" + uuid.uuid4().hex[:8]) or names[-1]
+    async with db.raw() as con:
+        for name in names:
+            await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+def _schema(name: str, **kw) -> TableSchema:
+    return TableSchema(
+        name,
+        VectorCol("embedding", 3, metric=Metric.L2, index=IndexSpec(m=8)),
+        fields=[
+            FieldCol("tenant", FieldType.STRING),
+            FieldCol("n", FieldType.BIGINT),
+            FieldCol("day", FieldType.DATE),
+            FieldCol("tags", FieldType.JSON),
+            FieldCol("body", FieldType.STRING, full_text="simple"),
+        ],
+        **kw,
+    )
+
+
+def _rows(rows: int) -> tuple[list[str], np.ndarray, list[dict]]:
+    vectors = np.random.default_rng(7).random((rows, 3), dtype=np.float32)
+    metadata = [
+        {
+            "tenant": f"t{i % 3}",
+            "n": i,
+            "day": None,
+            "tags": {"i": i} if i % 2 else None,
+            "body": f"row {i}",
+        }
+        for i in range(rows)
+    ]
+    return [f"r{i}" for i in range(rows)], vectors, metadata
+
+
+async def _fill(db, name: str, rows: int = 1200) -> np.ndarray:
+    ids, vectors, metadata = _rows(rows)
+    await db.upsert(name, ids, vectors, metadata)
+    return vectors
+
+
+async def test_export_then_import(db, tables, tmp_path):
+    source, target = tables(), tables()
+    await db.create_collection(_schema(source))
+    vectors = await _fill(db, source)
+
+    stats = await db.export_collection(source, tmp_path / "dump")
+    assert stats["rows"] == 1200
+    manifest = json.loads((tmp_path / "dump" / "manifest.json").read_text())
+    assert manifest["rows"] == 1200 and manifest["schema"]["vector"]["dim"] == 3
+    dumped = np.load(tmp_path / "dump" / "vectors.npy", mmap_mode="r")
+    assert dumped.shape == (1200, 3) and dumped.dtype == np.float32
+
+    loaded = await db.import_collection(target, tmp_path / "dump", batch_size=500)
+    assert (loaded["rows"], loaded["written"], loaded["batches"]) == (1200, 1200, 3)
+    hits = await db.query(target, vectors[43], k=1)
+    assert (
+        hits[0]["id"] == "r43" and hits[0]["n"] == 43 and json.loads(hits[0]["tags"]) == {"i": 43}
+    )
+    assert np.allclose(hits[0]["embedding"], vectors[43])
+
+    async with db.raw() as con:  # indexes deferred, then built after the load
+        indexes = await con.fetchval(
+            "SELECT count(*) FROM pg_indexes WHERE tablename = $1 AND indexname LIKE '%_idx';",
+            target,
+        )
+    assert indexes == 2
+
+    again = await db.import_collection(target, tmp_path / "dump", if_exists="skip")
+    assert again["written"] == 0
+
+
+async def test_partitioned_round_trip(db, tables, tmp_path):
+    source, target = tables(), tables()
+    await db.create_collection(_schema(source, partition=PartitionSpec("tenant")))
+    await _fill(db, source, rows=30)
+    await db.export_collection(source, tmp_path / "dump")
+
+    await db.import_collection(target, tmp_path / "dump")
+    hits = await db.query(target, [0.0, 0.0, 0.0], k=50, filter={"tenant": "t1"})
+    assert len(hits) == 10 and {h["tenant"] for h in hits} == {"t1"}
+
+
+async def test_content_hash_round_trip(db, tables, tmp_path):
+    source, target = tables(), tables()
+    await db.create_collection(_schema(source, content_hash=True))
+    await _fill(db, source, rows=40)
+    await db.export_collection(source, tmp_path / "dump")
+
+    await db.import_collection(target, tmp_path / "dump")
+    db._schemas.clear()  # describe the imported collection from the catalog
+    assert (await db._schema(target)).content_hash is True
+
+    again = await db.upsert(target, *_rows(40))
+    assert (again["inserted"], again["updated"], again["unchanged"]) == (0, 0, 40)
+
+
+async def test_pgvector_to_memory(db, tables, tmp_path):
+    source = tables()
+    await db.create_collection(_schema(source))
+    vectors = await _fill(db, source, rows=50)
+    await db.export_collection(source, tmp_path / "dump")
+
+    mem = await connect_memory()
+    await mem.import_collection("docs", tmp_path / "dump")
+    (hit,) = await mem.query("docs", vectors[7], k=1)
+    assert (hit["id"], hit["n"], hit["tenant"]) == ("r7", 7, "t1")
+
+
+async def test_import_needs_a_manifest(db, tables, tmp_path):
+    with pytest.raises(ValueError, match="manifest"):
+        await db.import_collection(tables(), tmp_path)
+
+
+async def test_copy_reader_handles_split_chunks():
+    stream = (
+        b"PGCOPY\n\xff\r\n\x00"
+        + (0).to_bytes(4, "big")
+        + (0).to_bytes(4, "big")
+        + (2).to_bytes(2, "big")
+        + (2).to_bytes(4, "big")
+        + b"id"
+        + (-1).to_bytes(4, "big", signed=True)
+        + (1).to_bytes(2, "big")
+        + (3).to_bytes(4, "big")
+        + b"xyz"
+        + (-1).to_bytes(2, "big", signed=True)
+    )
+    reader = BinaryCopyReader()
+    rows = []
+    for i in range(len(stream)):
+        rows += reader.feed(stream[i : i + 1])
+    assert rows == [[b"id", None], [b"xyz"]] and reader.done
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import uuid
+
+import asyncpg
+import pytest
+import pytest_asyncio
+
+from vverb.util.schema import FieldCol, FieldType, Metric, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def table(db):
+    """Fresh collection with a text and a JSON metadata column."""
+    name = "vv_" + uuid.uuid4().hex[:8]
+    await db.create_collection(
+        TableSchema(
+            table=name,
+            vector=VectorCol("embedding", dim=3, metric=Metric.COSINE),
+            fields=[FieldCol("title", FieldType.STRING), FieldCol("meta", FieldType.JSON)],
+        )
+    )
+    yield name
+    async with db.raw() as con:
+        await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+async def test_upsert_bulk_chunks(db, table, monkeypatch):
+    """Rows are chunked at max_batch and all land in the table."""
+    caps = db.capabilities()
+    monkeypatch.setattr(db, "capabilities", lambda: {**caps, "max_batch": 4})
+
+    ids = [f"r{i}" for i in range(10)]
+    vectors = [[float(i), 1.0, 0.0] for i in range(10)]
+    metadata = [{"title": f"t{i}", "meta": {"n": i}} for i in range(10)]
+
+    stats = await db.upsert(table, ids, vectors, metadata)
+
+    assert stats["rows"] == 10 and stats["written"] == 10
+    assert stats["batches"] == 3
+    assert stats["rows_per_sec"] > 0
+    async with db.raw() as con:
+        assert await con.fetchval(f"SELECT count(*) FROM {table};") == 10
+        row = await con.fetchrow(f"SELECT title, meta->>'n' AS n FROM {table} WHERE id = 'r7';")
+        assert (row["title"], row["n"]) == ("t7", "7")
+
+
+async def test_upsert_if_exists_modes(db, table):
+    await db.upsert(table, ["a", "b"], [[1, 0, 0], [0, 1, 0]], [{"title": "x"}, {"title": "y"}])
+
+    # update: last duplicate wins
+    stats = await db.upsert(
+        table, ["a", "a"], [[1, 1, 0], [1, 1, 1]], [{"title": "1"}, {"title": "2"}]
+    )
+    assert stats["written"] == 1
+
+    # skip: existing row untouched, new row inserted
+    stats = await db.upsert(
+        table,
+        ["b", "c"],
+        [[0, 0, 1], [0, 0, 1]],
+        [{"title": "z"}, {"title": "z"}],
+        if_exists="skip",
+    )
+    assert stats["written"] == 1
+
+    async with db.raw() as con:
+        titles = dict(await con.fetch(f"SELECT id, title FROM {table} ORDER BY id;"))
+    assert titles == {"a": "2", "b": "y", "c": "z"}
+
+    with pytest.raises(asyncpg.UniqueViolationError):
+        await db.upsert(table, ["a"], [[1, 0, 0]], if_exists="error")
+
+
+async def test_upsert_rejects_unknown_columns(db, table):
+    with pytest.raises(ValueError):
+        await db.upsert(table, ["a"], [[1, 0, 0]], [{"nope": 1}])
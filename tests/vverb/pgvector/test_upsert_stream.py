@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import uuid
+
+import asyncpg
+import pytest
+import pytest_asyncio
+
+from vverb.util.schema import FieldCol, FieldType, Metric, TableSchema, VectorCol
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def table(db):
+    name = "vv_" + uuid.uuid4().hex[:8]
+    await db.create_collection(
+        TableSchema(
+            table=name,
+            vector=VectorCol("embedding", dim=3, metric=Metric.COSINE),
+            fields=[FieldCol("n", FieldType.INT)],
+        )
+    )
+    yield name
+    async with db.raw() as con:
+        await con.execute(f"DROP TABLE IF EXISTS {name} CASCADE;")
+
+
+async def _rows(count: int):
+    for i in range(count):
+        yield f"r{i}", [1.0, float(i), 0.0], {"n": i}
+
+
+async def test_upsert_stream_batches_in_parallel(db, table):
+    stats = await db.upsert_stream(table, _rows(25), batch_size=4, concurrency=3)
+
+    assert stats["rows"] == stats["written"] == 25
+    assert stats["batches"] == 7
+    assert stats["retries"] == 0
+    async with db.raw() as con:
+        assert await con.fetchval(f"SELECT sum(n) FROM {table};") == sum(range(25))
+
+
+async def test_upsert_stream_propagates_errors(db, table):
+    async def bad_rows():
+        yield "ok", [1.0, 0.0, 0.0]
+        yield "bad", [1.0, 0.0]  # wrong dimension
+
+    with pytest.raises(asyncpg.DataError):
+        await db.upsert_stream(table, bad_rows(), batch_size=1, concurrency=2)
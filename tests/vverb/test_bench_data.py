@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from vverb.bench import exact_knn, make_dataset
+from vverb.util.schema import Metric
+
+
+@pytest.mark.parametrize("metric", [Metric.COSINE, Metric.L2, Metric.INNER_PRODUCT])
+def test_exact_knn_matches_full_sort(metric):
+    data = make_dataset(500, 8, 20, metric=metric, seed=3)
+    got = exact_knn(data.vectors, data.queries, 5, metric, chunk=7)
+
+    for q, row in zip(data.queries, got, strict=True):
+        if metric is Metric.COSINE:
+            dist = 1 - data.vectors @ q / np.linalg.norm(data.vectors, axis=1) / np.linalg.norm(q)
+        elif metric is Metric.L2:
+            dist = np.linalg.norm(data.vectors - q, axis=1)
+        else:
+            dist = -(data.vectors @ q)
+        assert np.allclose(dist[row], np.sort(dist)[:5], atol=1e-5)
+
+
+def test_exact_knn_mask_and_seed():
+    a = make_dataset(300, 4, 10, seed=7)
+    b = make_dataset(300, 4, 10, seed=7)
+    assert np.array_equal(a.vectors, b.vectors) and np.array_equal(a.queries, b.queries)
+
+    mask = a.categories == 2
+    got = exact_knn(a.vectors, a.queries, 4, a.metric, mask=mask)
+    assert got.shape == (10, 4)
+    assert mask[got].all()
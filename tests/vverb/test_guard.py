@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from vverb.base import BaseAdapter
+from vverb.exceptions import CircuitOpenError
+from vverb.guard import AdaptiveLimiter, CircuitBreaker, PoolGuard
+
+
+class _FlakyAdapter(BaseAdapter):
+    """Adapter whose queries fail with ConnectionError while ``failures`` lasts."""
+
+    def __init__(self) -> None:
+        self.failures = 0
+        self.delay = 0.0
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+
+    @classmethod
+    async def connect(cls, **cfg):
+        return cls()
+
+    async def close(self): ...
+
+    async def create_collection(self, schema, *, skip_if_exists=True): ...
+
+    async def upsert(self, name, ids, vectors, metadata=None, *, if_exists="update"):
+        return await self.query(name, vectors[0], 1)  # nested verb
+
+    async def query(self, name, vector, k, filter=None, **kw):
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if vector is None:
+                raise ValueError("bad vector")
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("connection reset")
+            return [{"id": "a"}]
+        finally:
+            self.running -= 1
+
+    async def delete(self, name, ids): ...
+
+    def capabilities(self):
+        return {}
+
+
+def _guard(**kw) -> PoolGuard:
+    return PoolGuard(transient=(ConnectionError,), backoff=0.001, **kw)
+
+
+def test_transient_errors_are_retried():
+    async def run():
+        db = await _FlakyAdapter.connect()
+        db.guard = _guard(retries=2)
+        db.failures = 2
+        assert await db.query("docs", [1.0], k=1) == [{"id": "a"}]
+        assert db.calls == 3
+
+        db.failures = 3
+        with pytest.raises(ConnectionError):
+            await db.query("docs", [1.0], k=1)
+        with pytest.raises(ValueError):  # not transient: no retry
+            await db.query("docs", None, k=1)
+        await db.upsert("docs", ["a"], [[1.0]])  # guarded once, not per nested verb
+        return db
+
+    db = asyncio.run(run())
+    assert db.calls == 3 + 3 + 1 + 1
+    assert db.stats()["guard"]["retries"] == 4 and db.stats()["guard"]["gave_up"] == 1
+
+
+def test_limiter_caps_and_adapts():
+    async def run():
+        db = await _FlakyAdapter.connect()
+        limiter = AdaptiveLimiter(3, tolerance=5.0)
+        db.guard = _guard(limiter=limiter)
+        db.delay = 0.01
+        await asyncio.gather(*(db.query("docs", [1.0], k=1) for _ in range(12)))
+        assert db.peak == 3 and limiter.stats()["queued"] == 9
+
+        db.delay = 0.1  # the backend slows down: halve the limit
+        await db.query("docs", [1.0], k=1)
+        assert limiter.stats()["limit"] == 1 and limiter.stats()["decreases"] == 1
+
+        db.delay, db.peak = 0.0, 0
+        for _ in range(20):  # fast again: grows back, but never past max_limit
+            await db.query("docs", [1.0], k=1)
+        return limiter.stats()
+
+    stats = asyncio.run(run())
+    assert stats["limit"] == 3 and stats["in_flight"] == 0 and stats["waiting"] == 0
+
+
+def test_cancelled_waiter_frees_its_place():
+    async def run():
+        limiter = AdaptiveLimiter(1)
+        await limiter.acquire()
+        doomed = asyncio.ensure_future(limiter.acquire())
+        kept = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        doomed.cancel()
+        limiter.release("query", 0.001)
+        await kept
+        assert limiter.in_flight == 1 and doomed.cancelled()
+
+    asyncio.run(run())
+
+
+def test_breaker_fails_fast_then_probes():
+    async def run():
+        db = await _FlakyAdapter.connect()
+        breaker = CircuitBreaker(threshold=2, reset_timeout=0.05)
+        db.guard = _guard(breaker=breaker, retries=5)
+        db.failures = 10
+        with pytest.raises(ConnectionError):
+            await db.query("docs", [1.0], k=1)  # opens after two attempts, stops retrying
+        assert breaker.state == "open" and db.calls == 2
+
+        with pytest.raises(CircuitOpenError) as err:
+            await db.query("docs", [1.0], k=1)
+        assert 0 < err.value.retry_after <= 0.05 and db.calls == 2
+
+        await asyncio.sleep(0.06)
+        db.failures = 0
+        assert await db.query("docs", [1.0], k=1) == [{"id": "a"}]  # the probe
+        return breaker.stats()
+
+    stats = asyncio.run(run())
+    assert stats == {"state": "closed", "failures": 0, "opened": 1, "rejected": 1}
+
+
+def test_failed_probe_reopens_the_breaker():
+    async def run():
+        db = await _FlakyAdapter.connect()
+        breaker = CircuitBreaker(threshold=1, reset_timeout=0.05)
+        db.guard = _guard(breaker=breaker)
+        db.failures, db.delay = 10, 0.01
+        with pytest.raises(ConnectionError):
+            await db.query("docs", [1.0], k=1)
+        await asyncio.sleep(0.06)
+
+        probe = asyncio.ensure_future(db.query("docs", [1.0], k=1))
+        await asyncio.sleep(0)
+        assert breaker.state == "half_open"
+        with pytest.raises(CircuitOpenError):  # one probe at a time
+            await db.query("docs", [1.0], k=1)
+        with pytest.raises(ConnectionError):
+            await probe
+        assert breaker.state == "open" and db.calls == 2
+        return breaker.stats()
+
+    stats = asyncio.run(run())
+    assert stats["opened"] == 2 and stats["rejected"] == 1
+
+
+def test_guard_arguments_are_checked():
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(2, min_limit=3)
+    with pytest.raises(ValueError):
+        CircuitBreaker(threshold=0)
+    with pytest.raises(ValueError):
+        _guard(retries=-1)
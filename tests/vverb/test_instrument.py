@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from vverb.base import BaseAdapter
+from vverb.instrument import Histogram, Instrumentation, current_span
+
+
+class _EchoAdapter(BaseAdapter):
+    """Minimal adapter: instrumentation must come for free from BaseAdapter."""
+
+    @classmethod
+    async def connect(cls, **cfg):
+        return cls()
+
+    async def close(self): ...
+
+    async def create_collection(self, schema, *, skip_if_exists=True): ...
+
+    async def upsert(self, name, ids, vectors, metadata=None, *, if_exists="update"):
+        current_span().nbytes += 12
+
+    async def query(self, name, vector, k, filter=None, **kw):
+        if vector is None:
+            raise ValueError("boom")
+        return [{"id": str(i)} for i in range(k)]
+
+    async def delete(self, name, ids): ...
+
+    def capabilities(self):
+        return {}
+
+
+def test_histogram_percentiles():
+    hist = Histogram()
+    for ms in range(1, 101):
+        hist.observe(ms / 1000)
+    snap = hist.snapshot()
+    assert snap["count"] == 100 and snap["max"] == pytest.approx(0.1)
+    assert snap["p50"] <= snap["p95"] <= snap["p99"] <= snap["max"]
+    assert 0.04 <= snap["p50"] <= 0.1
+
+
+def test_verbs_are_instrumented_for_free():
+    events = []
+
+    async def run():
+        db = await _EchoAdapter.connect(instrumentation=Instrumentation(hooks=[events.append]))
+        await db.upsert("docs", ["a", "b"], [[1.0], [2.0]])
+        await db.query("docs", [1.0], k=3)
+        with pytest.raises(ValueError):
+            await db.query("docs", None, k=1)
+        return db.stats()["verbs"]
+
+    verbs = asyncio.run(run())
+    assert verbs["connect"]["calls"] == 1
+    assert verbs["upsert"]["rows"] == 2 and verbs["upsert"]["bytes"] == 12
+    assert verbs["query"]["calls"] == 2 and verbs["query"]["errors"] == 1
+    assert verbs["query"]["rows"] == 3
+    assert [e["verb"] for e in events] == ["connect", "upsert", "query", "query"]
+    assert events[1]["name"] == "docs"
+
+
+def test_disabled_instrumentation_records_nothing():
+    async def run():
+        db = await _EchoAdapter.connect()
+        await db.query("docs", [1.0], k=1)
+        return db.stats()
+
+    assert asyncio.run(run()) == {"verbs": {}}
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+
+from vverb.cache import MISS, QueryCache
+
+
+def _key(cache: QueryCache, name: str = "docs", vector=(1.0, 2.0), k: int = 3):
+    return cache.key(name, list(vector), k, {"lang": "en"}, {"ef_search": 40})
+
+
+def test_hit_miss_and_key_canonicalisation():
+    cache = QueryCache()
+    key = _key(cache)
+    assert cache.get(key) is MISS
+    cache.put(key, [{"id": "a"}])
+
+    same = cache.key("docs", [1.0, 2.0], 3, {"lang": "en"}, {"ef_search": 40})
+    assert cache.get(same) == [{"id": "a"}]
+    assert cache.get(_key(cache, k=4)) is MISS
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+
+def test_lru_eviction_by_entry_count():
+    cache = QueryCache(max_entries=2)
+    a, b, c = (_key(cache, vector=(float(i), 0.0)) for i in range(3))
+    cache.put(a, ["a"])
+    cache.put(b, ["b"])
+    cache.get(a)  # a becomes most recently used
+    cache.put(c, ["c"])
+
+    assert cache.get(b) is MISS
+    assert cache.get(a) == ["a"] and cache.get(c) == ["c"]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    cache = QueryCache(ttl=0.01)
+    key = _key(cache)
+    cache.put(key, ["a"])
+    time.sleep(0.02)
+    assert cache.get(key) is MISS
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalidate_is_per_collection_and_blocks_stale_puts():
+    cache = QueryCache()
+    docs, other = _key(cache), _key(cache, name="other")
+    cache.put(docs, ["a"])
+    cache.put(other, ["b"])
+
+    generation = cache.generation("docs")
+    cache.invalidate("docs")
+    assert cache.get(docs) is MISS and cache.get(other) == ["b"]
+
+    cache.put(docs, ["stale"], generation=generation)  # computed before the write
+    assert cache.get(docs) is MISS
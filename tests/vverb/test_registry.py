@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import vverb
+from vverb import mapping
+from vverb.mapping import load_adapter, register_adapter
+
+pytestmark = pytest.mark.asyncio
+
+# modules a cold `import vverb` / `import vverb.pgvector` must not pull in
+_HEAVY = ("asyncpg", "numpy", "vverb.pgvector.core", "vverb.memory.core", "vverb.base")
+
+
+def _imported_after(code: str) -> list[str]:
+    """Heavy modules loaded by running *code* in a fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(vverb.__file__).parents[1])},
+    ).stdout.split()
+    return [m for m in _HEAVY if m in out]
+
+
+async def test_import_loads_no_adapter_or_driver():
+    assert _imported_after("import vverb, vverb.pgvector, vverb.mapping") == []
+    assert "asyncpg" in _imported_after("import vverb\nvverb.load_adapter('pgvector')")
+    assert "asyncpg" in _imported_after("from vverb.pgvector import connect")
+
+
+async def test_connect_by_url():
+    db = await vverb.connect("memory://")
+    assert type(db).__name__ == "MemoryAdapter"
+    await db.close()
+
+    with pytest.raises(ValueError, match="known"):
+        await vverb.connect("nosuchdb://localhost")
+    with pytest.raises(ValueError, match="://"):
+        await vverb.connect("localhost:5432")
+
+
+async def test_register_adapter(monkeypatch):
+    # private copies of the registry, restored after the test
+    monkeypatch.setattr(mapping, "ADAPTERS", dict(mapping.ADAPTERS))
+    monkeypatch.setattr(mapping, "_loaded", dict(mapping._loaded))
+    memory = load_adapter("memory")
+    register_adapter("scratch", memory)
+    assert load_adapter("scratch") is memory
+    register_adapter("scratch", "vverb.memory.core:MemoryAdapter")
+    assert load_adapter("scratch") is memory
+    assert "scratch" in mapping.ADAPTERS and "scratch" in mapping._loaded
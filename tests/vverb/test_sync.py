@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from vverb.memory import MemoryAdapter
+from vverb.sync import connect
+from vverb.util.schema import FieldCol, FieldType, TableSchema, VectorCol
+
+
+def _schema() -> TableSchema:
+    return TableSchema("docs", VectorCol("embedding", dim=2), fields=[FieldCol("n", FieldType.INT)])
+
+
+def test_blocking_verbs_and_futures():
+    with connect("memory://") as db:
+        db.create_collection(_schema())
+        db.upsert("docs", ["a", "b"], [[1.0, 0.0], [0.0, 1.0]], [{"n": 1}, {"n": 2}])
+
+        assert [h["id"] for h in db.query("docs", [1.0, 0.1], k=1)] == ["a"]
+        fut = db.query_many_future("docs", [[1.0, 0.0], [0.0, 1.0]], k=1)
+        assert isinstance(fut, Future)
+        assert [[h["id"] for h in hits] for hits in fut.result()] == [["a"], ["b"]]
+
+        assert db.delete_future("docs", ["a"]).result() == 1
+        assert db.delete_where("docs", {"n": 2}) == 1
+        assert db.query("docs", [1.0, 0.0], k=5) == []
+        assert db.capabilities()["filter"] is True
+
+    with pytest.raises(RuntimeError, match="closed"):
+        db.query("docs", [1.0, 0.0], k=1)
+
+
+def test_threads_share_one_adapter_and_loop():
+    with connect(MemoryAdapter) as db:
+        db.create_collection(_schema())
+
+        def work(i: int) -> str:
+            db.upsert("docs", [f"t{i}"], [[float(i), 1.0]])
+            return db.query("docs", [float(i), 1.0], k=1)[0]["id"]
+
+        with ThreadPoolExecutor(8) as pool:
+            assert list(pool.map(work, range(32))) == [f"t{i}" for i in range(32)]
+        assert len(db.query("docs", [0.0, 0.0], k=100)) == 32
+
+
+def test_max_in_flight_caps_concurrency():
+    with connect("memory://", max_in_flight=2) as db:
+        running = peak = 0
+
+        async def slow(*args, **kw):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+
+        db.adapter.query = slow  # type: ignore[method-assign]
+        futures = [db.query_future("docs", [0.0], k=1) for _ in range(10)]
+        assert [f.result() for f in futures] == [[]] * 10
+        assert peak == 2
+
+
+def test_errors_and_timeouts_propagate():
+    with connect("memory://", timeout=0.05) as db:
+        with pytest.raises(ValueError, match="Unknown collection"):
+            db.query("missing", [0.0], k=1)
+
+        gate = threading.Event()
+
+        async def stuck(*args, **kw):
+            while not gate.is_set():
+                await asyncio.sleep(0.01)
+
+        db.adapter.query = stuck  # type: ignore[method-assign]
+        with pytest.raises(TimeoutError):
+            db.query("docs", [0.0], k=1)
+        gate.set()
+
+    with pytest.raises(ValueError):
+        connect("memory://", max_in_flight=0)